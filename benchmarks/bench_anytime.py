@@ -0,0 +1,66 @@
+"""
+Benchmark: anytime solving of XVSelector's MILP.
+
+On randomized pools, compares the full MILP (CBC and HiGHS) with the quick 'round' backend
+and with HiGHS under a time limit, reporting median wall time, the median relative gap
+reported (from the best bound), the worst loss against the optimum and the number of pools
+where a solution was found.
+
+Run from the repository root:
+    python -m benchmarks.bench_anytime
+"""
+
+import time
+
+import numpy as np
+import pulp
+
+from benchmarks.pools import make_pool
+from lionel.selector.fpl.xv_selector import XVSelector
+
+SIZES = [700, 1500]
+SEEDS = 5
+CONFIGS = [
+    ("cbc", None),
+    ("highs", None),
+    ("highs", 0.1),
+    ("round", None),
+]
+
+
+def run(df, backend, time_limit):
+    """(wall time, objective or None without a solution, reported gap) of one MILP select."""
+    selector = XVSelector(df.copy(), budget=1000, backend=backend)
+    selector.set_solve_options(time_limit=time_limit)
+    start = time.perf_counter()
+    selector.select()
+    seconds = time.perf_counter() - start
+    if selector.problem.status != pulp.LpStatusOptimal:
+        return seconds, None, None
+    return seconds, selector.objective_value, selector.stats.gap or 0.0
+
+
+def main():
+    print(f"{'players':>8} {'backend':>8} {'limit':>6} {'median':>8} {'max':>8} {'gap':>7} {'loss':>7} {'found':>6}")
+    for n in SIZES:
+        pools = [make_pool(n, seed=seed) for seed in range(SEEDS)]
+        optima = []
+        for df in pools:
+            selector = XVSelector(df.copy(), budget=1000)
+            selector.select()
+            optima.append(selector.objective_value)
+        for backend, time_limit in CONFIGS:
+            runs = [run(df, backend, time_limit) for df in pools]
+            seconds = [t for t, _, _ in runs]
+            # Pools where a solution was found within the limit
+            found = [(optimum, objective, gap) for optimum, (_, objective, gap) in zip(optima, runs) if objective]
+            gap = np.median([g for _, _, g in found]) if found else np.nan
+            loss = max(((optimum - objective) / optimum for optimum, objective, _ in found), default=np.nan)
+            print(
+                f"{n:>8} {backend:>8} {str(time_limit):>6} {np.median(seconds) * 1e3:>6.0f}ms "
+                f"{max(seconds) * 1e3:>6.0f}ms {gap:>7.2%} {loss:>7.2%} {len(found):>3}/{len(runs)}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Benchmark: budget frontier vs a new XVSelector per budget.
+
+Computes the best objective at every integer budget from 800 to 1000 on a randomized pool,
+(a) with `budget_frontier` and (b) by constructing and solving an XVSelector per budget,
+each with `exact=True` (branch and bound) and with the default MILP. Checks both
+give the same objective at every budget.
+
+Run from the repository root:
+    python -m benchmarks.bench_budget_frontier
+"""
+
+import time
+
+from benchmarks.pools import make_pool
+from lionel.selector.fpl.xv_selector import XVSelector
+
+N_PLAYERS = 700
+MIN_BUDGET, MAX_BUDGET = 800, 1000
+
+
+def per_budget(df, exact):
+    """Objective at each budget from a new selector per budget."""
+    objectives = {}
+    for budget in range(MIN_BUDGET, MAX_BUDGET + 1):
+        selector = XVSelector(df.copy(), budget=budget, exact=exact)
+        selector.select()
+        objectives[budget] = selector.objective_value
+    return objectives
+
+
+def main():
+    df = make_pool(N_PLAYERS, seed=0)
+    print(f"{'exact':>6} {'method':>11} {'seconds':>8} {'solves':>7}")
+    for exact in (True, False):
+        start = time.perf_counter()
+        frontier = XVSelector(df.copy(), exact=exact).budget_frontier(MIN_BUDGET, MAX_BUDGET)
+        sweep = time.perf_counter() - start
+        start = time.perf_counter()
+        objectives = per_budget(df, exact)
+        brute = time.perf_counter() - start
+        for budget, objective in objectives.items():
+            expected = frontier.loc[frontier["budget"] <= budget, "objective"].iloc[-1]
+            assert abs(objective - expected) < 1e-6, budget
+        print(f"{str(exact):>6} {'frontier':>11} {sweep:>8.2f} {frontier.attrs['solves']:>7}")
+        print(f"{str(exact):>6} {'per budget':>11} {brute:>8.2f} {len(objectives):>7}")
+    print(f"{len(frontier)} breakpoints")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark: transfer recommendations for many users, bulk vs one UpdateXVSelector per user.
+
+Squads are picked on perturbed predictions so that they are valid and differ between
+users. The bulk path builds one BulkUpdateXVSelector per worker and switches squads in
+place; the loop copies the pool and builds an UpdateXVSelector per user.
+
+Run from the repository root:
+    python -m benchmarks.bench_bulk_update --users 50 --backend highs
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from benchmarks.pools import make_pool
+from lionel.selector.fpl.bulk_update import update_squads
+from lionel.selector.fpl.update_xv_selector import UpdateXVSelector
+from lionel.selector.fpl.xv_selector import XVSelector
+
+
+def user_squads(df, n_users, seed=0):
+    """(n_users, 15) row positions of squads optimal for perturbed predictions."""
+    rng = np.random.default_rng(seed)
+    squads = []
+    for _ in range(n_users):
+        points = df["predicted_points"] * rng.uniform(0.5, 1.5, len(df))
+        selector = XVSelector(df.assign(predicted_points=points), budget=1000)
+        selector.select()
+        squads.append(np.flatnonzero(selector.candidate_df["xv"] == 1))
+    return np.array(squads)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=700)
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--backend", default=None)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4])
+    args = parser.parse_args()
+
+    df = make_pool(args.players, seed=1)
+    squads = user_squads(df, args.users)
+    free_transfers = np.random.default_rng(1).integers(1, 3, args.users)
+
+    start = time.perf_counter()
+    expected = []
+    for squad, max_transfers in zip(squads, free_transfers):
+        xv = np.zeros(len(df), dtype=int)
+        xv[squad] = 1
+        selector = UpdateXVSelector(df.assign(xv=xv), max_transfers=int(max_transfers), backend=args.backend)
+        selector.select()
+        expected.append(selector.objective_value)
+    loop = time.perf_counter() - start
+    print(f"loop of UpdateXVSelector: {loop:.2f}s ({loop / args.users * 1e3:.0f}ms per user)")
+
+    for n_workers in args.workers:
+        start = time.perf_counter()
+        recs = update_squads(df, squads, 1000, free_transfers, n_workers=n_workers, backend=args.backend)
+        bulk = time.perf_counter() - start
+        assert np.allclose(recs["objective"], expected)
+        print(f"update_squads, {n_workers} workers: {bulk:.2f}s ({bulk / args.users * 1e3:.0f}ms per user)")
+
+
+if __name__ == "__main__":
+    main()
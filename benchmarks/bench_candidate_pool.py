@@ -0,0 +1,69 @@
+"""
+Benchmark: one shared CandidatePool vs a copied frame per selector.
+
+Solves an XVSelector and an XISelector (on the chosen squad) for a range of budgets on a
+randomized pool, (a) copying the frame for each selector as callers of frame selectors
+do, and (b) sharing one CandidatePool built once. Checks both choose the same squads and
+reports the time per selection and the bytes copied per selector.
+
+Run from the repository root:
+    python -m benchmarks.bench_candidate_pool
+"""
+
+import time
+
+import numpy as np
+
+from benchmarks.pools import make_pool
+from lionel.selector.core.pool import CandidatePool
+from lionel.selector.fpl.xi_selector import XISelector
+from lionel.selector.fpl.xv_selector import XVSelector
+
+N_PLAYERS = 700
+BUDGETS = range(900, 1001, 5)
+
+
+def with_frames(df):
+    """Squad masks, copying the frame for every selector."""
+    squads = []
+    for budget in BUDGETS:
+        selected = XVSelector(df.copy(), budget=budget).select()
+        squad_df = selected[selected["xv"] == 1].copy()
+        XISelector(squad_df).select()
+        squads.append(selected["xv"].to_numpy() == 1)
+    return squads
+
+
+def with_pool(pool):
+    """Squad masks, every selector sharing `pool` (the XI from a pool of the squad's rows)."""
+    squads = []
+    for budget in BUDGETS:
+        selection = XVSelector(pool, budget=budget).select()
+        XISelector(pool.take(selection.positions)).select()
+        squads.append(selection.mask)
+    return squads
+
+
+def main():
+    df = make_pool(N_PLAYERS, seed=0)
+    start = time.perf_counter()
+    pool = CandidatePool.from_frame(df)
+    built = time.perf_counter() - start
+
+    start = time.perf_counter()
+    frame_squads = with_frames(df)
+    frames = time.perf_counter() - start
+    start = time.perf_counter()
+    pool_squads = with_pool(pool)
+    pooled = time.perf_counter() - start
+    assert all(np.array_equal(a, b) for a, b in zip(frame_squads, pool_squads))
+
+    frame_bytes = df.memory_usage(deep=True).sum()
+    print(f"pool built once in {built * 1e3:.1f} ms")
+    print(f"{'method':>7} {'ms/selection':>13} {'copied bytes':>15}")
+    print(f"{'frames':>7} {frames / len(BUDGETS) * 1e3:>13.2f} {frame_bytes:>15}")
+    print(f"{'pool':>7} {pooled / len(BUDGETS) * 1e3:>13.2f} {0:>15}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Benchmark: end-to-end time of a 38-gameweek ChipPlanner plan.
+
+Reports the time to run every sub-solve and the dynamic program, the number of
+distinct sub-solves, and the time to re-plan from the cache with fewer chips.
+
+Run from the repository root:
+    python -m benchmarks.bench_chip_planner
+"""
+
+import os
+import time
+
+import numpy as np
+
+from benchmarks.bench_selector_build import with_existing_squad
+from benchmarks.pools import make_pool
+from lionel.selector.fpl.chip_planner import ChipPlanner
+
+N_PLAYERS = 700
+N_GAMEWEEKS = 38
+
+
+def main():
+    df = with_existing_squad(make_pool(N_PLAYERS, seed=5))
+    rng = np.random.default_rng(0)
+    pred_vars = [f"points_gw{t + 1}" for t in range(N_GAMEWEEKS)]
+    for col in pred_vars:
+        df[col] = np.clip(df["predicted_points"] + rng.normal(0, 2, N_PLAYERS), 0, None)
+
+    planner = ChipPlanner(df, pred_vars)
+    start = time.perf_counter()
+    plan = planner.plan()
+    elapsed = time.perf_counter() - start
+    print(f"{N_GAMEWEEKS} gameweeks, {N_PLAYERS} players, {planner.n_workers} of {os.cpu_count()} workers")
+    print(f"plan: {elapsed:.1f}s ({len(planner.squads)} sub-solves)")
+
+    start = time.perf_counter()
+    planner.plan(["bench_boost", "triple_captain"])
+    print(f"re-plan from cache: {(time.perf_counter() - start) * 1e3:.0f}ms")
+    print(plan[plan["chip"].notna()])
+
+
+if __name__ == "__main__":
+    main()
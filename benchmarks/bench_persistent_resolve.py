@@ -0,0 +1,59 @@
+"""
+Benchmark: re-solving a persistent UpdateXVSelector versus rebuilding it.
+
+Each iteration perturbs predicted points and the transfer limit, then either
+constructs a new selector (rebuild) or updates the existing one in place and
+warm-starts from the previous incumbent (persistent).
+
+Run from the repository root:
+    python -m benchmarks.bench_persistent_resolve
+"""
+
+import statistics
+import time
+
+import numpy as np
+
+from benchmarks.bench_selector_build import with_existing_squad
+from benchmarks.pools import make_pool
+from lionel.selector.fpl.update_xv_selector import UpdateXVSelector
+
+N_PLAYERS = 700
+ITERATIONS = 20
+
+
+def main():
+    df = with_existing_squad(make_pool(N_PLAYERS, seed=1))
+    rng = np.random.default_rng(1)
+    scenarios = [
+        (df["predicted_points"].to_numpy() + rng.normal(0, 1, N_PLAYERS), int(rng.integers(1, 4)))
+        for _ in range(ITERATIONS)
+    ]
+
+    print(f"{'backend':>8} {'rebuild':>10} {'persistent':>11}")
+    for backend in ["cbc", "highs"]:
+        rebuild = []
+        for points, max_transfers in scenarios:
+            start = time.perf_counter()
+            selector = UpdateXVSelector(
+                df.assign(predicted_points=points), max_transfers=max_transfers, backend=backend
+            )
+            selector.select()
+            rebuild.append(time.perf_counter() - start)
+
+        persistent = []
+        selector = UpdateXVSelector(df.copy(), backend=backend)
+        selector.select(warm_start=True)
+        for points, max_transfers in scenarios:
+            start = time.perf_counter()
+            selector.set_predictions(points)
+            selector.set_max_transfers(max_transfers)
+            selector.select(warm_start=True)
+            persistent.append(time.perf_counter() - start)
+
+        rebuild_ms, persistent_ms = statistics.median(rebuild) * 1e3, statistics.median(persistent) * 1e3
+        print(f"{backend:>8} {rebuild_ms:>8.1f}ms {persistent_ms:>9.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Benchmark: dominance pruning for XVSelector.
+
+Reports how many candidates pruning removes and the select() time with and
+without it on synthetic pools and tests/data/candidates_xv.json.
+
+Run from the repository root:
+    python -m benchmarks.bench_pruning
+"""
+
+import json
+import statistics
+import time
+from pathlib import Path
+
+import pandas as pd
+import pulp
+
+from benchmarks.pools import make_pool
+from lionel.selector.fpl.xv_selector import XVSelector
+
+DATA = Path(__file__).parents[1] / "tests" / "data" / "candidates_xv.json"
+REPEATS = 5
+
+
+def time_select(df, **kwargs):
+    """Median select() time including construction (and pruning), plus the last selector."""
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        selector = XVSelector(df.copy(), **kwargs)
+        selector.select()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), selector
+
+
+def main():
+    with open(DATA) as f:
+        pools = {"candidates_xv.json": pd.DataFrame(json.load(f))}
+    for n_players in [700, 5_000]:
+        pools[f"synthetic {n_players}"] = make_pool(n_players, seed=n_players)
+
+    print(f"{'pool':>20} {'players':>8} {'pruned':>7} {'full':>9} {'pruned':>9} {'speedup':>8}")
+    for name, df in pools.items():
+        full_time, full = time_select(df)
+        pruned_time, pruned = time_select(df, prune=True)
+        assert abs(pulp.value(full.problem.objective) - pulp.value(pruned.problem.objective)) < 1e-6
+        print(
+            f"{name:>20} {len(df):>8} {pruned.n_pruned:>7} {full_time * 1e3:>7.1f}ms "
+            f"{pruned_time * 1e3:>7.1f}ms {full_time / pruned_time:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
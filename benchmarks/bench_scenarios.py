@@ -0,0 +1,40 @@
+"""
+Benchmark: scenario throughput of solve_scenarios versus number of workers.
+
+Solves XVSelector for synthetic posterior draws on a 700-player pool and reports
+scenarios/second for each worker count (capped at os.cpu_count()).
+
+Run from the repository root:
+    python -m benchmarks.bench_scenarios
+"""
+
+import os
+import time
+
+import numpy as np
+
+from benchmarks.pools import make_pool
+from lionel.selector.core.scenarios import solve_scenarios
+from lionel.selector.fpl.xv_selector import XVSelector
+
+N_PLAYERS = 700
+N_DRAWS = 1_000
+N_SCENARIOS = 64
+WORKERS = [1, 2, 4, 8]
+
+
+def main():
+    df = make_pool(N_PLAYERS, seed=2)
+    rng = np.random.default_rng(2)
+    draws = df["predicted_points"].to_numpy()[:, None] + rng.normal(0, 2, (N_PLAYERS, N_DRAWS))
+
+    print(f"{'workers':>8} {'seconds':>8} {'scen/s':>8}")
+    for n_workers in [w for w in WORKERS if w <= (os.cpu_count() or 1)] or [1]:
+        start = time.perf_counter()
+        solve_scenarios(XVSelector, df, draws, n_scenarios=N_SCENARIOS, n_workers=n_workers, seed=0, backend="highs")
+        elapsed = time.perf_counter() - start
+        print(f"{n_workers:>8} {elapsed:>8.2f} {N_SCENARIOS / elapsed:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
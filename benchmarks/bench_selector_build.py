@@ -0,0 +1,53 @@
+"""
+Benchmark: problem construction time for XVSelector, XISelector and UpdateXVSelector.
+
+Times `selector.build()` (objective + constraints, no solve) on synthetic pools.
+
+Run from the repository root:
+    python -m benchmarks.bench_selector_build
+"""
+
+import time
+
+from benchmarks.pools import make_pool
+from lionel.selector.fpl.update_xv_selector import UpdateXVSelector
+from lionel.selector.fpl.xi_selector import XISelector
+from lionel.selector.fpl.xv_selector import XVSelector
+
+POOL_SIZES = [700, 5_000, 50_000]
+REPEATS = 3
+
+
+def time_build(make_selector, repeats=REPEATS):
+    """Best-of-`repeats` wall time for constructing a selector and building its problem."""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        make_selector().build()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def with_existing_squad(df):
+    """Mark a feasible-looking 15 (cheapest players per position) as the current squad."""
+    df = df.copy()
+    df["xv"] = 0
+    for pos, count in XVSelector.POS_CONSTRAINTS.items():
+        cheapest = df[df["position"] == pos].nsmallest(count, "price").index
+        df.loc[cheapest, "xv"] = 1
+    return df
+
+
+def main():
+    print(f"{'players':>8} {'XVSelector':>12} {'XISelector':>12} {'UpdateXV':>12}")
+    for n_players in POOL_SIZES:
+        df = make_pool(n_players, seed=n_players)
+        df_update = with_existing_squad(df)
+        xv = time_build(lambda: XVSelector(df, budget=1000))
+        xi = time_build(lambda: XISelector(df))
+        update = time_build(lambda: UpdateXVSelector(df_update, max_transfers=2, budget=1000))
+        print(f"{n_players:>8} {xv * 1e3:>10.1f}ms {xi * 1e3:>10.1f}ms {update * 1e3:>10.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
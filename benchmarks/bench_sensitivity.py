@@ -0,0 +1,84 @@
+"""
+Benchmark: points sensitivity vs brute-force re-selection.
+
+For a sample of players, brute force bisects each player's points threshold with a fresh
+`XVSelector.select()` per step (to 0.01 points within +/-10 points of their prediction).
+`sensitivity()` computes thresholds for every player from LP reduced costs and re-solves of
+the built problem. Reports wall time per player and checks the sampled thresholds agree.
+
+Run from the repository root:
+    python -m benchmarks.bench_sensitivity
+"""
+
+import time
+
+import numpy as np
+
+from benchmarks.pools import make_pool
+from lionel.selector.fpl.xv_selector import XVSelector
+
+SIZES = [200, 700]
+SAMPLE = 10
+RANGE = 10.0
+PRECISION = 0.01
+
+
+def squad(df, i, points):
+    """The optimal squad with player i's points set to `points`."""
+    df = df.copy()
+    df.iloc[i, df.columns.get_loc("predicted_points")] = points
+    selector = XVSelector(df, budget=1000)
+    selector.select()
+    return selector.candidate_df["xv"].to_numpy()
+
+
+def bisect(df, i, base):
+    """Points threshold of player i by bisection, or nan if outside +/-RANGE. Returns (threshold, selects)."""
+    points = df["predicted_points"].iat[i]
+    direction = -1.0 if base[i] else 1.0
+    near, far, selects = points, points + direction * RANGE, 1
+    if (squad(df, i, far) == base).all():
+        return np.nan, selects
+    while abs(far - near) > PRECISION:
+        middle = (near + far) / 2
+        selects += 1
+        if (squad(df, i, middle) == base).all():
+            near = middle
+        else:
+            far = middle
+    return (near + far) / 2, selects
+
+
+def main():
+    print(f"{'players':>8} {'brute/player':>13} {'selects':>8} {'sens/player':>12} {'within=2':>9} {'max error':>10}")
+    for n in SIZES:
+        rng = np.random.default_rng(0)
+        df = make_pool(n, seed=0)
+        df["predicted_points"] += rng.uniform(0, 0.01, size=n)
+        selector = XVSelector(df.copy(), budget=1000)
+        selector.select()
+        base = selector.candidate_df["xv"].to_numpy().copy()
+
+        start = time.perf_counter()
+        sens = selector.sensitivity()
+        per_player = (time.perf_counter() - start) / n
+        start = time.perf_counter()
+        selector.sensitivity(within=2)
+        screened = (time.perf_counter() - start) / n
+
+        sample = rng.choice(n, SAMPLE, replace=False)
+        start, selects, error = time.perf_counter(), 0, 0.0
+        for i in sample:
+            threshold, count = bisect(df, i, base)
+            selects += count
+            if np.isfinite(threshold):
+                error = max(error, abs(threshold - sens["threshold"].iat[i]))
+        brute = (time.perf_counter() - start) / SAMPLE
+        print(
+            f"{n:>8} {brute * 1e3:>11.0f}ms {selects / SAMPLE:>8.1f} {per_player * 1e3:>10.1f}ms "
+            f"{screened * 1e3:>7.1f}ms {error:>10.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Load generator for SelectionService.
+
+Fires `--requests` XVSelector jobs on 700-player pools from `--concurrency` concurrent
+clients and reports latency percentiles, throughput and the worst event-loop stall
+(how late a 10ms heartbeat task woke up), for a thread and a process pool. Calling
+`select()` directly from the event loop is included for comparison.
+
+Run from the repository root:
+    python -m benchmarks.bench_service --requests 200 --concurrency 1 8 32
+"""
+
+import argparse
+import asyncio
+import time
+
+import numpy as np
+
+from benchmarks.pools import make_pool
+from lionel.selector.core.service import SelectionService
+from lionel.selector.fpl.xv_selector import XVSelector
+
+HEARTBEAT = 0.01
+N_POOLS = 8
+
+
+async def heartbeat(stop: asyncio.Event, lags: list):
+    """Records how late each HEARTBEAT sleep wakes up."""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(HEARTBEAT)
+        lags.append(time.perf_counter() - start - HEARTBEAT)
+
+
+async def load(submit, pools, n_requests, concurrency):
+    """Runs n_requests jobs from `concurrency` clients; returns latencies, wall time and loop lags."""
+    latencies, lags, stop = [], [], asyncio.Event()
+    requests = iter(range(n_requests))
+
+    async def client():
+        for i in requests:
+            start = time.perf_counter()
+            await submit(pools[i % len(pools)])
+            latencies.append(time.perf_counter() - start)
+
+    beat = asyncio.create_task(heartbeat(stop, lags))
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    wall = time.perf_counter() - start
+    stop.set()
+    await beat
+    return np.array(latencies), wall, max(lags, default=0.0)
+
+
+async def run(args):
+    pools = [make_pool(700, seed=seed) for seed in range(N_POOLS)]
+    print(f"{'mode':>8} {'clients':>8} {'p50':>8} {'p99':>8} {'req/s':>7} {'max stall':>10}")
+
+    async def blocking(df):
+        return XVSelector(df.copy(), budget=1000).select()
+
+    modes = [("inline", None)] + [(kind, kind) for kind in args.executors]
+    for mode, executor in modes:
+        for concurrency in args.concurrency:
+            service = None
+            submit = blocking
+            if executor is not None:
+                service = SelectionService(max_workers=args.workers, max_queue=args.max_queue, executor=executor)
+                submit = lambda df: service.select(XVSelector, df, budget=1000)  # noqa: E731
+            latencies, wall, stall = await load(submit, pools, args.requests, concurrency)
+            if service is not None:
+                service.close()
+            p50, p99 = np.percentile(latencies, [50, 99]) * 1e3
+            print(
+                f"{mode:>8} {concurrency:>8} {p50:>6.0f}ms {p99:>6.0f}ms "
+                f"{len(latencies) / wall:>7.1f} {stall * 1e3:>8.0f}ms"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--max-queue", type=int, default=64)
+    parser.add_argument("--executors", nargs="+", default=["thread", "process"], choices=["thread", "process"])
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Benchmark: per-backend solve latency for XVSelector on tests/data/candidates_xv.json.
+
+Reports the median wall time of `select()` (build + solve + read back) per backend.
+Backends whose optional dependency is missing are skipped.
+
+Run from the repository root:
+    python -m benchmarks.bench_solver_backends
+"""
+
+import json
+import statistics
+import time
+from pathlib import Path
+
+import pandas as pd
+import pulp
+
+from lionel.selector.core.solvers import BACKENDS
+from lionel.selector.fpl.xv_selector import XVSelector
+
+DATA = Path(__file__).parents[1] / "tests" / "data" / "candidates_xv.json"
+REPEATS = 20
+
+
+def main():
+    with open(DATA) as f:
+        candidate_df = pd.DataFrame(json.load(f))
+
+    print(f"{'backend':>8} {'median':>10} {'min':>10} {'objective':>10}")
+    for name in BACKENDS:
+        timings = []
+        try:
+            for _ in range(REPEATS):
+                selector = XVSelector(candidate_df.copy(), backend=name)
+                start = time.perf_counter()
+                selector.select()
+                timings.append(time.perf_counter() - start)
+        except ImportError as e:
+            print(f"{name:>8} skipped ({e})")
+            continue
+        objective = pulp.value(selector.problem.objective)
+        print(f"{name:>8} {statistics.median(timings) * 1e3:>8.1f}ms {min(timings) * 1e3:>8.1f}ms {objective:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
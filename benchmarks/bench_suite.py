@@ -0,0 +1,228 @@
+"""
+Benchmark suite: build time, solve time and peak memory of selectors on synthetic pools,
+compared against a stored baseline.
+
+Cases cover XVSelector, XISelector and UpdateXVSelector (each also with `exact=True`) and two
+custom BaseSelector setups (one built with the bulk expression helpers, one with plain
+`pulp.lpSum` constraints as in `examples/selector/example_custom_constraints.py`), on seeded
+pools of 100 to 50,000 players.
+
+For each case:
+    - build_s: constructing the selector and building its problem
+    - solve_s: `select()` on the built problem (write, solver run, read back)
+    - select_s: `select()` on a new selector that has not been built, as callers use it. This
+      includes the build, or takes the selector's in-process exact solver without one
+      (the `exact=True` formation enumeration, branch and bound or transfer enumeration)
+    - peak_mb: peak Python heap during construction and build (tracemalloc). The solver's own
+      memory (the CBC subprocess, HiGHS internals) is not visible to tracemalloc.
+    - objective: the optimal objective, so a change in results is caught too
+
+Run from the repository root:
+    python -m benchmarks.bench_suite                      # compare with benchmarks/baseline.json
+    python -m benchmarks.bench_suite --sizes 100 1000     # a subset of pool sizes
+    python -m benchmarks.bench_suite --update-baseline    # record a new baseline
+
+The exit status is 1 when any case is slower or uses more memory than the baseline beyond
+the tolerances, or its objective differs. Timings are machine-specific: record the baseline
+on the machine that runs the comparison.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import pulp
+
+from benchmarks.bench_selector_build import with_existing_squad
+from benchmarks.pools import make_pool
+from lionel.selector.core.base_selector import BaseSelector
+from lionel.selector.core.expressions import group_positions, linear_constraint, linear_expression
+from lionel.selector.fpl.update_xv_selector import UpdateXVSelector
+from lionel.selector.fpl.xi_selector import XISelector
+from lionel.selector.fpl.xv_selector import XVSelector
+
+BASELINE = Path(__file__).parent / "baseline.json"
+POOL_SIZES = [100, 1_000, 10_000, 50_000]
+
+# A case regresses when it exceeds the baseline by the relative tolerance AND the absolute slack,
+# so sub-millisecond noise on small pools does not fail the run.
+TIME_TOLERANCE = 0.5
+MEMORY_TOLERANCE = 0.2
+TIME_SLACK = 0.05  # seconds
+MEMORY_SLACK = 1.0  # MB
+OBJECTIVE_TOLERANCE = 1e-6
+
+
+def custom_bulk(df, backend):
+    """15 players within budget, at most 3 per team, built with the expression helpers."""
+    selector = BaseSelector(df, backend=backend)
+    selector.set_objective_function(
+        lambda candidate_df, x: linear_expression(x, candidate_df["predicted_points"].to_numpy(dtype=float))
+    )
+    selector.add_constraint(lambda candidate_df, x: linear_constraint(x, pulp.LpConstraintEQ, 15))
+    selector.add_constraint(
+        lambda candidate_df, x: linear_constraint(
+            x, pulp.LpConstraintLE, 1000, coefficients=candidate_df["price"].to_numpy(dtype=float)
+        )
+    )
+    selector.add_constraint(
+        lambda candidate_df, x: [
+            linear_constraint([x[i] for i in idxs], pulp.LpConstraintLE, 3)
+            for idxs in group_positions(candidate_df["team"]).values()
+        ]
+    )
+    return selector
+
+
+def custom_lpsum(df, backend):
+    """The same problem as `custom_bulk`, written with pulp.lpSum over rows."""
+    selector = BaseSelector(df, backend=backend)
+    selector.set_objective_function(
+        lambda candidate_df, x: pulp.lpSum(x[i] * p for i, p in enumerate(candidate_df["predicted_points"]))
+    )
+    selector.add_constraint(lambda candidate_df, x: pulp.lpSum(x) == 15)
+    selector.add_constraint(
+        lambda candidate_df, x: pulp.lpSum(x[i] * p for i, p in enumerate(candidate_df["price"])) <= 1000
+    )
+    for team in df["team"].unique():
+        selector.add_constraint(
+            lambda candidate_df, x, team=team: pulp.lpSum(x[i] for i, t in enumerate(candidate_df["team"]) if t == team)
+            <= 3
+        )
+    return selector
+
+
+CASES = {
+    "XVSelector": lambda df, backend: XVSelector(df, budget=1000, backend=backend),
+    "XVSelector_exact": lambda df, backend: XVSelector(df, budget=1000, backend=backend, exact=True),
+    "XISelector": lambda df, backend: XISelector(df, backend=backend),
+    "XISelector_exact": lambda df, backend: XISelector(df, backend=backend, exact=True),
+    "UpdateXVSelector": lambda df, backend: UpdateXVSelector(
+        with_existing_squad(df), max_transfers=2, budget=1000, backend=backend
+    ),
+    "UpdateXVSelector_exact": lambda df, backend: UpdateXVSelector(
+        with_existing_squad(df), max_transfers=2, budget=1000, backend=backend, exact=True
+    ),
+    "custom_bulk": custom_bulk,
+    "custom_lpsum": custom_lpsum,
+}
+
+
+def run_case(make_selector, df, backend, repeats):
+    """
+    Best-of-`repeats` build, solve and select times, then one traced build for peak memory.
+    Checks select() on a new selector reaches the objective of the built problem.
+    """
+    build, solve, select, objective = [], [], [], None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        selector = make_selector(df.copy(), backend)
+        selector.build()
+        built = time.perf_counter()
+        selector.select()
+        build.append(built - start)
+        solve.append(time.perf_counter() - built)
+        objective = selector.objective_value
+
+        selector = make_selector(df.copy(), backend)
+        start = time.perf_counter()
+        selector.select()
+        select.append(time.perf_counter() - start)
+        assert abs(selector.objective_value - objective) <= OBJECTIVE_TOLERANCE * max(1.0, abs(objective))
+
+    df = df.copy()
+    tracemalloc.start()
+    make_selector(df, backend).build()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "build_s": min(build),
+        "solve_s": min(solve),
+        "select_s": min(select),
+        "peak_mb": peak / 2**20,
+        "objective": objective,
+    }
+
+
+def regressions(name, result, baseline, time_tolerance, memory_tolerance):
+    """Messages for every metric of `result` that is worse than `baseline`."""
+    problems = []
+    for metric, tolerance, slack in [
+        ("build_s", time_tolerance, TIME_SLACK),
+        ("solve_s", time_tolerance, TIME_SLACK),
+        ("select_s", time_tolerance, TIME_SLACK),
+        ("peak_mb", memory_tolerance, MEMORY_SLACK),
+    ]:
+        if metric not in baseline:
+            # Recorded before the metric existed
+            continue
+        old, new = baseline[metric], result[metric]
+        if new > old * (1 + tolerance) and new - old > slack:
+            problems.append(f"{name}: {metric} {new:.3f} vs baseline {old:.3f} (+{(new / old - 1) * 100:.0f}%)")
+    if abs(result["objective"] - baseline["objective"]) > OBJECTIVE_TOLERANCE * max(1.0, abs(baseline["objective"])):
+        problems.append(f"{name}: objective {result['objective']:.4f} vs baseline {baseline['objective']:.4f}")
+    return problems
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=POOL_SIZES)
+    parser.add_argument("--cases", nargs="+", choices=list(CASES), default=list(CASES))
+    parser.add_argument("--backend", default="cbc")
+    parser.add_argument("--repeats", type=int, default=1)
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--update-baseline", action="store_true", help="Write results to the baseline file.")
+    parser.add_argument("--time-tolerance", type=float, default=TIME_TOLERANCE)
+    parser.add_argument("--memory-tolerance", type=float, default=MEMORY_TOLERANCE)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    stored = json.loads(args.baseline.read_text()) if args.baseline.exists() else {"cases": {}}
+    if not args.update_baseline and stored.get("backend", args.backend) != args.backend:
+        sys.exit(f"Baseline was recorded with backend '{stored['backend']}', not '{args.backend}'.")
+
+    results, problems = {}, []
+    print(f"{'case':>30} {'build':>10} {'solve':>10} {'select':>10} {'peak':>10}  baseline (build/solve/select/peak)")
+    for n_players in args.sizes:
+        df = make_pool(n_players, seed=n_players)
+        for case in args.cases:
+            name = f"{case}/{n_players}"
+            result = results[name] = run_case(CASES[case], df, args.backend, args.repeats)
+            line = (
+                f"{name:>30} {result['build_s']:>9.3f}s {result['solve_s']:>9.3f}s {result['select_s']:>9.3f}s "
+                f"{result['peak_mb']:>8.1f}MB"
+            )
+            baseline = stored["cases"].get(name)
+            if baseline is not None:
+                select = f"{baseline['select_s']:.3f}s" if "select_s" in baseline else "-"
+                line += f"  {baseline['build_s']:.3f}s/{baseline['solve_s']:.3f}s/{select}/{baseline['peak_mb']:.1f}MB"
+                if not args.update_baseline:
+                    problems += regressions(name, result, baseline, args.time_tolerance, args.memory_tolerance)
+            print(line, flush=True)
+
+    if args.update_baseline:
+        stored["backend"] = args.backend
+        stored["python"] = platform.python_version()
+        stored["cases"].update(results)
+        args.baseline.write_text(json.dumps(stored, indent=2, sort_keys=True) + "\n")
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    missing = [name for name in results if name not in stored["cases"]]
+    if missing:
+        print(f"No baseline for: {', '.join(missing)}")
+    if problems:
+        print("Regressions:\n  " + "\n  ".join(problems))
+        return 1
+    print("No regressions.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,56 @@
+"""
+Benchmark: time to enumerate the K best distinct XV squads.
+
+`select_top_k` adds one no-good cut per solution to the built problem and re-solves
+it. With HiGHS the loaded model is kept and only the new cut rows are added.
+The baseline rebuilds a fresh selector with all previous cuts for every solution.
+
+Run from the repository root:
+    python -m benchmarks.bench_top_k
+"""
+
+import time
+
+import numpy as np
+import pulp
+
+from benchmarks.pools import make_pool
+from lionel.selector.fpl.xv_selector import XVSelector
+
+N_PLAYERS = 700
+K_VALUES = [1, 5, 10, 20]
+MIN_DISTANCE = 2
+
+
+def rebuild_top_k(df, k, backend):
+    """K selectors built from scratch, each with cuts excluding the previous squads."""
+    squads = []
+    for _ in range(k):
+        selector = XVSelector(df.copy(), backend=backend)
+        for squad in squads:
+            selector.add_constraint(
+                lambda candidate_df, decision_vars, squad=squad: pulp.lpSum(decision_vars[i] for i in squad)
+                <= len(squad) - MIN_DISTANCE // 2
+            )
+        selector.select()
+        squads.append(np.flatnonzero(selector._values(selector.decision_vars) > 0.5))
+    return squads
+
+
+def main():
+    df = make_pool(N_PLAYERS, seed=4)
+    print(f"{'backend':>8} {'K':>4} {'rebuild':>10} {'top_k':>10}")
+    for backend in ["cbc", "highs"]:
+        for k in K_VALUES:
+            start = time.perf_counter()
+            rebuild_top_k(df, k, backend)
+            rebuild = time.perf_counter() - start
+
+            start = time.perf_counter()
+            XVSelector(df.copy(), backend=backend).select_top_k(k, min_distance=MIN_DISTANCE)
+            top_k = time.perf_counter() - start
+            print(f"{backend:>8} {k:>4} {rebuild * 1e3:>8.0f}ms {top_k * 1e3:>8.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
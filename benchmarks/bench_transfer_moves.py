@@ -0,0 +1,62 @@
+"""
+Benchmark: transfer enumeration vs the MILP for 1 and 2 transfers.
+
+Starts from a cheap squad on a randomized pool and finds the best move
+(a) with UpdateXVSelector(exact=True).select(), which enumerates every reachable squad, and
+(b) with the default, which solves the MILP. Checks both give the same objective,
+then times ranking every move and the best 50 with `rank_transfers`.
+
+Run from the repository root:
+    python -m benchmarks.bench_transfer_moves
+"""
+
+import time
+
+from benchmarks.pools import make_pool
+from lionel.selector.fpl.update_xv_selector import UpdateXVSelector
+from lionel.selector.fpl.xv_selector import XVSelector
+
+N_PLAYERS = 700
+BUDGET = 1000
+REPEATS = 5
+
+
+def make_squad_pool(n_players, seed=0):
+    """A pool with its cheapest valid squad marked in 'xv'."""
+    df = make_pool(n_players, seed=seed)
+    df["xv"] = 0
+    for pos, count in XVSelector.POS_CONSTRAINTS.items():
+        df.loc[df[df["position"] == pos].nsmallest(count, "price").index, "xv"] = 1
+    return df
+
+
+def best_move(df, max_transfers, exact):
+    """Seconds per select() and its objective."""
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        selector = UpdateXVSelector(df.copy(), max_transfers=max_transfers, budget=BUDGET, exact=exact)
+        selector.select()
+    return (time.perf_counter() - start) / REPEATS, selector.objective_value
+
+
+def main():
+    df = make_squad_pool(N_PLAYERS)
+    print(f"{'transfers':>9} {'method':>12} {'seconds':>8} {'moves':>8}")
+    for max_transfers in (1, 2):
+        enumerated, objective = best_move(df, max_transfers, exact=True)
+        milp, milp_objective = best_move(df, max_transfers, exact=False)
+        assert abs(objective - milp_objective) < 1e-6, (objective, milp_objective)
+        print(f"{max_transfers:>9} {'enumerate':>12} {enumerated:>8.3f} {1:>8}")
+        print(f"{max_transfers:>9} {'milp':>12} {milp:>8.3f} {1:>8}")
+
+        selector = UpdateXVSelector(df.copy(), max_transfers=max_transfers, budget=BUDGET)
+        for top in (50, None):
+            start = time.perf_counter()
+            moves = selector.rank_transfers(top=top)
+            seconds = time.perf_counter() - start
+            assert abs(moves["objective"].iloc[0] - objective) < 1e-6
+            print(f"{max_transfers:>9} {'rank ' + str(top or 'all'):>12} {seconds:>8.3f} {len(moves):>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Benchmark: interactive lock/ban editing.
+
+Replays a random session of lock, ban and undo edits on a full pool, re-selecting after
+each one, (a) on one selector with `lock`/`ban`/`undo` and (b) by constructing a new
+XVSelector with the edited bounds each time. Reports p50/p99 response times per edit.
+
+Run from the repository root:
+    python -m benchmarks.bench_what_if
+"""
+
+import time
+
+import numpy as np
+
+from benchmarks.pools import make_pool
+from lionel.selector.fpl.xv_selector import XVSelector
+
+N_PLAYERS = 700
+EDITS = 60
+
+
+def session(df, seed=0):
+    """A random sequence of ('lock' | 'ban' | 'undo', label) edits."""
+    rng = np.random.default_rng(seed)
+    edits, depth = [], 0
+    for _ in range(EDITS):
+        if depth and rng.random() < 0.3:
+            edits.append(("undo", None))
+            depth -= 1
+        else:
+            edits.append((rng.choice(["lock", "ban"]), df.index[rng.integers(len(df))]))
+            depth += 1
+    return edits
+
+
+def in_place(df, edits, exact):
+    """Response times editing one selector."""
+    selector = XVSelector(df.copy(), budget=1000, exact=exact)
+    selector.select()
+    times = []
+    for action, label in edits:
+        start = time.perf_counter()
+        selector.undo() if action == "undo" else getattr(selector, action)(label)
+        selector.select()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def rebuilt(df, edits, exact):
+    """Response times constructing a new selector per edit."""
+    history, times = [{}], []
+    for action, label in edits:
+        start = time.perf_counter()
+        if action == "undo":
+            history.pop()
+        else:
+            history.append({**history[-1], label: action})
+        fixed = history[-1]
+        selector = XVSelector(df.copy(), budget=1000, exact=exact)
+        for lbl, state in fixed.items():
+            selector.set_bounds(df.index.get_loc(lbl), lower=int(state == "lock"), upper=int(state == "lock"))
+        selector.select()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def main():
+    df = make_pool(N_PLAYERS, seed=0)
+    edits = session(df)
+    print(f"{'method':>24} {'p50':>8} {'p99':>8}")
+    for name, func, exact in (
+        ("new selector, MILP", rebuilt, False),
+        ("lock/ban in place, MILP", in_place, False),
+        ("lock/ban in place", in_place, True),
+    ):
+        p50, p99 = np.percentile(func(df, edits, exact), [50, 99]) * 1e3
+        print(f"{name:>24} {p50:>6.0f}ms {p99:>6.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
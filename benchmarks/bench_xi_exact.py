@@ -0,0 +1,50 @@
+"""
+Benchmark: XI selection by formation enumeration vs the MILP.
+
+Times `XISelector.select()` on a 15-player squad with the exact path and with
+`exact=False` (PuLP build + CBC), and `XISelector.best_xi_batch` on many draws at once.
+
+Run from the repository root:
+    python -m benchmarks.bench_xi_exact
+"""
+
+import time
+
+import numpy as np
+
+from benchmarks.bench_selector_build import with_existing_squad
+from benchmarks.pools import make_pool
+from lionel.selector.fpl.xi_selector import XISelector
+
+REPEATS = 20
+BATCH_SIZES = [1_000, 100_000, 1_000_000]
+
+
+def time_select(df, exact, repeats=REPEATS):
+    """Mean wall time of constructing an XISelector and selecting."""
+    start = time.perf_counter()
+    for _ in range(repeats):
+        XISelector(df.copy(), exact=exact).select()
+    return (time.perf_counter() - start) / repeats
+
+
+def main():
+    pool = with_existing_squad(make_pool(700, seed=2))
+    squad = pool[pool["xv"] == 1].reset_index(drop=True)
+
+    milp = time_select(squad, exact=False)
+    exact = time_select(squad, exact=True)
+    print(f"select(): MILP {milp * 1e3:.1f}ms, exact {exact * 1e3:.2f}ms ({milp / exact:.0f}x)")
+
+    rng = np.random.default_rng(0)
+    print(f"{'draws':>10} {'batch':>10} {'per XI':>10}")
+    for n_draws in BATCH_SIZES:
+        draws = rng.normal(squad["predicted_points"].to_numpy(), 2.0, size=(n_draws, len(squad)))
+        start = time.perf_counter()
+        XISelector.best_xi_batch(draws, squad["position"])
+        elapsed = time.perf_counter() - start
+        print(f"{n_draws:>10} {elapsed:>9.2f}s {elapsed / n_draws * 1e6:>8.2f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Benchmark: XV selection by in-process branch and bound vs the MILP.
+
+Times `XVSelector.select()` on randomized pools with the branch and bound path (`exact=True`)
+and with the default MILP (PuLP build + CBC), checks both reach the same objective and counts the
+pools where branch and bound hit its limit and fell back to the MILP.
+
+Run from the repository root:
+    python -m benchmarks.bench_xv_bnb
+"""
+
+import time
+
+import numpy as np
+
+from benchmarks.pools import make_pool
+from lionel.selector.fpl.xv_selector import XVSelector
+
+SIZES = [200, 700, 1500]
+SEEDS = 20
+
+
+def time_select(df, exact):
+    """Wall time of constructing an XVSelector and selecting, and the selector."""
+    start = time.perf_counter()
+    selector = XVSelector(df.copy(), budget=1000, exact=exact)
+    selector.select()
+    return time.perf_counter() - start, selector
+
+
+def main():
+    print(f"{'players':>8} {'MILP median':>12} {'B&B median':>11} {'B&B max':>9} {'fallbacks':>10}")
+    for n in SIZES:
+        milp, exact, fallbacks = [], [], 0
+        for seed in range(SEEDS):
+            df = make_pool(n, seed=seed)
+            seconds, reference = time_select(df, exact=False)
+            milp.append(seconds)
+            seconds, selector = time_select(df, exact=True)
+            exact.append(seconds)
+            fallbacks += selector.stats.backend != "direct"
+            assert abs(selector.objective_value - reference.objective_value) < 1e-6, (n, seed)
+        print(
+            f"{n:>8} {np.median(milp) * 1e3:>10.0f}ms {np.median(exact) * 1e3:>9.0f}ms "
+            f"{max(exact) * 1e3:>7.0f}ms {fallbacks:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+"""
+Seeded synthetic candidate pools for selector benchmarks.
+
+Pools have the same columns as `tests/data/candidates_xv.json`
+('player', 'team', 'position', 'price', 'predicted_points').
+"""
+
+import numpy as np
+import pandas as pd
+
+POSITION_SHARES = {"GK": 0.1, "DEF": 0.33, "MID": 0.4, "FWD": 0.17}
+
+
+def make_pool(n_players: int, n_teams: int = 20, seed: int = 0) -> pd.DataFrame:
+    """
+    Build a reproducible pool of `n_players` candidates spread across `n_teams` teams.
+    Prices are integers in tenths (40-130) and predicted points rise with price.
+    """
+    rng = np.random.default_rng(seed)
+    positions = rng.choice(list(POSITION_SHARES), size=n_players, p=list(POSITION_SHARES.values()))
+    price = rng.integers(40, 131, size=n_players)
+    predicted_points = np.round(price / 20 + rng.normal(0, 1.5, size=n_players), 2)
+    return pd.DataFrame(
+        {
+            "player": [f"player_{i}" for i in range(n_players)],
+            "team": [f"team_{t}" for t in rng.integers(0, n_teams, size=n_players)],
+            "position": positions,
+            "price": price,
+            "predicted_points": predicted_points,
+        }
+    )
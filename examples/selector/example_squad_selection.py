@@ -0,0 +1,37 @@
+"""
+Example 6: Joint XV, XI, captain and bench selection
+
+Demonstrates how to use SquadSelector to pick the squad, starting XI, captain
+and bench order in a single solve, instead of running XVSelector and then
+XISelector on its result (see example_xi_selection_2.py).
+"""
+
+import numpy as np
+import pandas as pd
+
+from lionel.selector.fpl.squad_selector import SquadSelector
+
+
+def main():
+    df = pd.DataFrame(
+        {
+            "player": [f"player_{i}" for i in range(20)],
+            "team": [f"team_{i%10}" for i in range(20)],
+            "position": ["FWD"] * 3 + ["MID"] * 8 + ["DEF"] * 7 + ["GK"] * 2,
+            "price": [100, 90, 55, 45] * 5,
+            "predicted_points": np.random.normal(5, 2, 20),
+        }
+    )
+
+    # Bench weights: reserve GK, then the first, second and third outfield substitutes
+    selector = SquadSelector(df, pred_var="predicted_points", budget=1000, bench_weights=(0.05, 0.3, 0.15, 0.05))
+    best_squad = selector.select()
+
+    best_squad = best_squad[best_squad["xv"] == 1].sort_values(
+        by=["captain", "xi", "bench"], ascending=[False, False, True]
+    )
+    print(best_squad)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,16 @@
+import time
+
+import numpy as np
 import pandas as pd
 import pulp
 
+from .cache import selection_key
+from .expressions import linear_constraint
+from .metrics import PHASES, SolveStats, emit
+from .pool import CandidatePool, Selection
+from .sensitivity import points_sensitivity
+from .solvers import SolveResult, get_backend, problem_constraints, remove_constraints
+
 
 class BaseSelector:
     """
@@ -11,18 +21,36 @@ class BaseSelector:
         2) Override or call `set_constraints()` to add constraints.
         3) Define or override an objective function with `set_objective_function()`.
         4) Call `select()` to solve the optimization problem.
+        5) Optionally call `set_backend()` to solve with something other than CBC.
+        6) Call `select_top_k()` for several distinct near-optimal selections.
+        7) Optionally call `set_cache()` so repeated identical selections skip the solver.
+        8) Optionally call `set_solve_options()` to stop early within a time limit or gap, and
+           `set_incumbent_callback()` to receive improved selections while solving.
+        9) Optionally pass a CandidatePool instead of a DataFrame to share one pool between
+           selectors: `select()` then returns a Selection of masks and writes nothing.
+
+    The problem is built on the first `select()` and kept. Later calls re-solve it,
+    so objective coefficients (`update_objective()`), right-hand sides (`set_rhs()`)
+    and variable bounds (`set_bounds()`) can be changed in place between solves.
+    Registering a new objective or constraint triggers a rebuild on the next solve.
 
     Subclasses should override or extend these methods for specific logic.
     """
 
-    def __init__(self, candidate_df: pd.DataFrame):
+    def __init__(self, candidate_df: pd.DataFrame, backend=None):
         """
         :param candidate_df: DataFrame containing all candidate items (e.g. players).
                Must have a unique identifier for each row (e.g. player_id).
                The original index is preserved to allow re-indexing or referencing
-               outside the class.
+               outside the class. The selector works on its own copy, so the caller's
+               frame is never modified. A CandidatePool (see lionel.selector.core.pool) is read
+               through its shared frame, without copying.
+        :param backend: Solver backend: None (CBC), a name ('cbc', 'scipy', 'highs', 'round')
+               or a SolverBackend instance. See lionel.selector.core.solvers.
         """
-        self.candidate_df = candidate_df
+        self.pool = candidate_df if isinstance(candidate_df, CandidatePool) else None
+        # select() marks its own frame: a copy of the caller's, or nothing for a read-only pool
+        self.candidate_df = candidate_df.copy() if self.pool is None else self.pool.frame
         self.selected_df = pd.DataFrame(columns=self.candidate_df.columns)
 
         # We'll use integer-based indexing (range) for decision_vars,
@@ -38,6 +66,29 @@ class BaseSelector:
         # Default objective and constraints are empty
         self.objective_func = None
         self.custom_constraints = []
+        self.backend = get_backend(backend)
+        self._built = False
+
+        # Optional solution cache (see lionel.selector.core.cache)
+        self.cache = None
+        self.cache_hit = False
+        self.objective_value = None
+        self._input_columns = list(self.candidate_df.columns)
+        self._rhs_overrides = {}
+
+        # Players locked in or banned (position -> "lock"/"ban"), their bounds before the first
+        # change and an undo stack of earlier states
+        self._fixed = {}
+        self._free_bounds = {}
+        self._bound_history = []
+
+        # Statistics of the last select() (see lionel.selector.core.metrics)
+        self.stats = None
+        self.metrics_hooks = []
+
+        # Called with improved selections during select() (see set_incumbent_callback)
+        self.incumbent_callback = None
+        self._reported = None
 
     def set_objective_function(self, objective_func):
         """
@@ -46,6 +97,7 @@ class BaseSelector:
                                and returns a PuLP expression.
         """
         self.objective_func = objective_func
+        self._built = False
 
     def add_constraint(self, constraint_func):
         """
@@ -54,18 +106,119 @@ class BaseSelector:
                                 and returns a PuLP constraint or list of constraints.
         """
         self.custom_constraints.append(constraint_func)
+        self._built = False
 
-    def select(self):
+    def set_backend(self, backend):
         """
-        Finalizes the objective & constraints, solves the problem, and returns
-        the chosen items (players).
-        :return: A subset of candidate_df that were selected by the solver (preserving
-                 the original DataFrame index).
+        Sets the solver backend used by `select()`.
+        :param backend: A backend name ('cbc', 'scipy', 'highs', 'round') or a SolverBackend instance.
+        """
+        self.backend = get_backend(backend)
+
+    def set_solve_options(self, time_limit: float = None, gap_rel: float = None):
+        """
+        Lets the solver stop early with the best selection found so far. `stats.best_bound` and
+        `stats.gap` then give its quality. None removes a limit. For a quick answer without
+        the MILP, use the 'round' backend (LP relaxation plus rounding).
+        :param time_limit: Solver wall-clock limit in seconds.
+        :param gap_rel: Relative MIP gap at which the solver may stop (e.g. 0.01 for 1%).
+        """
+        self.backend.time_limit = time_limit
+        self.backend.gap_rel = gap_rel
+
+    def set_incumbent_callback(self, callback):
+        """
+        Sets callback(selection, objective, best_bound), called during `select()` with each
+        improved selection (rows of candidate_df) as the backend finds it. Backends that
+        can't stream solutions (CBC, scipy) and exact solves report only the final selection,
+        which is always reported unless an equal one already was.
+        :param callback: A callable, or None to remove it.
+        """
+        self.incumbent_callback = callback
+
+    def _report_incumbent(self, objective: float, best_bound: float):
+        """Passes the selection currently on the decision variables to the incumbent callback."""
+        if objective is None or (self._reported is not None and objective <= self._reported):
+            return
+        self._reported = objective
+        selected = np.flatnonzero(self._values(self.decision_vars) > 0.5)
+        self.incumbent_callback(self.candidate_df.iloc[selected], objective, best_bound)
+
+    def set_cache(self, cache):
+        """
+        Sets a solution cache (e.g. MemoryCache or DiskCache from lionel.selector.core.cache).
+        `select()` then returns stored solutions for identical inputs without building or solving.
+        :param cache: A cache instance, or None to disable caching.
+        """
+        self.cache = cache
+
+    def add_metrics_hook(self, hook):
+        """
+        Registers hook(selector, stats), called with a SolveStats after each `select()` of this selector.
+        See lionel.selector.core.metrics for hooks that apply to every selector.
+        """
+        self.metrics_hooks.append(hook)
+
+    def _cache_columns(self) -> list:
+        """Candidate columns that determine the solution. Defaults to the columns given at construction."""
+        return self._input_columns
+
+    def _cache_params(self) -> dict:
+        """
+        Parameters, besides candidate columns and registered functions, that determine the solution.
+        Subclasses extend this with their own parameters (e.g. budget).
+        """
+        bounds = [(var.lowBound, var.upBound) for var in self.decision_vars]
+        return {
+            "bounds": np.array(bounds, dtype=float).reshape(-1, 2),
+            "rhs": self._rhs_overrides,
+            "backend": (type(self.backend).__name__, self.backend.time_limit, self.backend.gap_rel),
+        }
+
+    def _points_variables(self) -> list:
+        """
+        Per candidate, the variables whose objective coefficient is that candidate's points,
+        used by `sensitivity()`. Subclasses that count points more than once (captains) extend this.
+        """
+        return [[var] for var in self.decision_vars]
+
+    def _solution_variables(self) -> list:
+        """Variables whose values `select()` reads back; these are what the cache stores."""
+        return self.decision_vars
+
+    def _selection_flags(self, mask: np.ndarray) -> dict:
+        """
+        Per-row markers of the current solution that `select()` returns in a pool's Selection
+        (frame selectors write them as columns), given the mask of selected rows.
+        """
+        return {}
+
+    def _source_rows(self, values: np.ndarray) -> np.ndarray:
+        """Maps per-row values of candidate_df onto the rows of the frame or pool passed in."""
+        return values
+
+    def _solve_direct(self):
+        """
+        Optional exact solution without building the problem, for subclasses whose problem
+        has a closed form. Called by `select()` while the problem is not built (once built,
+        the problem may carry changes such as top-k cuts).
+        :return: (values of `_solution_variables()` as an array, objective value), or None
+                 to build and solve the problem.
+        """
+        return None
+
+    def build(self):
+        """
+        Builds a fresh PuLP problem from the objective and the registered constraints.
+        Called by `select()`; can be called on its own to inspect or time problem construction.
+        :return: The built pulp.LpProblem.
         """
         # 1) Check that an objective function is defined
         if self.objective_func is None:
             raise ValueError("No objective function has been set. Call set_objective_function() first.")
 
+        self.problem = pulp.LpProblem("GenericSelectorProblem", pulp.LpMaximize)
+
         # 2) Set the objective
         self.problem.setObjective(self.objective_func(self.candidate_df, self.decision_vars))
 
@@ -77,16 +230,274 @@ class BaseSelector:
                     self.problem.addConstraint(con)
             else:
                 self.problem.addConstraint(constraints)
+        self._built = True
+        return self.problem
+
+    def update_objective(self):
+        """
+        Re-evaluates the objective function against the current candidate_df and sets it
+        on the built problem, keeping all constraints. Use after changing the values the
+        objective reads (e.g. predicted points).
+        """
+        if self._built:
+            self.problem.setObjective(self.objective_func(self.candidate_df, self.decision_vars))
+
+    def get_constraint(self, name: str) -> pulp.LpConstraint:
+        """Returns the named constraint from the built problem."""
+        if not self._built:
+            self.build()
+        for con in problem_constraints(self.problem):
+            if con.name == name:
+                return con
+        raise KeyError(f"No constraint named '{name}' in the problem.")
+
+    def set_rhs(self, name: str, rhs: float):
+        """Changes the right-hand side of a named constraint in place."""
+        self.get_constraint(name).changeRHS(rhs)
+        self._rhs_overrides[name] = rhs
+
+    def set_bounds(self, positions, lower: float = None, upper: float = None):
+        """
+        Changes the bounds of the decision variables at integer `positions` in place.
+        Bounds left as None are unchanged.
+        """
+        for i in np.atleast_1d(positions):
+            var = self.decision_vars[i]
+            var.lowBound = var.lowBound if lower is None else lower
+            var.upBound = var.upBound if upper is None else upper
+
+    def lock(self, players):
+        """
+        Forces players into the selection by fixing their bounds to 1. A built problem is
+        changed in place, so the next `select()` re-solves without rebuilding.
+        :param players: candidate_df index label(s).
+        """
+        self._fix(players, "lock")
+
+    def ban(self, players):
+        """Keeps players out of the selection by fixing their bounds to 0. See `lock`."""
+        self._fix(players, "ban")
+
+    def release(self, players=None):
+        """
+        Undoes locks and bans on players, restoring the bounds they had before.
+        :param players: candidate_df index label(s). Defaults to every locked or banned player.
+        """
+        self._fix(self.candidate_df.index[list(self._fixed)] if players is None else players, None)
+
+    def undo(self):
+        """Reverts the last `lock`, `ban` or `release`."""
+        if not self._bound_history:
+            raise ValueError("No lock, ban or release to undo.")
+        for i, state, lower, upper in self._bound_history.pop():
+            var = self.decision_vars[i]
+            var.lowBound, var.upBound = lower, upper
+            if state is None:
+                self._fixed.pop(i, None)
+            else:
+                self._fixed[i] = state
+
+    @property
+    def locked(self) -> list:
+        """Index labels of the locked players."""
+        return self.candidate_df.index[[i for i, state in self._fixed.items() if state == "lock"]].tolist()
+
+    @property
+    def banned(self) -> list:
+        """Index labels of the banned players."""
+        return self.candidate_df.index[[i for i, state in self._fixed.items() if state == "ban"]].tolist()
+
+    def _fix(self, players, state):
+        """Sets players' bounds for `state` ("lock", "ban" or None to release), recording an undo step."""
+        labels = pd.Index(np.atleast_1d(players))
+        positions = self.candidate_df.index.get_indexer(labels)
+        if (positions < 0).any():
+            raise KeyError(f"Not in candidate_df: {labels[positions < 0].tolist()}")
+        step = []
+        for i in positions.tolist():
+            var = self.decision_vars[i]
+            step.append((i, self._fixed.get(i), var.lowBound, var.upBound))
+            self._free_bounds.setdefault(i, (var.lowBound, var.upBound))
+            if state is None:
+                var.lowBound, var.upBound = self._free_bounds[i]
+                self._fixed.pop(i, None)
+            else:
+                var.lowBound = var.upBound = 1 if state == "lock" else 0
+                self._fixed[i] = state
+        self._bound_history.append(step)
+
+    def set_initial_values(self, values, variables=None):
+        """
+        Sets starting values used by `select(warm_start=True)`.
+        :param values: Array-like of values aligned with `variables`.
+        :param variables: Variables to set; defaults to decision_vars.
+        """
+        variables = self.decision_vars if variables is None else variables
+        for var, value in zip(variables, np.asarray(values, dtype=float).tolist()):
+            var.setInitialValue(value, check=False)
+
+    def select(self, warm_start: bool = False):
+        """
+        Finalizes the objective & constraints, solves the problem, and returns
+        the chosen items (players).
+        :param warm_start: Start the solver from the variables' current values (the
+                           previous incumbent, or values from `set_initial_values()`).
+        :return: A subset of candidate_df that were selected by the solver (preserving
+                 the original DataFrame index); for a CandidatePool, a Selection of masks over
+                 its rows.
+        """
+        start = time.perf_counter()
+        timings = dict.fromkeys(PHASES, 0.0)
+        self._reported = None
+        key = None if self.cache is None else selection_key(self)
+        entry = None if key is None else self.cache.get(key)
+        self.cache_hit = entry is not None
+        if self.cache_hit:
+            # Cached: restore the stored values instead of building and solving
+            for var, value in zip(self._solution_variables(), entry["values"].tolist()):
+                var.varValue = value
+            self.problem.status = entry["status"]
+            self.objective_value = entry["objective"]
+            result, size, backend = None, (None, None, None), self.backend.name
+        else:
+            solve_start = time.perf_counter()
+            direct = None if self._built else self._solve_direct()
+            if direct is not None:
+                # Solved exactly without building the problem (see _solve_direct)
+                values, self.objective_value = direct
+                for var, value in zip(self._solution_variables(), values.tolist()):
+                    var.varValue = value
+                self.problem.status = pulp.LpStatusOptimal
+                timings["solve"] = time.perf_counter() - solve_start
+                result = SolveResult(
+                    pulp.LpStatusOptimal, objective=self.objective_value, gap=0.0, best_bound=self.objective_value
+                )
+                size, backend = (None, None, None), "direct"
+            else:
+                if not self._built:
+                    build_start = time.perf_counter()
+                    self.build()
+                    timings["constraints"] = time.perf_counter() - build_start
 
-        # 4) Solve the problem
-        self.problem.solve(pulp.PULP_CBC_CMD(msg=0))
+                # 4) Solve the problem
+                report = None if self.incumbent_callback is None else self._report_incumbent
+                self.backend.solve(self.problem, warm_start=warm_start, on_incumbent=report)
+                for phase, seconds in self.backend.timings.items():
+                    timings[phase] += seconds
+                self.objective_value = pulp.value(self.problem.objective)
+                result, size, backend = self.backend.last_result, self.backend.size, self.backend.name
+            if key is not None:
+                values = self._values(self._solution_variables())
+                self.cache.put(
+                    key, {"values": values, "status": self.problem.status, "objective": self.objective_value}
+                )
+
+        if self.incumbent_callback is not None and self.problem.status == pulp.LpStatusOptimal:
+            self._report_incumbent(self.objective_value, None if result is None else result.best_bound)
 
         # 5) Identify which rows are selected
-        selected_indices = [i for i, var in enumerate(self.decision_vars) if pulp.value(var) == 1]
+        read_start = time.perf_counter()
+        mask = self._values(self.decision_vars) > 0.5
+        if self.pool is not None:
+            # The pool is shared: return masks rather than copying or marking rows
+            flags = {name: self._source_rows(values) for name, values in self._selection_flags(mask).items()}
+            selection = Selection(self._source_rows(mask), flags, self.objective_value)
+        else:
+            # Convert integer positions -> original DataFrame index
+            selected_index_labels = self.candidate_df.index[np.flatnonzero(mask)]
+
+            # 6) Create selected_df
+            self.selected_df = selection = self.candidate_df.loc[selected_index_labels].copy()
+        timings["read"] += time.perf_counter() - read_start
+        timings["total"] = time.perf_counter() - start
+
+        self.stats = SolveStats(
+            backend=backend,
+            status=self.problem.status,
+            objective=self.objective_value,
+            gap=None if result is None else result.gap,
+            best_bound=None if result is None else result.best_bound,
+            nodes=None if result is None else result.nodes,
+            num_variables=size[0],
+            num_constraints=size[1],
+            num_nonzeros=size[2],
+            cache_hit=self.cache_hit,
+            timings=timings,
+        )
+        emit(self, self.stats)
+        return selection
+
+    def select_top_k(self, k: int, min_distance: int = 1) -> list:
+        """
+        Returns up to k best distinct selections, best first.
 
-        # Convert integer positions -> original DataFrame index
-        selected_index_labels = self.candidate_df.index[selected_indices]
+        After each solve a no-good cut is added to the built problem, requiring later
+        selections to differ from it in at least `min_distance` decision variables
+        (Hamming distance), and the problem is re-solved. The cuts are removed afterwards.
+        Fewer than k selections are returned if no further selection satisfies the cuts.
+        Flags that subclasses set on candidate_df (e.g. 'xv') describe the last selection.
+        With a CandidatePool, the selections are Selection tuples instead.
+        :param k: Number of selections to return.
+        :param min_distance: Minimum number of decision variables in which any two selections differ.
+               For fixed-size selections (e.g. a 15-player squad) a distance of 2 means one swap.
+        :return: List of selected_df frames (as set by `select()`), each with its objective
+                 value in `.attrs["objective"]`, or of Selections for a CandidatePool.
+        """
+        if k < 1:
+            raise ValueError("k must be at least 1.")
+        if min_distance < 1:
+            raise ValueError("min_distance must be at least 1.")
+        if not self._built:
+            self.build()
+
+        # Cuts are not part of the cache key, so bypass the cache while they are in place
+        solutions, cuts, cache = [], [], self.cache
+        self.cache = None
+        try:
+            while len(solutions) < k:
+                # No warm start: the previous selection violates the cut just added
+                selection = self.select()
+                if self.problem.status != pulp.LpStatusOptimal:
+                    break
+                if self.pool is None:
+                    selection = self.selected_df.copy()
+                    selection.attrs["objective"] = self.objective_value
+                solutions.append(selection)
+                if len(solutions) == k:
+                    break
+                # sum_{i in S} (1 - x_i) + sum_{i not in S} x_i >= min_distance
+                chosen = self._values(self.decision_vars) > 0.5
+                cut = linear_constraint(
+                    self.decision_vars,
+                    pulp.LpConstraintGE,
+                    min_distance - chosen.sum(),
+                    coefficients=np.where(chosen, -1.0, 1.0),
+                    name=f"_top_k_cut_{len(cuts)}",
+                )
+                self.problem.addConstraint(cut)
+                cuts.append(cut.name)
+        finally:
+            remove_constraints(self.problem, cuts)
+            self.cache = cache
+        return solutions
+
+    def sensitivity(self, positions=None, within: float = None) -> pd.DataFrame:
+        """
+        For each candidate, how far its points can move before it enters (if unselected) or
+        leaves (if selected) the optimal selection, from LP reduced costs and a few re-solves
+        of the built problem per candidate (see lionel.selector.core.sensitivity). Solves first
+        if needed; the current selection is unchanged afterwards.
+        :param positions: Integer positions of the candidates to analyse. Defaults to all.
+        :param within: Only compute changes up to this size exactly; for candidates whose LP
+                       bound is larger, report the bound (a lower bound on the size of the change).
+        :return: DataFrame indexed like candidate_df with 'selected', 'change' (points to add,
+                 or to remove as a negative number; +/-inf if the candidate never enters or
+                 leaves), 'exact' and 'solves' (re-solves used), plus 'points' and 'threshold'
+                 (points + change) for selectors with a pred_var.
+        """
+        return points_sensitivity(self, positions, within)
 
-        # 6) Create selected_df
-        self.selected_df = self.candidate_df.loc[selected_index_labels].copy()
-        return self.selected_df
+    @staticmethod
+    def _values(variables) -> np.ndarray:
+        """Solution values of `variables` as a float array (unset values read as 0)."""
+        return np.fromiter((var.varValue or 0.0 for var in variables), dtype=float, count=len(variables))
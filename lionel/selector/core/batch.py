@@ -0,0 +1,48 @@
+"""
+Batches of independent selections on a thread pool.
+
+Selectors share no mutable state: each creates its own variables, problem and solver
+backend, works on its own copy of candidate_df (or reads a read-only CandidatePool) and
+never writes to the caller's frame. Independent selections can therefore run concurrently
+from one process, sharing the candidate data:
+
+    jobs = [(pool, {"budget": budget}) for budget in range(900, 1001, 5)]
+    results = select_batch(XVSelector, jobs, max_workers=8)
+    results[0].selection, results[0].objective
+
+CBC runs as a subprocess, so threads overlap its solves; for solves that hold the GIL
+(the in-process exact solvers), use a process pool instead (e.g. SelectionService with
+executor="process").
+
+A single selector is not meant to be shared between threads: `select()` updates its
+problem, solution values and stats. A MemoryCache or DiskCache can be shared.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from .service import _run_selection
+from .solvers import SolverBackend
+
+
+def select_batch(selector_cls, jobs, max_workers: int = None, setup=None) -> list:
+    """
+    Runs `selector_cls(candidate_df, **kwargs).select()` for each job on a thread pool.
+
+    :param selector_cls: The selector class, e.g. XVSelector.
+    :param jobs: Iterable of (candidate_df, kwargs) pairs. candidate_df (a DataFrame or a
+                 CandidatePool) may be the same object in every job.
+    :param max_workers: Threads. Defaults to ThreadPoolExecutor's default.
+    :param setup: Optional setup(selector) called before each selection, e.g. to add constraints.
+    :return: One SelectionResult per job, in order. The first job to raise re-raises here.
+    """
+    jobs = list(jobs)
+    for _, kwargs in jobs:
+        if isinstance(kwargs.get("backend"), SolverBackend):
+            raise ValueError("Pass the backend by name: a SolverBackend instance holds per-solve state.")
+    if not jobs:
+        return []
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [
+            pool.submit(_run_selection, selector_cls, candidate_df, kwargs, setup) for candidate_df, kwargs in jobs
+        ]
+        return [future.result() for future in futures]
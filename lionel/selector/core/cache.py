@@ -0,0 +1,239 @@
+"""
+Content-addressed caches for selector solutions.
+
+A selector with a cache (`selector.set_cache(MemoryCache())`) hashes what determines
+its solution before solving:
+
+    - its class
+    - the candidate columns it reads (`_cache_columns()`)
+    - its parameters, e.g. budget or transfer limit (`_cache_params()`)
+    - the code of its objective and constraint functions, including default
+      arguments and closure values, and for methods bound to other objects, the
+      public attributes of those objects
+    - decision variable bounds and right-hand sides changed with `set_rhs()`
+
+If an entry exists, the stored variable values are written back and `select()` skips
+building and solving. Functions are hashed by their code, so constraints that read
+global state must not change it between solves. Methods bound to the selector are covered
+by its parameters only for the selectors in this package: a selector whose objective or
+constraints are its own methods defined elsewhere (e.g. in a subclass) is not cached.
+
+Two backends are provided, both evicting least recently used entries beyond `max_bytes`:
+
+    - MemoryCache: an in-process LRU.
+    - DiskCache: one .npz file per entry in a directory, shareable between processes.
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+import types
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+def _update(h, value):
+    """Feeds a stable byte representation of `value` into hash `h`."""
+    if isinstance(value, np.ndarray):
+        h.update(f"ndarray{value.dtype.str}{value.shape}".encode())
+        h.update(np.ascontiguousarray(value).tobytes() if value.dtype != object else repr(value.tolist()).encode())
+    elif isinstance(value, pd.DataFrame):
+        h.update(f"frame{list(value.columns)}".encode())
+        h.update(pd.util.hash_pandas_object(value, index=False).to_numpy().tobytes())
+    elif isinstance(value, pd.Series):
+        h.update(f"series{value.dtype}".encode())
+        h.update(pd.util.hash_pandas_object(value, index=False).to_numpy().tobytes())
+    elif isinstance(value, dict):
+        h.update(b"dict")
+        for k in sorted(value, key=repr):
+            _update(h, k)
+            _update(h, value[k])
+    elif isinstance(value, (list, tuple)):
+        h.update(f"{type(value).__name__}{len(value)}".encode())
+        for item in value:
+            _update(h, item)
+    elif callable(value):
+        _update_function(h, value)
+    else:
+        h.update(f"{type(value).__name__}:{value!r}".encode())
+
+
+def _update_code(h, code):
+    h.update(code.co_code)
+    h.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        if hasattr(const, "co_code"):
+            _update_code(h, const)
+        else:
+            h.update(repr(const).encode())
+
+
+def _update_state(h, obj):
+    """Hashes an object by its class and public attributes."""
+    _update(h, type(obj).__qualname__)
+    _update(h, {k: v for k, v in vars(obj).items() if not k.startswith("_")} if hasattr(obj, "__dict__") else ())
+
+
+def _update_function(h, func, selector=None):
+    """
+    Hashes a function by its qualified name, code, defaults and closure values. A bound method
+    is also hashed by its instance's state, unless the instance is `selector` (whose state is
+    in its `_cache_params()`).
+    """
+    if isinstance(func, types.MethodType):
+        if func.__self__ is not selector:
+            _update_state(h, func.__self__)
+        func = func.__func__
+    h.update(f"{getattr(func, '__module__', '')}.{getattr(func, '__qualname__', type(func).__name__)}".encode())
+    code = getattr(func, "__code__", None)
+    if code is None:
+        # Callable objects: hash their class and attributes
+        _update_state(h, func)
+        return
+    _update_code(h, code)
+    _update(h, func.__defaults__ or ())
+    _update(h, func.__kwdefaults__ or {})
+    for cell in func.__closure__ or ():
+        _update(h, cell.cell_contents)
+
+
+def _is_own_method(func, selector) -> bool:
+    """Whether `func` is a method of `selector` defined outside this package."""
+    if not isinstance(func, types.MethodType) or func.__self__ is not selector:
+        return False
+    return not func.__func__.__module__.startswith(f"{__name__.split('.')[0]}.")
+
+
+def selection_key(selector):
+    """
+    The content hash identifying `selector`'s solution (see the module docstring), or None when
+    its objective or a constraint is a method of the selector defined outside this package.
+    """
+    functions = [selector.objective_func, *selector.custom_constraints]
+    if any(_is_own_method(func, selector) for func in functions):
+        # It may read any attribute of the selector, which `_cache_params()` does not cover
+        return None
+    h = hashlib.blake2b(digest_size=20)
+    _update(h, f"{type(selector).__module__}.{type(selector).__qualname__}")
+    _update(h, selector.candidate_df[selector._cache_columns()])
+    _update(h, selector._cache_params())
+    for func in functions:
+        _update_function(h, func, selector)
+    return h.hexdigest()
+
+
+def _entry_size(entry: dict) -> int:
+    return int(entry["values"].nbytes) + 64
+
+
+class MemoryCache:
+    """
+    In-process LRU cache of solutions, bounded by the total size of stored values.
+    Safe to share between selectors in different threads.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 2**20):
+        """
+        :param max_bytes: Evict least recently used entries once stored values exceed this size.
+        """
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: str):
+        """The entry stored under `key` (marking it recently used), or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: str, entry: dict):
+        """Stores an entry: {'values': ndarray, 'status': int, 'objective': float}."""
+        with self._lock:
+            if key in self._entries:
+                self.size -= _entry_size(self._entries.pop(key))
+            self._entries[key] = entry
+            self.size += _entry_size(entry)
+            while self.size > self.max_bytes and len(self._entries) > 1:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= _entry_size(evicted)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+
+class DiskCache:
+    """
+    On-disk cache of solutions, one .npz file per entry. File modification times track
+    recency; once the directory's entries exceed `max_bytes` the oldest are deleted.
+    """
+
+    def __init__(self, directory, max_bytes: int = 256 * 2**20):
+        """
+        :param directory: Directory for cache files (created if missing).
+        :param max_bytes: Evict least recently used files once their total size exceeds this.
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.npz"
+
+    def __len__(self):
+        return sum(1 for _ in self.directory.glob("*.npz"))
+
+    def get(self, key: str):
+        """The entry stored under `key` (marking it recently used), or None."""
+        path = self._path(key)
+        try:
+            with np.load(path) as data:
+                objective = float(data["objective"])
+                entry = {
+                    "values": data["values"],
+                    "status": int(data["status"]),
+                    "objective": None if np.isnan(objective) else objective,
+                }
+            os.utime(path)
+        except (OSError, KeyError, ValueError):
+            return None
+        return entry
+
+    def put(self, key: str, entry: dict):
+        """Stores an entry: {'values': ndarray, 'status': int, 'objective': float}."""
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            objective = np.nan if entry["objective"] is None else entry["objective"]
+            np.savez(f, values=entry["values"], status=entry["status"], objective=objective)
+        os.replace(tmp, self._path(key))  # atomic, so readers never see partial files
+        self._evict()
+
+    def _evict(self):
+        files = []
+        for path in self.directory.glob("*.npz"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime_ns, stat.st_size, path))
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files)[:-1]:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self):
+        for path in self.directory.glob("*.npz"):
+            path.unlink(missing_ok=True)
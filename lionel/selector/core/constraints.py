@@ -1,38 +1,194 @@
-# TODO: Add common constraints that can be used by all selectors
+"""
+Common constraints that can be used by all selectors.
+
+Each constraint is a callable with the `add_constraint` signature, so it can be passed
+straight to a selector:
+
+    selector.add_constraint(CountConstraint(eq=15, name="size"))
+    selector.add_constraint(CountConstraint(by="team", max=3))
+    selector.add_constraint(CountConstraint(by="position", min={"GK": 1, "DEF": 3}, max={"GK": 1, "DEF": 5}))
+    selector.add_constraint(SumConstraint("price", max=1000, name="budget"))
+    selector.add_constraint(ForceConstraint(include=["Salah"], exclude=["Haaland"]))
+
+Constraints compile against the candidate frame into sparse rows (`rows()`): the `by` column
+is factorized once into a group index, and every row is the integer positions of its group
+with their coefficients. The PuLP constraints are then built directly from those arrays,
+one expression per group, rather than by scanning the frame per group. A constraint keeps
+the group index of the last frame it was called with, so a selector that holds it reuses the
+index on every rebuild.
+"""
 
 from abc import ABC, abstractmethod
+from collections import namedtuple
 
+import numpy as np
+import pandas as pd
 import pulp
 
+from .expressions import group_positions, linear_constraint
+
+Row = namedtuple("Row", ["positions", "coefficients", "sense", "rhs", "name"])
+Row.__doc__ = """
+A sparse constraint row: sum(coefficients * x[positions]) <sense> rhs.
+`coefficients` is None when every coefficient is 1.
+"""
+
 
 class Constraint(ABC):
-    pass
+    """
+    Base class for library constraints. Subclasses implement `rows()`; calling the constraint
+    with (candidate_df, decision_vars) returns the PuLP constraints for those rows.
+    """
 
+    @abstractmethod
+    def rows(self, candidate_df) -> list:
+        """Compiles the constraint against candidate_df into a list of Row."""
 
-class CountConstraint(Constraint):
-    def __init__(self, candidate_df, decision_vars, required_count):
-        self.candidate_df = candidate_df
-        self.decision_vars = decision_vars
-        self.required_count = required_count
+    def __call__(self, candidate_df, decision_vars) -> list:
+        return [
+            linear_constraint(
+                [decision_vars[i] for i in row.positions.tolist()],
+                row.sense,
+                row.rhs,
+                coefficients=row.coefficients,
+                name=row.name,
+            )
+            for row in self.rows(candidate_df)
+        ]
 
-    def less_than(self, max_count):
-        return pulp.lpSum(self.decision_vars) <= max_count
 
-    def greater_than(self, min_count):
-        return pulp.lpSum(self.decision_vars) >= min_count
+def _row_mask(candidate_df, where):
+    """Boolean array for `where` (None, a column name, or an array-like aligned with the rows)."""
+    if where is None:
+        return None
+    values = candidate_df[where] if isinstance(where, str) else where
+    mask = np.asarray(values, dtype=bool)
+    if mask.shape != (len(candidate_df),):
+        raise ValueError("'where' must have one value per candidate row.")
+    return mask
 
-    def equal_to(self, required_count):
-        return pulp.lpSum(self.decision_vars) == required_count
+
+def _bound(bound, label):
+    """The bound for group `label`: scalars apply to every group, dicts per group."""
+    return bound.get(label) if isinstance(bound, dict) else bound
 
 
 class SumConstraint(Constraint):
-    def __init__(self, candidate_df, decision_vars, sum_var):
-        self.candidate_df = candidate_df
-        self.decision_vars = decision_vars
-        self.sum_var = sum_var
+    """
+    Bounds sum(column[i] * x_i), over all candidates or per group of the `by` column.
+
+    :param column: Column with the coefficients (e.g. 'price'), or None to count selections.
+    :param min: Lower bound. A scalar applies to every group; a dict maps group labels to bounds.
+    :param max: Upper bound, as for `min`.
+    :param eq: Exact value, as for `min`. Equal `min` and `max` are also written as one equality row.
+    :param by: Column to group by (e.g. 'team'). None constrains all candidates together.
+    :param where: Only rows where this is true count (column name or boolean array-like).
+    :param name: Name of the row, suffixed with the group label when grouped, so the rhs
+                 can be changed with `selector.set_rhs`.
+
+    With dict bounds, rows are built for every label in the dicts (an absent label gives an
+    empty group) and groups without a bound are unconstrained.
+
+    The `by` groups are computed on the first call with a frame and reused while the constraint
+    is called with that same frame, so changing the `by` column in place is not picked up.
+    """
+
+    def __init__(self, column=None, min=None, max=None, eq=None, by=None, where=None, name=None):
+        if min is None and max is None and eq is None:
+            raise ValueError("At least one of 'min', 'max' or 'eq' is required.")
+        if eq is not None and (min is not None or max is not None):
+            raise ValueError("'eq' cannot be combined with 'min' or 'max'.")
+        if by is None and any(isinstance(b, dict) for b in (min, max, eq)):
+            raise ValueError("Per-group bounds need a 'by' column.")
+        self.column = column
+        self.min = min
+        self.max = max
+        self.eq = eq
+        self.by = by
+        self.where = where
+        self.name = name
+        # (frame, groups) of the last frame the `by` groups were computed for, kept as one
+        # tuple so a constraint shared between threads never pairs a frame with other groups
+        self._by_groups = (None, None)
+
+    def _groups(self, candidate_df, mask):
+        """Label -> integer positions of the rows in each group (one factorize for all groups)."""
+        if self.by is None:
+            positions = np.arange(len(candidate_df)) if mask is None else np.flatnonzero(mask)
+            return {None: positions}
+        frame, groups = self._by_groups
+        if candidate_df is not frame:
+            column = candidate_df[self.by]
+            # Categorical columns (e.g. from a CandidatePool) are grouped by their codes
+            values = column.array if isinstance(column.dtype, pd.CategoricalDtype) else column.to_numpy()
+            groups = group_positions(values)
+            self._by_groups = (candidate_df, groups)
+        if mask is not None:
+            groups = {label: positions[mask[positions]] for label, positions in groups.items()}
+            groups = {label: positions for label, positions in groups.items() if len(positions)}
+
+        bounds = [b for b in (self.min, self.max, self.eq) if isinstance(b, dict)]
+        if not bounds:
+            return groups
+        labels = list(dict.fromkeys(label for b in bounds for label in b))
+        return {label: groups.get(label, np.array([], dtype=int)) for label in labels}
+
+    def rows(self, candidate_df) -> list:
+        mask = _row_mask(candidate_df, self.where)
+        coefficients = None if self.column is None else candidate_df[self.column].to_numpy(dtype=float)
+        rows = []
+        for label, positions in self._groups(candidate_df, mask).items():
+            coefs = None if coefficients is None else coefficients[positions]
+            name = self.name if label is None or self.name is None else f"{self.name}_{label}"
+            low, high = _bound(self.min, label), _bound(self.max, label)
+            eq = _bound(self.eq, label)
+            if eq is None and low is not None and low == high:
+                eq = low
+            if eq is not None:
+                rows.append(Row(positions, coefs, pulp.LpConstraintEQ, eq, name))
+                continue
+            both = name is not None and low is not None and high is not None
+            if low is not None:
+                rows.append(Row(positions, coefs, pulp.LpConstraintGE, low, f"{name}_min" if both else name))
+            if high is not None:
+                rows.append(Row(positions, coefs, pulp.LpConstraintLE, high, f"{name}_max" if both else name))
+        return rows
+
+
+class CountConstraint(SumConstraint):
+    """
+    Bounds the number of selected candidates, overall or per group of the `by` column
+    (e.g. per-team caps, per-position bounds). See SumConstraint for the arguments.
+    """
+
+    def __init__(self, min=None, max=None, eq=None, by=None, where=None, name=None):
+        super().__init__(None, min=min, max=max, eq=eq, by=by, where=where, name=name)
+
+
+class ForceConstraint(Constraint):
+    """
+    Forces candidates in or out of the selection with one row each:
+    sum(x[include]) = len(include) and sum(x[exclude]) = 0.
+
+    :param include: Index labels of candidates that must be selected.
+    :param exclude: Index labels of candidates that must not be selected.
+    :param name: Rows are named '<name>_in' and '<name>_out'.
+    """
 
-    def less_than(self, max_sum):
-        return pulp.lpSum(self.decision_vars * self.candidate_df[self.sum_var]) <= max_sum
+    def __init__(self, include=(), exclude=(), name=None):
+        self.include = list(dict.fromkeys(include))
+        self.exclude = list(dict.fromkeys(exclude))
+        self.name = name
 
-    def greater_than(self, min_sum):
-        return pulp.lpSum(self.decision_vars * self.candidate_df[self.sum_var]) >= min_sum
+    def rows(self, candidate_df) -> list:
+        rows = []
+        for labels, suffix, rhs in [(self.include, "in", len(self.include)), (self.exclude, "out", 0)]:
+            if not labels:
+                continue
+            positions = candidate_df.index.get_indexer(labels)
+            if (positions < 0).any():
+                missing = [label for label, pos in zip(labels, positions) if pos < 0]
+                raise ValueError(f"Candidates not found in candidate_df: {missing}")
+            name = None if self.name is None else f"{self.name}_{suffix}"
+            rows.append(Row(positions, None, pulp.LpConstraintEQ, rhs, name))
+        return rows
@@ -0,0 +1,52 @@
+"""
+Helpers for building PuLP expressions in bulk from NumPy arrays.
+
+Building expressions with `pulp.lpSum(var * df.iloc[i][col] ...)` costs a pandas
+row lookup and a temporary expression per term. The helpers here build each
+expression in a single pass from column arrays instead.
+"""
+
+import numpy as np
+import pandas as pd
+import pulp
+
+
+def linear_expression(variables, coefficients=None, constant: float = 0.0) -> pulp.LpAffineExpression:
+    """
+    Build sum(coefficients[i] * variables[i]) + constant as a single LpAffineExpression.
+
+    :param variables: Sequence of PuLP variables.
+    :param coefficients: Array-like of coefficients aligned with `variables`.
+                         Defaults to 1 for every variable.
+    :param constant: Constant term of the expression.
+    """
+    if coefficients is None:
+        return pulp.LpAffineExpression([(var, 1) for var in variables], constant=constant)
+    coefficients = np.asarray(coefficients, dtype=float).tolist()
+    if len(coefficients) != len(variables):
+        raise ValueError(f"Got {len(coefficients)} coefficients for {len(variables)} variables.")
+    return pulp.LpAffineExpression(zip(variables, coefficients), constant=constant)
+
+
+def linear_constraint(variables, sense: int, rhs: float, coefficients=None, name: str = None) -> pulp.LpConstraint:
+    """
+    Build sum(coefficients[i] * variables[i]) <sense> rhs without intermediate expressions.
+
+    :param sense: One of pulp.LpConstraintLE, pulp.LpConstraintGE or pulp.LpConstraintEQ.
+    """
+    return pulp.LpConstraint(linear_expression(variables, coefficients), sense=sense, rhs=rhs, name=name)
+
+
+def group_positions(values) -> dict:
+    """
+    Map each distinct value to the integer positions at which it occurs.
+
+    Groups are returned in order of first appearance, matching `pd.unique`.
+    Runs in a single factorize + stable argsort rather than one scan per group.
+    Categorical values are factorized from their codes.
+    """
+    values = values if isinstance(values, pd.Categorical) else np.asarray(values)
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    order = np.argsort(codes, kind="stable")
+    bounds = np.cumsum(np.bincount(codes, minlength=len(uniques)))[:-1]
+    return dict(zip(uniques.tolist(), np.split(order, bounds)))
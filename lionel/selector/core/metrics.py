@@ -0,0 +1,76 @@
+"""
+Per-solve statistics for selectors.
+
+Every `select()` records a SolveStats on the selector (`selector.stats`) and passes it
+to metrics hooks, so timings can be exported to monitoring:
+
+    from lionel.selector.core.metrics import add_metrics_hook
+
+    add_metrics_hook(lambda selector, stats: statsd.timing("selector.solve", stats.timings["solve"]))
+
+Hooks added with `add_metrics_hook` run for every selector; `selector.add_metrics_hook`
+adds one for a single selector. Hooks are called as hook(selector, stats).
+
+Timing phases (seconds):
+    - constraints: running the objective and constraint functions and adding them to the problem
+    - write: handing the problem to the solver (MPS file for CBC, matrix extraction/update in-process)
+    - solve: the solver run
+    - read: reading the solution back onto the variables and extracting the selection
+    - total: the whole `select()` call up to the selection (subclass post-processing excluded)
+"""
+
+from dataclasses import asdict, dataclass, field
+
+import pulp
+
+PHASES = ("constraints", "write", "solve", "read")
+
+_HOOKS = []
+
+
+@dataclass
+class SolveStats:
+    """
+    Statistics of one `select()` call. Solver-reported values (gap, best_bound, nodes) are None
+    when the backend does not report them or the solution came from the cache.
+    """
+
+    backend: str
+    status: int
+    objective: float = None
+    gap: float = None
+    best_bound: float = None
+    nodes: int = None
+    num_variables: int = None
+    num_constraints: int = None
+    num_nonzeros: int = None
+    cache_hit: bool = False
+    timings: dict = field(default_factory=dict)
+
+    @property
+    def status_name(self) -> str:
+        return pulp.LpStatus.get(self.status, "Undefined")
+
+    def as_dict(self) -> dict:
+        """Flat dict for exporting, with timings as 'time_<phase>' keys."""
+        stats = asdict(self)
+        timings = stats.pop("timings")
+        stats["status_name"] = self.status_name
+        stats.update({f"time_{phase}": seconds for phase, seconds in timings.items()})
+        return stats
+
+
+def add_metrics_hook(hook):
+    """Registers hook(selector, stats), called after every selector solve."""
+    _HOOKS.append(hook)
+
+
+def remove_metrics_hook(hook):
+    """Unregisters a hook added with `add_metrics_hook`."""
+    _HOOKS.remove(hook)
+
+
+def emit(selector, stats: SolveStats):
+    """Calls the global hooks, then the selector's own hooks."""
+    for hook in list(_HOOKS) + list(selector.metrics_hooks):
+        hook(selector, stats)
@@ -1,21 +1,204 @@
-# TODO: Add common objectives that can be used by all selectors
+"""
+Common objectives that can be used by all selectors, including risk-aware objectives
+over posterior draws of player points.
+
+Each objective is a callable with the `set_objective_function` signature. Objectives
+that need auxiliary variables and constraints (CVaR, probability of exceeding a
+threshold) are attached with `apply`, which also counts captains twice on selectors
+that have `captain_vars` (XVSelector and subclasses):
+
+    draws = model.predict_posterior(X_pred)["points_pred"]  # (n_players, n_samples)
+    CVaRObjective(draws, alpha=0.2).apply(selector)
+    selector.select()
+
+Draws are a (n_players, n_samples) array-like aligned with the rows of candidate_df, or a
+DataFrame indexed like candidate_df (needed when the selector prunes candidates).
+
+Size: mean-SD reduces the draws to per-player moments, so the problem is as small as a
+mean objective whatever the number of draws. CVaR and probability objectives add one
+row with a term per player for each draw, so they use at most `max_draws` draws,
+subsampled without replacement.
+"""
 
 from abc import ABC, abstractmethod
 
+import numpy as np
+import pandas as pd
 import pulp
 
+from .expressions import linear_constraint, linear_expression
+
 
 class Objective(ABC):
-    pass
+    """
+    Base class for library objectives. Calling the objective with (candidate_df, decision_vars)
+    returns the expression to maximize; `constraints` returns any auxiliary constraints.
+    """
+
+    # Set by apply(): captain variables counted as a second copy of the player's points
+    _captain_vars = None
+
+    @abstractmethod
+    def __call__(self, candidate_df, decision_vars):
+        """The expression to maximize."""
+
+    def constraints(self, candidate_df, decision_vars) -> list:
+        """Auxiliary constraints the objective needs (none by default)."""
+        return []
+
+    def apply(self, selector, captain: bool = True):
+        """
+        Sets this objective (and its auxiliary constraints) on `selector`.
+        An objective with auxiliary variables belongs to a single selector.
+        :param captain: Count points of selectors with `captain_vars` twice for the captain.
+        """
+        self._captain_vars = getattr(selector, "captain_vars", None) if captain else None
+        selector.set_objective_function(self)
+        if type(self).constraints is not Objective.constraints:
+            selector.add_constraint(self.constraints)
+        return selector
+
+    def _team(self, decision_vars):
+        """Variables that score points and the candidate row each one scores for."""
+        rows = np.arange(len(decision_vars))
+        if self._captain_vars is None:
+            return list(decision_vars), rows
+        return list(decision_vars) + list(self._captain_vars), np.concatenate([rows, rows])
 
 
 class DefaultObjective(Objective):
-    def __init__(self, candidate_df, decision_vars, pred_var):
-        self.candidate_df = candidate_df
-        self.decision_vars = decision_vars
+    """Maximize the sum of pred_var over the selected candidates."""
+
+    def __init__(self, pred_var: str = "predicted_points"):
         self.pred_var = pred_var
 
-    def __call__(self):
-        return pulp.lpSum(
-            self.decision_vars[i] * self.candidate_df.iloc[i][self.pred_var] for i in range(self.num_players)
-        )
+    def __call__(self, candidate_df, decision_vars):
+        variables, rows = self._team(decision_vars)
+        return linear_expression(variables, candidate_df[self.pred_var].to_numpy(dtype=float)[rows])
+
+
+class _DrawsObjective(Objective):
+    """Objectives over posterior draws, aligned with candidate_df at build time."""
+
+    def __init__(self, draws, max_draws: int = None, seed: int = 0):
+        self.index = np.asarray(draws.index) if isinstance(draws, pd.DataFrame) else None
+        points = np.asarray(draws, dtype=float)
+        if points.ndim != 2:
+            raise ValueError("draws must have shape (n_players, n_samples).")
+        if max_draws is not None and points.shape[1] > max_draws:
+            keep = np.sort(np.random.default_rng(seed).choice(points.shape[1], size=max_draws, replace=False))
+            points = points[:, keep]
+        self.points = np.ascontiguousarray(points)
+
+    @property
+    def n_draws(self) -> int:
+        return self.points.shape[1]
+
+    def _aligned(self, candidate_df) -> np.ndarray:
+        """Rows of `points` for the candidates in candidate_df."""
+        if self.index is None:
+            if len(self.points) != len(candidate_df):
+                raise ValueError(
+                    f"draws have {len(self.points)} rows but candidate_df has {len(candidate_df)}; "
+                    "pass draws as a DataFrame indexed like candidate_df."
+                )
+            return self.points
+        positions = pd.Index(self.index).get_indexer(candidate_df.index)
+        if (positions < 0).any():
+            raise ValueError("draws have no rows for some candidates.")
+        return self.points[positions]
+
+    def _scenario_points(self, candidate_df, decision_vars):
+        """Team variables and their points per draw, shape (n_variables, n_draws)."""
+        variables, rows = self._team(decision_vars)
+        return variables, self._aligned(candidate_df)[rows]
+
+
+class MeanStdObjective(_DrawsObjective):
+    """
+    Maximize sum_i x_i * (mean_i - risk_aversion * sd_i) over the draws.
+
+    The penalty is the SD of the team's points if player scores were perfectly correlated,
+    an upper bound on the true SD that keeps the objective linear.
+    """
+
+    def __init__(self, draws, risk_aversion: float = 1.0):
+        super().__init__(draws)
+        self.risk_aversion = risk_aversion
+        # Only the moments are needed; keep those instead of the draws
+        self.points = self.points.mean(axis=1, keepdims=True) - risk_aversion * self.points.std(axis=1, keepdims=True)
+
+    def __call__(self, candidate_df, decision_vars):
+        variables, points = self._scenario_points(candidate_df, decision_vars)
+        return linear_expression(variables, points[:, 0])
+
+
+class CVaRObjective(_DrawsObjective):
+    """
+    Maximize the conditional value at risk of team points: the mean of the worst
+    `alpha` fraction of draws. Sample-average linearization (Rockafellar-Uryasev):
+
+        maximize eta - 1 / (alpha * S) * sum_s u_s
+        subject to u_s >= eta - sum_i x_i * points[i, s],  u_s >= 0
+
+    :param alpha: Tail fraction, in (0, 1]. alpha=1 is the mean over the draws.
+    :param max_draws: Number of draws S used (subsampled without replacement).
+    """
+
+    def __init__(self, draws, alpha: float = 0.2, max_draws: int = 100, seed: int = 0):
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must be in (0, 1].")
+        super().__init__(draws, max_draws=max_draws, seed=seed)
+        self.alpha = alpha
+        self._eta = pulp.LpVariable("cvar_eta")
+        self._shortfall = [pulp.LpVariable(f"cvar_u_{s}", lowBound=0) for s in range(self.n_draws)]
+
+    def __call__(self, candidate_df, decision_vars):
+        weight = -1.0 / (self.alpha * self.n_draws)
+        return linear_expression([self._eta] + self._shortfall, [1.0] + [weight] * self.n_draws)
+
+    def constraints(self, candidate_df, decision_vars):
+        """u_s - eta + sum_i x_i * points[i, s] >= 0 for each draw s."""
+        variables, points = self._scenario_points(candidate_df, decision_vars)
+        extra = np.array([1.0, -1.0])
+        return [
+            linear_constraint(variables + [u, self._eta], pulp.LpConstraintGE, 0, np.concatenate([column, extra]))
+            for u, column in zip(self._shortfall, points.T)
+        ]
+
+
+class ThresholdObjective(_DrawsObjective):
+    """
+    Maximize the probability that team points reach `threshold`, estimated over the draws:
+
+        maximize 1/S * sum_s z_s
+        subject to sum_i x_i * points[i, s] >= threshold * z_s + L_s * (1 - z_s),  z_s binary
+
+    L_s is a lower bound on team points in draw s: `min_points` if given, otherwise the
+    sum of every negative score in the draw (valid for any selection, but loose when
+    draws have many negative values). With a binary per draw this is much harder to solve
+    than the other objectives; use fewer draws, `min_points` and a solver time limit.
+
+    :param max_draws: Number of draws S used (subsampled without replacement).
+    """
+
+    def __init__(self, draws, threshold: float, max_draws: int = 100, seed: int = 0, min_points: float = None):
+        super().__init__(draws, max_draws=max_draws, seed=seed)
+        self.threshold = threshold
+        self.min_points = min_points
+        self._reached = [pulp.LpVariable(f"reach_{s}", cat=pulp.LpBinary) for s in range(self.n_draws)]
+
+    def __call__(self, candidate_df, decision_vars):
+        return linear_expression(self._reached, np.full(self.n_draws, 1.0 / self.n_draws))
+
+    def constraints(self, candidate_df, decision_vars):
+        """sum_i x_i * points[i, s] - (threshold - L_s) * z_s >= L_s for each draw s."""
+        variables, points = self._scenario_points(candidate_df, decision_vars)
+        if self.min_points is None:
+            lower = np.minimum(points, 0).sum(axis=0)
+        else:
+            lower = np.full(self.n_draws, float(self.min_points))
+        return [
+            linear_constraint(variables + [z], pulp.LpConstraintGE, low, np.append(column, low - self.threshold))
+            for z, column, low in zip(self._reached, points.T, lower.tolist())
+        ]
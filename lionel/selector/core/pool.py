@@ -0,0 +1,140 @@
+"""
+Columnar candidate pools shared across selectors.
+
+A selector built from a DataFrame copies it and marks its selection ('xv', 'captain', 'xi',
+...) in that copy, so every selector holds its own frame. A CandidatePool is built once, e.g.
+per gameweek, and shared without copying instead. It holds:
+
+    - numeric columns (price, points, ...) as contiguous read-only arrays;
+    - other columns (team, position, ...) as integer codes with their labels, and the rows of
+      each label as offsets into one stable ordering of the rows;
+    - the stable id index of the rows (the frame's index).
+
+Every selector accepts a pool in place of candidate_df. It reads `pool.frame`, a DataFrame
+over the same arrays built once per pool, so nothing is copied per selector, and `select()`
+returns a Selection of boolean masks over the pool's rows instead of marking a frame:
+
+    pool = CandidatePool.from_frame(candidate_df)
+    selection = XVSelector(pool, budget=1000).select()
+    pool.ids[selection.mask]                # the squad
+    pool.ids[selection.flags["captain"]]    # the captain
+"""
+
+import copy
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+
+class Selection(NamedTuple):
+    """
+    A selection from a CandidatePool, as arrays over the pool's rows.
+
+    `mask` marks the selected rows. `flags` holds the markers a selector would write as
+    columns of a frame (e.g. 'xv' and 'captain' masks, 'bench' slots).
+    """
+
+    mask: np.ndarray
+    flags: dict
+    objective: float
+
+    @property
+    def positions(self) -> np.ndarray:
+        """Row positions of the selected candidates."""
+        return np.flatnonzero(self.mask)
+
+
+def _read_only(values: np.ndarray) -> np.ndarray:
+    values = np.ascontiguousarray(values)
+    values.setflags(write=False)
+    return values
+
+
+class CandidatePool:
+    """
+    Candidate columns as contiguous arrays, built once and shared by selectors without copying.
+    Build one with `CandidatePool.from_frame`.
+
+    :param ids: Row ids (pd.Index), e.g. player ids.
+    :param columns: Column name -> array of values, one per row. Numeric and boolean arrays
+                    are kept as they are; any other column is stored as codes and labels.
+    """
+
+    def __init__(self, ids, columns: dict):
+        self.ids = pd.Index(ids)
+        self._values, self._categoricals, self._order, self._offsets = {}, {}, {}, {}
+        for name, values in columns.items():
+            self._add_column(name, values)
+        self.columns = pd.Index(list(columns))
+        self.frame = self._build_frame()
+
+    @classmethod
+    def from_frame(cls, candidate_df: pd.DataFrame) -> "CandidatePool":
+        """A pool of every column of candidate_df, with its index as the ids."""
+        return cls(candidate_df.index, {name: candidate_df[name].to_numpy() for name in candidate_df.columns})
+
+    def _add_column(self, name, values):
+        """
+        Stores a column: numeric and boolean values as they are, others as codes (in order of
+        first appearance, -1 where missing) with the rows of code k at order[offsets[k]:offsets[k + 1]].
+        """
+        values = np.asarray(values)
+        if len(values) != len(self.ids):
+            raise ValueError(f"Column '{name}' has {len(values)} values for {len(self.ids)} rows.")
+        if values.dtype.kind in "biuf":
+            self._values[name] = _read_only(values)
+            return
+        codes, labels = pd.factorize(values)
+        categorical = pd.Categorical.from_codes(codes, dtype=pd.CategoricalDtype(labels))
+        order = np.argsort(categorical.codes, kind="stable")
+        self._categoricals[name] = categorical
+        self._order[name] = _read_only(order)
+        self._offsets[name] = _read_only(np.searchsorted(categorical.codes[order], np.arange(len(labels) + 1)))
+
+    def _build_frame(self) -> pd.DataFrame:
+        """A DataFrame over the pool's arrays; coded columns are categoricals."""
+        data = {name: self._values.get(name, self._categoricals.get(name)) for name in self.columns}
+        return pd.DataFrame(data, index=self.ids, copy=False)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, name: str) -> pd.Series:
+        """A column of `frame`, so a pool can be read like candidate_df."""
+        return self.frame[name]
+
+    def values(self, name: str) -> np.ndarray:
+        """The array of a numeric column, or the labels of a coded column, one per row."""
+        if name in self._values:
+            return self._values[name]
+        return np.asarray(self.frame[name])
+
+    def codes(self, name: str):
+        """(codes, labels) of a coded column: row i has label labels[codes[i]] (-1 if missing)."""
+        categorical = self._categoricals[name]
+        return categorical.codes, categorical.categories
+
+    def groups(self, name: str) -> dict:
+        """Label -> row positions with that label in a coded column, labels in order of first appearance."""
+        order, offsets = self._order[name], self._offsets[name]
+        labels = self._categoricals[name].categories
+        return {label: order[offsets[k] : offsets[k + 1]] for k, label in enumerate(labels)}
+
+    def take(self, positions) -> "CandidatePool":
+        """A new pool of the rows at `positions`."""
+        positions = np.asarray(positions, dtype=int)
+        return CandidatePool(self.ids[positions], {name: self.values(name)[positions] for name in self.columns})
+
+    def with_column(self, name: str, values) -> "CandidatePool":
+        """
+        A new pool with column `name` added or replaced (e.g. another gameweek's predictions).
+        The other columns are shared with this pool, not copied.
+        """
+        pool = copy.copy(self)
+        for store in ("_values", "_categoricals", "_order", "_offsets"):
+            setattr(pool, store, {key: value for key, value in getattr(self, store).items() if key != name})
+        pool._add_column(name, values)
+        pool.columns = self.columns if name in self.columns else self.columns.append(pd.Index([name]))
+        pool.frame = pool._build_frame()
+        return pool
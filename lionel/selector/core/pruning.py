@@ -0,0 +1,98 @@
+"""
+Dominance-based candidate pruning for squad selection problems.
+
+Candidate j dominates candidate p (same group, e.g. position) when j costs no more
+and scores at least as much, with ties broken by row order so the relation is a
+strict partial order.
+
+p can be dropped without losing optimality if, in any feasible squad containing p,
+some unselected dominator j could replace it. Swapping p -> j keeps the group
+counts, does not raise the cost, does not lower the score (j also takes over the
+captaincy if p had it) and keeps team counts valid as long as j's team is p's team
+or is not full. With a group quota of k, at most k - 1 dominators are selected
+alongside p, and at most (squad_size - 1) // max_per_team other teams can be full.
+So p is dropped when
+
+    #dominators on p's team + #dominators on other teams, excluding the
+    (squad_size - 1) // max_per_team teams with the most dominators  >=  k
+
+Repeating such swaps only moves along the strict partial order, so it terminates
+with an optimal squad that contains no dropped candidate.
+
+The argument only covers group quotas, a per-team cap, a budget and a points
+(+ captain) objective. Rows that other constraints single out must be `protected`.
+"""
+
+import numpy as np
+import pandas as pd
+
+BLOCK_SIZE = 512
+
+
+def dominated_mask(
+    points,
+    price,
+    groups,
+    teams,
+    quotas: dict,
+    max_per_team: int,
+    squad_size: int = None,
+    protected=None,
+) -> np.ndarray:
+    """
+    Flags candidates that can be removed without changing the optimal objective.
+
+    :param points: Objective value per candidate.
+    :param price: Cost per candidate.
+    :param groups: Group label per candidate (e.g. position); quotas are looked up by label.
+    :param teams: Team label per candidate.
+    :param quotas: Number selected per group, e.g. XVSelector.POS_CONSTRAINTS.
+    :param max_per_team: Maximum selected per team.
+    :param squad_size: Total selected. Defaults to sum(quotas.values()).
+    :param protected: Optional boolean array of rows that must never be removed.
+                      Protected rows still count as dominators.
+    :return: Boolean array, True where the candidate can be removed.
+    """
+    points = np.asarray(points, dtype=float)
+    price = np.asarray(price, dtype=float)
+    squad_size = sum(quotas.values()) if squad_size is None else squad_size
+    blockable = (squad_size - 1) // max_per_team
+    team_codes, team_labels = pd.factorize(np.asarray(teams), use_na_sentinel=False)
+    groups = np.asarray(groups)
+
+    mask = np.zeros(len(points), dtype=bool)
+    for group, quota in quotas.items():
+        members = np.flatnonzero(groups == group)
+        if len(members) <= quota:
+            continue
+        m_points, m_price = points[members], price[members]
+        m_teams = team_codes[members]
+        team_onehot = np.zeros((len(members), len(team_labels)), dtype=np.int32)
+        team_onehot[np.arange(len(members)), m_teams] = 1
+
+        for start in range(0, len(members), BLOCK_SIZE):
+            rows = np.arange(start, min(start + BLOCK_SIZE, len(members)))
+            p_points, p_price = m_points[rows, None], m_price[rows, None]
+            dominates = (
+                (m_price[None, :] <= p_price)
+                & (m_points[None, :] >= p_points)
+                & (
+                    (m_price[None, :] < p_price)
+                    | (m_points[None, :] > p_points)
+                    | (np.arange(len(members))[None, :] < rows[:, None])
+                )
+            )
+            candidates = dominates.sum(axis=1) >= quota
+            if not candidates.any():
+                continue
+            rows, dominates = rows[candidates], dominates[candidates]
+            per_team = dominates.astype(np.int32) @ team_onehot  # (rows, teams)
+            same_team = per_team[np.arange(len(rows)), m_teams[rows]].copy()
+            per_team[np.arange(len(rows)), m_teams[rows]] = 0
+            if blockable:
+                per_team = np.sort(per_team, axis=1)[:, : max(per_team.shape[1] - blockable, 0)]
+            mask[members[rows]] = same_team + per_team.sum(axis=1) >= quota
+
+    if protected is not None:
+        mask &= ~np.asarray(protected, dtype=bool)
+    return mask
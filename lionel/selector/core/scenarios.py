@@ -0,0 +1,205 @@
+"""
+Solve a selector once per posterior draw (scenario) across a process pool.
+
+`HierarchicalPointsModel.predict_posterior` returns draws of 'points_pred' with
+shape (n_players, n_samples). `solve_scenarios` solves a selector for each
+sampled draw and returns how often each candidate was selected.
+
+The candidate pool and the draws are written once to shared memory. Each worker
+attaches to them, builds its selector once and re-solves it per scenario (only the
+objective changes), so tasks carry nothing but scenario indices. With `prune=True`
+the pruned candidates depend on the draw, so a new selector is created per scenario.
+
+Usage:
+    posterior = model.predict_posterior(X_pred)
+    freq = solve_scenarios(XVSelector, candidate_df, posterior["points_pred"],
+                           n_scenarios=500, n_workers=4, seed=0)
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+# Per-process state set by _init_worker in pool workers; in-process runs use their own dict
+_WORKER = {}
+
+
+class _SharedArray:
+    """A NumPy array copied into a shared memory block, described by a picklable spec."""
+
+    def __init__(self, array: np.ndarray):
+        array = np.ascontiguousarray(array)
+        self.shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        self.spec = (self.shm.name, array.shape, array.dtype.str)
+        np.ndarray(array.shape, dtype=array.dtype, buffer=self.shm.buf)[...] = array
+
+    def release(self):
+        self.shm.close()
+        self.shm.unlink()
+
+    @staticmethod
+    def attach(spec):
+        """
+        Attach to a block created by the parent process. Returns (shm, array view).
+        Pool workers share the parent's resource tracker, so attaching does not take ownership.
+        """
+        name, shape, dtype = spec
+        shm = shared_memory.SharedMemory(name=name)
+        return shm, np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+
+
+def _share_frame(candidate_df: pd.DataFrame):
+    """
+    Copies candidate_df's columns into shared memory.
+    Object/categorical columns are stored as integer codes plus their (small) categories.
+    :return: (list of _SharedArray, picklable column spec)
+    """
+    blocks, columns = [], []
+    for col in candidate_df.columns:
+        values = candidate_df[col]
+        if pd.api.types.is_numeric_dtype(values) or pd.api.types.is_bool_dtype(values):
+            block, categories = _SharedArray(values.to_numpy()), None
+        else:
+            codes, categories = pd.factorize(values, use_na_sentinel=False)
+            block, categories = _SharedArray(codes), np.asarray(categories, dtype=object)
+        blocks.append(block)
+        columns.append((col, block.spec, categories))
+    return blocks, columns
+
+
+def _setup_worker(selector_cls, candidate_df, draws, pred_var, selector_kwargs, state=_WORKER):
+    """Builds this process's selector once; scenarios only swap its objective."""
+    candidate_df[pred_var] = draws[:, 0].astype(float)
+    selector = None
+    if not selector_kwargs.get("prune"):
+        # Pruning depends on the predictions, so pruned selectors are created per scenario instead
+        selector = selector_cls(candidate_df, pred_var=pred_var, **selector_kwargs)
+    state.update(
+        selector_cls=selector_cls,
+        candidate_df=candidate_df,
+        selector_kwargs=selector_kwargs,
+        draws=draws,
+        pred_var=pred_var,
+        selector=selector,
+    )
+
+
+def _scenario_selector(s, state):
+    """The selector for draw `s`: the worker's selector with its predictions replaced, or a new one."""
+    selector, pred_var, draw = state["selector"], state["pred_var"], state["draws"][:, s].astype(float)
+    if selector is None:
+        candidate_df = state["candidate_df"].assign(**{pred_var: draw})
+        return state["selector_cls"](candidate_df, pred_var=pred_var, **state["selector_kwargs"])
+    if hasattr(selector, "set_predictions"):
+        selector.set_predictions(draw)
+    else:
+        selector.candidate_df[pred_var] = draw
+        selector.update_objective()
+    return selector
+
+
+def _init_worker(selector_cls, columns, draws_spec, pred_var, selector_kwargs):
+    """Pool initializer: attach to the shared pool and draws, then set up the selector."""
+    handles, data = [], {}
+    for col, spec, categories in columns:
+        shm, values = _SharedArray.attach(spec)
+        handles.append(shm)
+        data[col] = values if categories is None else categories[values]
+    shm, draws = _SharedArray.attach(draws_spec)
+    handles.append(shm)
+    _WORKER["handles"] = handles
+    _setup_worker(selector_cls, pd.DataFrame(data), draws, pred_var, selector_kwargs)
+
+
+def _solve_chunk(scenario_idxs, state=_WORKER):
+    """Solves the worker's selector for each draw column in `scenario_idxs`; returns summed selections."""
+    selected = np.zeros(len(state["candidate_df"]))
+    captain = np.zeros(len(state["candidate_df"]))
+    for s in scenario_idxs:
+        selector = _scenario_selector(s, state)
+        # No warm start: the previous scenario's incumbent depends on how scenarios were
+        # chunked, and could otherwise break ties differently for different n_workers
+        selector.select()
+        # Selections of pruned selectors are mapped back onto every candidate
+        selected += selector._source_rows(selector._values(selector.decision_vars) > 0.5)
+        if hasattr(selector, "captain_vars"):
+            captain += selector._source_rows(selector._values(selector.captain_vars) > 0.5)
+    return selected, captain
+
+
+def _as_draws(draws, n_players: int) -> np.ndarray:
+    """Coerces draws (ndarray or xarray.DataArray) to a float array of shape (n_players, n_draws)."""
+    draws = np.asarray(getattr(draws, "values", draws), dtype=float)
+    if draws.ndim != 2 or draws.shape[0] != n_players:
+        raise ValueError(f"draws must have shape (n_players={n_players}, n_draws); got {draws.shape}.")
+    return draws
+
+
+def solve_scenarios(
+    selector_cls,
+    candidate_df: pd.DataFrame,
+    draws,
+    n_scenarios: int = None,
+    n_workers: int = None,
+    seed: int = None,
+    pred_var: str = "predicted_points",
+    chunk_size: int = None,
+    **selector_kwargs,
+) -> pd.DataFrame:
+    """
+    Solves `selector_cls` for many predicted-points scenarios and tabulates selection frequencies.
+
+    :param selector_cls: A selector class taking (candidate_df, pred_var=..., **selector_kwargs),
+                         e.g. XVSelector or XISelector.
+    :param candidate_df: The candidate pool (without the scenario column).
+    :param draws: Array-like of shape (n_players, n_draws), e.g. predict_posterior(...)["points_pred"].
+    :param n_scenarios: Number of draws to solve, sampled with `seed`. Defaults to every draw in order.
+    :param n_workers: Worker processes. Defaults to os.cpu_count(); 1 solves in this process.
+    :param seed: Seed for sampling draws; the same seed gives the same table for any n_workers.
+    :param pred_var: Column name the selector optimizes; filled from the draws.
+    :param chunk_size: Scenarios per task. Defaults to an even split across workers.
+    :return: candidate_df (without pred_var) plus 'selection_frequency' and, for selectors with
+             captains, 'captain_frequency' columns, both in [0, 1]. The number of scenarios
+             solved is in `.attrs["n_scenarios"]`.
+    """
+    draws = _as_draws(draws, len(candidate_df))
+    if n_scenarios is None:
+        scenario_idxs = np.arange(draws.shape[1])
+    else:
+        rng = np.random.default_rng(seed)
+        scenario_idxs = rng.choice(draws.shape[1], size=n_scenarios, replace=n_scenarios > draws.shape[1])
+    # Only the sampled draws are shared; tasks index into that compacted matrix
+    used, scenario_idxs = np.unique(scenario_idxs, return_inverse=True)
+    draws = draws[:, used]
+
+    pool_df = candidate_df.drop(columns=[pred_var], errors="ignore").reset_index(drop=True)
+    n_workers = n_workers or os.cpu_count() or 1
+    chunk_size = chunk_size or max(1, -(-len(scenario_idxs) // n_workers))
+    chunks = [scenario_idxs[i : i + chunk_size] for i in range(0, len(scenario_idxs), chunk_size)]
+
+    if n_workers == 1:
+        state = {}
+        _setup_worker(selector_cls, pool_df, draws, pred_var, selector_kwargs, state)
+        results = [_solve_chunk(chunk, state) for chunk in chunks]
+    else:
+        blocks, columns = _share_frame(pool_df)
+        blocks.append(_SharedArray(draws))
+        initargs = (selector_cls, columns, blocks[-1].spec, pred_var, selector_kwargs)
+        try:
+            with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker, initargs=initargs) as pool:
+                results = list(pool.map(_solve_chunk, chunks))
+        finally:
+            for block in blocks:
+                block.release()
+
+    selected = sum(r[0] for r in results)
+    captain = sum(r[1] for r in results)
+    freq = candidate_df.drop(columns=[pred_var], errors="ignore").copy()
+    freq["selection_frequency"] = selected / len(scenario_idxs)
+    if captain.any():
+        freq["captain_frequency"] = captain / len(scenario_idxs)
+    freq.attrs["n_scenarios"] = len(scenario_idxs)
+    return freq
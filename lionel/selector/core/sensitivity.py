@@ -0,0 +1,237 @@
+"""
+Post-optimal sensitivity of a solved selector: how far each candidate's points can move
+before the candidate enters or leaves the optimal selection.
+
+For a candidate i and a points change d, let V_in(d) be the best objective with i selected
+and V_out the best without it. V_in is convex and piecewise linear in d, with slope equal to
+the number of i's points variables in the solution (2 for an XVSelector captain, else 1):
+
+  - an unselected candidate enters once V_in(p_i + d) exceeds the current optimum;
+  - a selected candidate leaves once V_in(p_i - d) drops below V_out.
+
+V_in is the maximum of one line per selection containing i, so each threshold is the root
+of one of those lines. It is found by Newton steps, one re-solve of the persistent problem per
+step with x_i fixed by its bounds and i's objective coefficients shifted (or, for selectors
+with an exact solver of their own such as XVSelector's, its points shifted); each step moves to
+the root of the best selection's line. A candidate whose slope can't change (always 1 without
+captains) needs a single re-solve, otherwise each step finds a selection with another slope:
+at most one or two more for XVSelector.
+
+Before re-solving, the LP relaxation's reduced costs bound every threshold from below:
+fixing x_i costs the relaxation at least its reduced cost r_i, so the change is at least
+(r_i - (LP - optimum)) / max_slope. With `within`, candidates whose bound already exceeds
+`within` are not re-solved and are reported with that bound and `exact=False`.
+
+Usage:
+    selector.select()
+    sens = selector.sensitivity(within=3)  # thresholds up to 3 points, bounds beyond
+    sens.loc[player_id, "threshold"]       # points at which the player enters/leaves
+"""
+
+import numpy as np
+import pandas as pd
+import pulp
+
+from .solvers import MatrixProblem
+
+# Tolerance on objective values when comparing solutions
+TOLERANCE = 1e-6
+# Newton steps per threshold, as a safeguard; piecewise-linear roots need at most max_slope + 1
+MAX_STEPS = 10
+
+
+def relaxation_costs(problem: pulp.LpProblem, variables: list):
+    """
+    Solves the LP relaxation of `problem` and returns (LP optimum, cost of fixing each of
+    `variables` to 1, cost of fixing each to 0): lower bounds on how much the relaxation's
+    optimum drops, from its reduced costs.
+    """
+    from scipy import sparse
+    from scipy.optimize import linprog
+
+    matrix = MatrixProblem.from_pulp(problem)
+    sign = -1.0 if matrix.maximize else 1.0
+    finite_lower, finite_upper = np.isfinite(matrix.row_lower), np.isfinite(matrix.row_upper)
+    A = matrix.A
+    equal = finite_lower & finite_upper & (matrix.row_lower == matrix.row_upper)
+    upper_rows, lower_rows = finite_upper & ~equal, finite_lower & ~equal
+    A_ub = sparse.vstack([A[upper_rows], -A[lower_rows]], format="csr")
+    b_ub = np.concatenate([matrix.row_upper[upper_rows], -matrix.row_lower[lower_rows]])
+    result = linprog(
+        sign * matrix.c,
+        A_ub=A_ub if len(b_ub) else None,
+        b_ub=b_ub if len(b_ub) else None,
+        A_eq=A[equal] if equal.any() else None,
+        b_eq=matrix.row_lower[equal] if equal.any() else None,
+        bounds=np.column_stack([matrix.col_lower, matrix.col_upper]),
+        method="highs",
+    )
+    if result.status != 0:
+        raise ValueError(f"The LP relaxation could not be solved: {result.message}")
+    optimum = sign * result.fun + matrix.objective_constant
+    # Marginals of the minimized objective w.r.t. the bounds: raising a lower bound by 1 costs
+    # at least lower.marginals, lowering an upper bound by 1 at least -upper.marginals
+    columns = [matrix.columns[var] for var in variables]
+    return optimum, result.lower.marginals[columns], -result.upper.marginals[columns]
+
+
+def _enter_threshold(solve, i, optimum, max_slope, steep_root):
+    """
+    Smallest increase d of an unselected candidate's points at which V_in(d) reaches the
+    optimum. V_in is the maximum of one line per selection containing i, so d is the smallest
+    root of those lines: start from the line of the best selection at d = 0 and move to the
+    root of the line of the best selection at the current d until it is the current d.
+    :param steep_root: Lower bound on the roots of lines with more of i's points variables.
+    :return: (d, number of re-solves); d is inf if i can't be selected.
+    """
+    value, slope = solve(i, 0.0, 1)
+    if value is None:
+        return np.inf, 1
+    change, solves = (optimum - value) / slope, 1
+    if slope >= max_slope or (slope == 1 and steep_root >= change):
+        # No line with at most this slope has an earlier root, nor (by the bound) a steeper one
+        return change, solves
+    for _ in range(MAX_STEPS):
+        value, slope = solve(i, change, 1)
+        solves += 1
+        excess = value - optimum
+        if excess <= TOLERANCE:
+            break
+        change -= excess / slope
+    return change, solves
+
+
+def _leave_threshold(solve, i, optimum, slope, max_slope, flat_value):
+    """
+    Smallest decrease d of a selected candidate's points at which the best selection with it,
+    V_in(-d), falls to the best selection without it: the largest root of the lines of the
+    selections containing i, found from the current selection's line (slope `slope`).
+    :param flat_value: Upper bound on the objective of selections with fewer of i's points variables.
+    :return: (d, number of re-solves); d is inf if there is no selection without i.
+    """
+    target, _ = solve(i, 0.0, 0)
+    if target is None:
+        return np.inf, 1
+    change, solves = (optimum - target) / slope, 1
+    if slope <= 1 or (slope == max_slope and flat_value - target <= change):
+        # Every selection with i loses at least as fast, or (by the bound) reaches the target sooner
+        return change, solves
+    for _ in range(MAX_STEPS):
+        value, slope = solve(i, -change, 1)
+        solves += 1
+        excess = value - target
+        if excess <= TOLERANCE:
+            break
+        change += excess / slope
+    return change, solves
+
+
+def points_sensitivity(selector, positions=None, within: float = None) -> pd.DataFrame:
+    """
+    Points thresholds at which candidates enter or leave the optimal selection.
+    See BaseSelector.sensitivity.
+    """
+    if selector.objective_value is None or selector.problem.status != pulp.LpStatusOptimal:
+        selector.select()
+        if selector.problem.status != pulp.LpStatusOptimal:
+            raise ValueError("Sensitivity needs an optimal selection.")
+    if not selector._built:
+        # Solved without the problem (see BaseSelector._solve_direct); build it for the re-solves
+        selector.build().status = pulp.LpStatusOptimal
+    problem = selector.problem
+    positions = np.arange(selector.num_players) if positions is None else np.atleast_1d(positions)
+    points_vars = selector._points_variables()
+    max_slope = max(len(group) for group in points_vars)
+
+    # Keep the solution so the selector reads as before once the re-solves are done
+    solution_vars = selector._solution_variables()
+    solution = selector._values(solution_vars)
+    optimum, status = selector.objective_value, problem.status
+    chosen = selector._values(selector.decision_vars) > 0.5
+    counts = np.array([sum(var.varValue or 0.0 for var in group) for group in points_vars])
+
+    # One relaxation for every points variable; x_i comes first in each group
+    lp_optimum, costs_in, costs_out = relaxation_costs(problem, [var for group in points_vars for var in group])
+    sizes = np.array([len(group) for group in points_vars])
+    first = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    gap = max(lp_optimum - optimum, 0.0)
+    bounds = np.maximum(np.where(chosen, costs_out[first], costs_in[first]) - gap, 0.0) / max_slope
+    # Selections using more (or fewer) of i's points variables than x_i alone (or all of them)
+    # fix one of the others to 1 (or 0), which costs the relaxation at least its reduced cost
+    steep_root, flat_value = np.zeros(selector.num_players), np.full(selector.num_players, lp_optimum)
+    if max_slope > 1:
+        extra = np.ones(len(costs_in), dtype=bool)
+        extra[first] = False
+        owner = np.repeat(np.arange(selector.num_players), sizes - 1)
+        steep_root, flat_cost = np.full(selector.num_players, np.inf), np.full(selector.num_players, np.inf)
+        np.minimum.at(steep_root, owner, costs_in[extra])
+        np.minimum.at(flat_cost, owner, costs_out[extra])
+        steep_root = np.maximum(steep_root - gap, 0.0) / max_slope
+        flat_value = lp_optimum - flat_cost
+
+    pred_var = getattr(selector, "pred_var", None)
+    column = selector.candidate_df.columns.get_loc(pred_var) if pred_var in selector.candidate_df.columns else None
+    index = {var: k for k, var in enumerate(solution_vars)}
+    points_idx = [[index.get(var) for var in group] for group in points_vars]
+
+    def solve(i, delta, fix):
+        """Best objective with x_i fixed to `fix` and i's coefficients shifted by delta, and i's slope."""
+        var = selector.decision_vars[i]
+        saved = var.lowBound, var.upBound
+        var.lowBound = var.upBound = fix
+        try:
+            if column is not None and None not in points_idx[i]:
+                # The selector's own exact solver, if it has one for this problem
+                points = selector.candidate_df.iat[i, column]
+                selector.candidate_df.iat[i, column] = points + delta
+                try:
+                    direct = selector._solve_direct()
+                finally:
+                    selector.candidate_df.iat[i, column] = points
+                if direct is not None:
+                    values, value = direct
+                    return value, values[points_idx[i]].sum()
+
+            coefficients = {v: problem.objective.get(v, 0.0) for v in points_vars[i]}
+            for v, coef in coefficients.items():
+                problem.objective[v] = coef + delta
+            try:
+                selector.backend.solve(problem)
+            finally:
+                for v, coef in coefficients.items():
+                    problem.objective[v] = coef
+            if problem.status != pulp.LpStatusOptimal:
+                return None, 0
+            return pulp.value(problem.objective), sum(v.varValue or 0.0 for v in points_vars[i])
+        finally:
+            var.lowBound, var.upBound = saved
+
+    rows, shared = [], selector.candidate_df
+    if selector.pool is not None and column is not None:
+        # A pool's frame is shared and read-only: shift points on a private copy
+        selector.candidate_df = shared.copy()
+    try:
+        for i in positions.tolist():
+            change, exact, solves = bounds[i], True, 0
+            if within is not None and bounds[i] > within:
+                exact = False
+            elif chosen[i]:
+                change, solves = _leave_threshold(solve, i, optimum, counts[i], max_slope, flat_value[i])
+            else:
+                change, solves = _enter_threshold(solve, i, optimum, max_slope, steep_root[i])
+            rows.append((bool(chosen[i]), -change if chosen[i] else change, exact, solves))
+    finally:
+        selector.candidate_df = shared
+        for var, value in zip(solution_vars, solution.tolist()):
+            var.varValue = value
+        problem.status = status
+        selector.objective_value = optimum
+
+    sens = pd.DataFrame(
+        rows, columns=["selected", "change", "exact", "solves"], index=selector.candidate_df.index[positions]
+    )
+    if column is not None:
+        sens.insert(1, "points", selector.candidate_df[pred_var].to_numpy(dtype=float)[positions])
+        sens.insert(3, "threshold", sens["points"] + sens["change"])
+    sens.attrs.update(lp_optimum=float(lp_optimum), optimum=float(optimum))
+    return sens
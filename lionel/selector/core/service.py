@@ -0,0 +1,193 @@
+"""
+Asyncio front end for running selections on a bounded worker pool.
+
+`select()` blocks while the solver runs, which stalls an event loop serving many users.
+SelectionService queues selection jobs onto a thread or process pool and awaits them:
+
+    service = SelectionService(max_workers=4, max_queue=32, timeout=10)
+
+    async def recommend(candidate_df):
+        result = await service.select(XVSelector, candidate_df, budget=1000)
+        return result.selection[result.selection["xv"] == 1]
+
+Backpressure: at most `max_workers + max_queue` jobs are admitted at once. Further
+submissions wait for a slot, or raise QueueFull with `block=False`.
+
+Timeouts: a job that has not finished `timeout` seconds after it was submitted raises
+TimeoutError. A job still queued is cancelled; one already running cannot be interrupted and
+keeps its worker (and its admission slot) until the solver returns, so pair timeouts with a
+solver time limit for long solves.
+
+`metrics()` reports counters, the current queue depth and recent latency percentiles.
+A service belongs to one event loop; create it inside the loop that uses it.
+
+With `executor="process"`, jobs are pickled: the selector class, candidate_df, keyword
+arguments and `setup` function must be picklable (module-level functions, not lambdas),
+and metrics hooks registered in this process do not see the workers' solves.
+"""
+
+import asyncio
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import NamedTuple
+
+import numpy as np
+
+from .metrics import SolveStats
+
+
+class QueueFull(Exception):
+    """Raised by a non-blocking SelectionService when every admission slot is taken."""
+
+
+class SelectionResult(NamedTuple):
+    """What a worker returns: the frame `select()` returned, the objective value and the solve stats."""
+
+    selection: object
+    objective: float
+    stats: SolveStats
+
+
+def _run_selection(selector_cls, candidate_df, kwargs, setup):
+    """Builds a selector, applies `setup` and selects. Runs in a worker."""
+    selector = selector_cls(candidate_df, **kwargs)
+    if setup is not None:
+        setup(selector)
+    selection = selector.select()
+    return SelectionResult(selection, selector.objective_value, selector.stats)
+
+
+def _timed(func, args):
+    """Runs func(*args) in a worker, returning (wall-clock start time, result)."""
+    return time.time(), func(*args)
+
+
+class SelectionService:
+    """
+    Runs selection jobs on a thread or process pool for asyncio callers.
+
+    :param max_workers: Worker threads/processes. Defaults to the number of CPUs.
+    :param max_queue: Jobs admitted beyond those running.
+    :param executor: "thread" or "process".
+    :param timeout: Default per-job timeout in seconds (None waits indefinitely).
+    :param block: Wait for an admission slot when full; if False, raise QueueFull.
+    :param latency_window: Number of recent jobs kept for latency percentiles.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = None,
+        max_queue: int = 64,
+        executor: str = "thread",
+        timeout: float = None,
+        block: bool = True,
+        latency_window: int = 1000,
+    ):
+        if executor not in ("thread", "process"):
+            raise ValueError("executor must be 'thread' or 'process'.")
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self.block = block
+        pool_cls = ThreadPoolExecutor if executor == "thread" else ProcessPoolExecutor
+        self._pool = pool_cls(max_workers=self.max_workers)
+        self._slots = asyncio.Semaphore(self.max_workers + max_queue)
+        self._pending = set()  # concurrent futures admitted and not finished
+        self._latencies = deque(maxlen=latency_window)
+        self._waits = deque(maxlen=latency_window)
+        self.counts = dict.fromkeys(("submitted", "completed", "failed", "timed_out", "rejected"), 0)
+
+    async def select(self, selector_cls, candidate_df, *, timeout: float = None, setup=None, **kwargs):
+        """
+        Runs `selector_cls(candidate_df, **kwargs).select()` on the pool.
+        :param setup: Optional setup(selector) called before selecting, e.g. to add constraints.
+        :param timeout: Overrides the service's default timeout for this job.
+        :return: SelectionResult.
+        """
+        return await self.run(_run_selection, selector_cls, candidate_df, kwargs, setup, timeout=timeout)
+
+    async def run(self, func, *args, timeout: float = None):
+        """
+        Runs func(*args) on the pool, with the service's admission control, timeout and metrics.
+        :raises QueueFull: When full and the service does not block.
+        :raises TimeoutError: When the job does not finish within the timeout.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        if not self.block and self._slots.locked():
+            self.counts["rejected"] += 1
+            raise QueueFull(f"{self.max_workers + self.max_queue} selection jobs already admitted.")
+
+        submitted = time.time()
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout)
+        except asyncio.TimeoutError:
+            self.counts["timed_out"] += 1
+            raise
+
+        loop = asyncio.get_running_loop()
+        future = self._pool.submit(_timed, func, args)
+        self.counts["submitted"] += 1
+        self._pending.add(future)
+        # The slot is freed when the job ends, even if the caller stopped waiting
+        future.add_done_callback(lambda done: self._on_done(loop, done))
+
+        remaining = None if deadline is None else max(deadline - time.perf_counter(), 0)
+        try:
+            start, result = await asyncio.wait_for(asyncio.wrap_future(future), remaining)
+        except asyncio.TimeoutError:
+            future.cancel()
+            self.counts["timed_out"] += 1
+            raise
+        except Exception:
+            self.counts["failed"] += 1
+            raise
+        self.counts["completed"] += 1
+        self._waits.append(start - submitted)
+        self._latencies.append(time.time() - submitted)
+        return result
+
+    def _on_done(self, loop, future):
+        """Called by the pool when a job ends; hands the release back to the event loop."""
+        try:
+            loop.call_soon_threadsafe(self._release, future)
+        except RuntimeError:
+            # The event loop is already closed
+            pass
+
+    def _release(self, future):
+        self._pending.discard(future)
+        self._slots.release()
+
+    @property
+    def queue_depth(self) -> int:
+        """Admitted jobs not yet picked up by a worker."""
+        return sum(not future.running() and not future.done() for future in list(self._pending))
+
+    @property
+    def running(self) -> int:
+        """Jobs being run by a worker."""
+        return sum(future.running() for future in list(self._pending))
+
+    def metrics(self) -> dict:
+        """
+        Counters, current queue depth and running jobs, and p50/p99 over recent jobs of the
+        latency (submission to result) and wait (submission to a worker starting it), in seconds.
+        """
+        metrics = {**self.counts, "queue_depth": self.queue_depth, "running": self.running}
+        for name, values in (("latency", self._latencies), ("wait", self._waits)):
+            p50, p99 = np.percentile(values, [50, 99]) if values else (None, None)
+            metrics[f"{name}_p50"], metrics[f"{name}_p99"] = p50, p99
+        return metrics
+
+    def close(self, wait: bool = True):
+        """Shuts the pool down; queued jobs are cancelled."""
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
@@ -0,0 +1,766 @@
+"""
+Solver backends for BaseSelector.
+
+A backend turns a built pulp.LpProblem into a solution. CBC (the PuLP default) is
+driven through PuLP, which writes the model to disk and runs a CBC subprocess.
+The in-process backends instead take the constraint matrix directly
+(see `MatrixProblem`) and solve it in memory:
+
+    - ScipyBackend: HiGHS through `scipy.optimize.milp` (requires scipy: the `scipy` extra).
+    - HighsBackend: HiGHS through `highspy` (requires highspy: the `highs` extra).
+    - RoundingBackend: a quick answer from the LP relaxation, rounded by re-solving the
+      columns it leaves fractional (requires scipy). Reports the LP optimum as its bound.
+
+In-process backends keep the extracted matrix between solves of the same problem
+and only refresh objective coefficients and bounds, so re-solving a persistent
+selector after changing predictions, budgets or transfer limits skips re-extraction.
+HighsBackend additionally keeps its HiGHS model loaded and updates it in place.
+
+Anytime solving: `time_limit` and `gap_rel` stop a solve early with the best solution found,
+reported with the best bound and relative gap (`selector.stats.best_bound`, `.gap`). A solve
+stopped by a limit with a solution reports LpStatusOptimal and sets the problem's `sol_status`
+to LpSolutionIntegerFeasible, as PuLP does for CBC. HighsBackend streams each improved
+solution to an incumbent callback as it is found; the other backends report their final one.
+
+Usage:
+    selector = XVSelector(candidate_df, backend="highs")
+    # or
+    selector.set_backend(ScipyBackend())
+"""
+
+import operator
+import os
+import re
+import tempfile
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+
+import numpy as np
+import pulp
+
+
+def _missing(package: str, extra: str, backend: str) -> str:
+    """The error message for a backend whose optional dependency is not installed."""
+    return f'{backend} requires {package}. Install it with `pip install "lionel[{extra}]"`.'
+
+
+def _import_highspy():
+    """Imports highspy, pointing to the extra that installs it if it is missing."""
+    try:
+        import highspy
+    except ImportError as e:
+        raise ImportError(_missing("highspy", "highs", "HighsBackend")) from e
+    return highspy
+
+
+def problem_constraints(problem: pulp.LpProblem) -> list:
+    """Constraints of `problem` in insertion order (works across PuLP 2.x and 3.x)."""
+    constraints = problem.constraints
+    return list(constraints()) if callable(constraints) else list(constraints.values())
+
+
+def remove_constraints(problem: pulp.LpProblem, names) -> None:
+    """Removes the named constraints from `problem` (works across PuLP 2.x and 3.x)."""
+    constraints = problem.constraints
+    store = problem._constraints if callable(constraints) else constraints
+    for name in names:
+        del store[name]
+
+
+def common_prefix(old: list, new: list) -> int:
+    """Number of leading constraints that are the same objects in `old` and `new`."""
+    for r, (a, b) in enumerate(zip(old, new)):
+        if a is not b:
+            return r
+    return min(len(old), len(new))
+
+
+@dataclass
+class MatrixProblem:
+    """
+    A MILP in matrix form:
+
+        optimize    c @ x + objective_constant
+        subject to  row_lower <= A @ x <= row_upper
+                    col_lower <= x <= col_upper
+                    x[j] integer where integrality[j]
+
+    `A` is stored row-wise in CSR arrays (indptr, indices, data).
+    Missing bounds are +/- np.inf.
+    """
+
+    variables: list
+    c: np.ndarray
+    objective_constant: float
+    maximize: bool
+    indptr: np.ndarray
+    indices: np.ndarray
+    data: np.ndarray
+    row_lower: np.ndarray
+    row_upper: np.ndarray
+    col_lower: np.ndarray
+    col_upper: np.ndarray
+    integrality: np.ndarray
+    constraints: list = field(default=None, repr=False)
+    columns: dict = field(default=None, repr=False)
+
+    @property
+    def num_vars(self) -> int:
+        return len(self.variables)
+
+    @property
+    def num_rows(self) -> int:
+        return len(self.row_lower)
+
+    @property
+    def num_nonzeros(self) -> int:
+        return len(self.data)
+
+    @property
+    def A(self):
+        """The constraint matrix as a scipy.sparse.csr_array."""
+        from scipy import sparse
+
+        return sparse.csr_array((self.data, self.indices, self.indptr), shape=(self.num_rows, self.num_vars))
+
+    @classmethod
+    def from_pulp(cls, problem: pulp.LpProblem) -> "MatrixProblem":
+        """Extract the matrix form of a built pulp.LpProblem."""
+        variables = problem.variables()
+        column = {var: j for j, var in enumerate(variables)}
+
+        c = np.zeros(len(variables))
+        objective = problem.objective if problem.objective is not None else pulp.LpAffineExpression()
+        for var, coef in objective.items():
+            c[column[var]] = coef
+
+        constraints = problem_constraints(problem)
+        indptr, indices, data, row_lower, row_upper = cls._extract_rows(constraints, column)
+
+        col_lower = np.array([-np.inf if v.lowBound is None else v.lowBound for v in variables], dtype=float)
+        col_upper = np.array([np.inf if v.upBound is None else v.upBound for v in variables], dtype=float)
+        integrality = np.array([v.cat == pulp.LpInteger for v in variables], dtype=bool)
+
+        return cls(
+            variables=variables,
+            c=c,
+            objective_constant=float(objective.constant),
+            maximize=problem.sense == pulp.LpMaximize,
+            indptr=indptr,
+            indices=indices,
+            data=data,
+            row_lower=row_lower,
+            row_upper=row_upper,
+            col_lower=col_lower,
+            col_upper=col_upper,
+            integrality=integrality,
+            constraints=constraints,
+            columns=column,
+        )
+
+    @staticmethod
+    def _extract_rows(constraints: list, column: dict):
+        """CSR arrays (indptr, indices, data) and row bounds for `constraints`."""
+        indptr = np.zeros(len(constraints) + 1, dtype=np.int64)
+        indices, data = [], []
+        row_lower = np.full(len(constraints), -np.inf)
+        row_upper = np.full(len(constraints), np.inf)
+        for r, con in enumerate(constraints):
+            indices.extend(map(column.__getitem__, con.keys()))
+            data.extend(con.values())
+            indptr[r + 1] = len(indices)
+            rhs = -con.constant
+            if con.sense in (pulp.LpConstraintGE, pulp.LpConstraintEQ):
+                row_lower[r] = rhs
+            if con.sense in (pulp.LpConstraintLE, pulp.LpConstraintEQ):
+                row_upper[r] = rhs
+        return indptr, np.asarray(indices, dtype=np.int64), np.asarray(data, dtype=float), row_lower, row_upper
+
+    def refresh(self, problem: pulp.LpProblem) -> bool:
+        """
+        Re-reads objective coefficients, right-hand sides and variable bounds from `problem`
+        without re-extracting the constraint matrix.
+
+        Constraint coefficients are assumed unchanged (e.g. after `changeRHS`, `setObjective`
+        over existing variables or changes to variable bounds). Constraints removed from or
+        added after the unchanged leading rows (e.g. cuts) are synced row by row.
+        :return: False if the problem uses variables outside the matrix and must be re-extracted.
+        """
+        objective = problem.objective if problem.objective is not None else pulp.LpAffineExpression()
+        if any(var not in self.columns for var in objective.keys()):
+            return False
+        constraints = problem_constraints(problem)
+        kept = common_prefix(self.constraints, constraints)
+        if kept < len(self.constraints) or kept < len(constraints):
+            if any(var not in self.columns for con in constraints[kept:] for var in con.keys()):
+                return False
+            indptr, indices, data, row_lower, row_upper = self._extract_rows(constraints[kept:], self.columns)
+            end = self.indptr[kept]
+            self.indptr = np.concatenate([self.indptr[: kept + 1], indptr[1:] + end])
+            self.indices = np.concatenate([self.indices[:end], indices])
+            self.data = np.concatenate([self.data[:end], data])
+            self.row_lower = np.concatenate([self.row_lower[:kept], row_lower])
+            self.row_upper = np.concatenate([self.row_upper[:kept], row_upper])
+            self.constraints = constraints
+
+        self.c[:] = 0.0
+        for var, coef in objective.items():
+            self.c[self.columns[var]] = coef
+        self.objective_constant = float(objective.constant)
+        self.maximize = problem.sense == pulp.LpMaximize
+
+        for r, con in enumerate(constraints):
+            rhs = -con.constant
+            if con.sense in (pulp.LpConstraintGE, pulp.LpConstraintEQ):
+                self.row_lower[r] = rhs
+            if con.sense in (pulp.LpConstraintLE, pulp.LpConstraintEQ):
+                self.row_upper[r] = rhs
+
+        for j, var in enumerate(self.variables):
+            self.col_lower[j] = -np.inf if var.lowBound is None else var.lowBound
+            self.col_upper[j] = np.inf if var.upBound is None else var.upBound
+        return True
+
+    def current_values(self):
+        """The variables' current values as an array, or None if any value is unset."""
+        values = [var.varValue for var in self.variables]
+        if any(value is None for value in values):
+            return None
+        return np.asarray(values, dtype=float)
+
+    def assign(self, x: np.ndarray):
+        """Write a solution vector back to the PuLP variables (integer columns are rounded)."""
+        x = np.where(self.integrality, np.round(x), x)
+        for var, value in zip(self.variables, x.tolist()):
+            var.varValue = value
+
+
+@dataclass
+class SolveResult:
+    """
+    Outcome of a backend solve. `status` is a PuLP status code (pulp.LpStatus).
+    `gap`, `best_bound` and `nodes` are None when the solver does not report them.
+    """
+
+    status: int
+    x: np.ndarray = None
+    objective: float = None
+    gap: float = None
+    best_bound: float = None
+    nodes: int = None
+
+
+# Tolerance for integrality and for objectives matching their bound
+INTEGRALITY_TOLERANCE = 1e-6
+
+
+def relative_gap(objective: float, bound: float):
+    """|bound - objective| / |objective|, the relative MIP gap as CBC and HiGHS define it."""
+    if objective is None or bound is None or not np.isfinite(bound):
+        return None
+    return abs(bound - objective) / max(abs(objective), 1e-10)
+
+
+class SolverBackend(ABC):
+    """
+    Interface for selector solver backends.
+
+    Subclasses implement `solve_matrix`, which takes the problem in matrix form.
+    `solve` extracts the matrix from a built PuLP problem, solves it and writes the
+    solution back onto the PuLP variables, so `pulp.value(var)` works as usual.
+    The matrix of the last problem solved is cached and refreshed on the next solve.
+
+    After each solve, `timings` holds the seconds spent per phase ('write', 'solve',
+    'read'), `last_result` the SolveResult and `size` the problem's
+    (variables, constraints, nonzeros).
+    """
+
+    name = None
+
+    def __init__(self, time_limit: float = None, gap_rel: float = None):
+        """
+        :param time_limit: Wall-clock limit in seconds; the best solution found so far is returned.
+        :param gap_rel: Relative MIP gap at which to stop (e.g. 0.01 for 1%).
+        """
+        self.time_limit = time_limit
+        self.gap_rel = gap_rel
+        self._problem = None
+        self._matrix = None
+        self.timings = {}
+        self.last_result = None
+        self.size = None
+
+    @contextmanager
+    def _phase(self, name: str):
+        """Adds the wall time of the block to timings[name]."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = self.timings.get(name, 0.0) + time.perf_counter() - start
+
+    def matrix_for(self, problem: pulp.LpProblem) -> MatrixProblem:
+        """The matrix form of `problem`, reusing the cached extraction when the structure is unchanged."""
+        if self._problem is problem and self._matrix.refresh(problem):
+            return self._matrix
+        self._problem, self._matrix = problem, MatrixProblem.from_pulp(problem)
+        return self._matrix
+
+    def solve(self, problem: pulp.LpProblem, warm_start: bool = False, on_incumbent=None) -> int:
+        """
+        Solves a built pulp.LpProblem in place.
+        :param warm_start: Start from the variables' current values (e.g. the previous
+                           incumbent) if the backend supports it.
+        :param on_incumbent: Optional on_incumbent(objective, best_bound), called during the solve
+                             for each improved solution once it is written onto the variables.
+        :return: The PuLP status code.
+        """
+        self.timings = {}
+        with self._phase("write"):
+            matrix = self.matrix_for(problem)
+            x0 = matrix.current_values() if warm_start else None
+        report = None
+        if on_incumbent is not None:
+
+            def report(x, objective, best_bound):
+                matrix.assign(x)
+                on_incumbent(objective, best_bound)
+
+        result = self.solve_matrix(matrix, x0=x0, on_incumbent=report)
+        with self._phase("read"):
+            if result.x is not None:
+                matrix.assign(result.x)
+        if result.status == pulp.LpStatusNotSolved and result.x is not None:
+            # Stopped by a limit with a solution: report it as PuLP does for CBC
+            result = replace(result, status=pulp.LpStatusOptimal)
+            problem.sol_status = pulp.LpSolutionIntegerFeasible
+        elif result.status == pulp.LpStatusOptimal:
+            problem.sol_status = pulp.LpSolutionOptimal
+        problem.status = result.status
+        self.last_result = result
+        self.size = (matrix.num_vars, matrix.num_rows, matrix.num_nonzeros)
+        return result.status
+
+    @abstractmethod
+    def solve_matrix(self, matrix: MatrixProblem, x0: np.ndarray = None, on_incumbent=None) -> SolveResult:
+        """
+        Solves a MatrixProblem and returns a SolveResult.
+        :param x0: Optional starting solution; backends without warm starts ignore it.
+        :param on_incumbent: Optional on_incumbent(x, objective, best_bound) for improved solutions
+                             found during the solve; backends that can't stream them ignore it.
+        """
+        pass
+
+
+class CBCBackend(SolverBackend):
+    """
+    CBC through PuLP (the default). Each solve writes the model to a temporary file
+    and runs CBC as a subprocess.
+    """
+
+    name = "cbc"
+
+    def __init__(self, msg: bool = False, time_limit: float = None, gap_rel: float = None, **options):
+        """
+        :param msg: Whether CBC should print its log.
+        :param time_limit: See SolverBackend.
+        :param gap_rel: See SolverBackend.
+        :param options: Extra keyword arguments for pulp.PULP_CBC_CMD.
+        """
+        super().__init__(time_limit=time_limit, gap_rel=gap_rel)
+        self.msg = msg
+        self.options = options
+
+    def solve(self, problem: pulp.LpProblem, warm_start: bool = False, on_incumbent=None) -> int:
+        # CBC runs as a subprocess, so incumbents can't be streamed
+        self.timings = {}
+        options = dict(self.options)
+        # Read node counts and bounds from CBC's log unless the caller wants the log themselves
+        log_path = None
+        if not self.msg and "logPath" not in options:
+            fd, log_path = tempfile.mkstemp(suffix=".log")
+            os.close(fd)
+            options["logPath"] = log_path
+        solver = pulp.PULP_CBC_CMD(
+            msg=self.msg, warmStart=warm_start, timeLimit=self.time_limit, gapRel=self.gap_rel, **options
+        )
+
+        start = time.perf_counter()
+        try:
+            # PuLP writes the model and reads the solution around the CBC run; time those separately
+            timed = [
+                (problem, "writeMPS", "write"),
+                (problem, "writeLP", "write"),
+                (solver, "writesol", "write"),
+                (solver, "readsol_MPS", "read"),
+            ]
+            with self._timed_methods(timed):
+                status = problem.solve(solver)
+            log = ""
+            if log_path is not None:
+                with open(log_path) as f:
+                    log = f.read()
+        finally:
+            if log_path is not None:
+                os.remove(log_path)
+        self.timings["solve"] = (
+            time.perf_counter() - start - self.timings.get("write", 0.0) - self.timings.get("read", 0.0)
+        )
+
+        constraints = problem_constraints(problem)
+        self.size = (len(problem.variables()), len(constraints), sum(len(con) for con in constraints))
+        objective = pulp.value(problem.objective)
+        nodes, best_bound, proven = self._parse_log(log)
+        if proven and best_bound is None:
+            best_bound = objective
+        self.last_result = SolveResult(
+            status=status,
+            objective=objective,
+            gap=relative_gap(objective, best_bound),
+            best_bound=best_bound,
+            nodes=nodes,
+        )
+        return status
+
+    @contextmanager
+    def _timed_methods(self, methods):
+        """
+        Temporarily wraps methods so their time is added to a phase.
+        :param methods: (object, method name, phase) triples.
+        """
+        for obj, name, phase in methods:
+            method = getattr(obj, name, None)
+            if method is None:
+                continue
+
+            def timed(*args, _method=method, _phase=phase, **kwargs):
+                with self._phase(_phase):
+                    return _method(*args, **kwargs)
+
+            setattr(obj, name, timed)
+        try:
+            yield
+        finally:
+            for obj, name, _ in methods:
+                vars(obj).pop(name, None)
+
+    @staticmethod
+    def _parse_log(log: str):
+        """
+        Node count and best bound from a CBC log.
+        :return: (nodes, best_bound, proven) where `proven` means CBC reported a proven optimum.
+        """
+        nodes = re.search(r"^Enumerated nodes:\s+(\d+)", log, re.MULTILINE)
+        bound = re.search(r"^(?:Upper|Lower) bound:\s+(\S+)", log, re.MULTILINE)
+        result = re.search(r"^Result - (.*)$", log, re.MULTILINE)
+        proven = result is not None and result.group(1).strip() == "Optimal solution found"
+        return (
+            int(nodes.group(1)) if nodes else None,
+            float(bound.group(1)) if bound else None,
+            proven,
+        )
+
+    def solve_matrix(self, matrix: MatrixProblem, x0: np.ndarray = None, on_incumbent=None) -> SolveResult:
+        problem = pulp.LpProblem("MatrixProblem", pulp.LpMaximize if matrix.maximize else pulp.LpMinimize)
+        variables = [
+            pulp.LpVariable(
+                f"v_{j}",
+                lowBound=None if np.isinf(lo) else lo,
+                upBound=None if np.isinf(up) else up,
+                cat=pulp.LpInteger if integer else pulp.LpContinuous,
+            )
+            for j, (lo, up, integer) in enumerate(zip(matrix.col_lower, matrix.col_upper, matrix.integrality))
+        ]
+        problem.setObjective(pulp.LpAffineExpression(zip(variables, matrix.c.tolist()), matrix.objective_constant))
+        for r in range(matrix.num_rows):
+            cols = slice(matrix.indptr[r], matrix.indptr[r + 1])
+            expr = pulp.LpAffineExpression(
+                zip([variables[j] for j in matrix.indices[cols]], matrix.data[cols].tolist())
+            )
+            lower, upper = matrix.row_lower[r], matrix.row_upper[r]
+            if lower == upper:
+                problem.addConstraint(expr == lower)
+                continue
+            if not np.isinf(lower):
+                problem.addConstraint(expr >= lower)
+            if not np.isinf(upper):
+                problem.addConstraint(expr <= upper)
+        if x0 is not None:
+            for var, value in zip(variables, x0.tolist()):
+                var.setInitialValue(value, check=False)
+        self.solve(problem, warm_start=x0 is not None)
+        return replace(self.last_result, x=np.array([var.varValue or 0.0 for var in variables]))
+
+
+class ScipyBackend(SolverBackend):
+    """HiGHS through scipy.optimize.milp, solved in-process."""
+
+    name = "scipy"
+
+    # scipy.optimize.milp status -> PuLP status
+    STATUS = {
+        0: pulp.LpStatusOptimal,
+        1: pulp.LpStatusNotSolved,
+        2: pulp.LpStatusInfeasible,
+        3: pulp.LpStatusUnbounded,
+        4: pulp.LpStatusUndefined,
+    }
+
+    def __init__(self, time_limit: float = None, gap_rel: float = None, **options):
+        """
+        :param time_limit: See SolverBackend.
+        :param gap_rel: See SolverBackend.
+        :param options: Other options for scipy.optimize.milp.
+        """
+        super().__init__(time_limit=time_limit, gap_rel=gap_rel)
+        self.options = options
+
+    def _milp_options(self) -> dict:
+        """Options for scipy.optimize.milp, with the current limits."""
+        options = {"disp": False, **self.options}
+        if self.time_limit is not None:
+            options["time_limit"] = self.time_limit
+        if self.gap_rel is not None:
+            options["mip_rel_gap"] = self.gap_rel
+        return options
+
+    def solve_matrix(self, matrix: MatrixProblem, x0: np.ndarray = None, on_incumbent=None) -> SolveResult:
+        try:
+            from scipy.optimize import Bounds, LinearConstraint, milp
+        except ImportError as e:
+            raise ImportError(_missing("scipy", "scipy", type(self).__name__)) from e
+
+        sign = -1.0 if matrix.maximize else 1.0
+        with self._phase("write"):
+            constraints = []
+            if matrix.num_rows:
+                constraints.append(LinearConstraint(matrix.A, matrix.row_lower, matrix.row_upper))
+            bounds = Bounds(matrix.col_lower, matrix.col_upper)
+        with self._phase("solve"):
+            res = milp(
+                c=sign * matrix.c,
+                constraints=constraints,
+                integrality=matrix.integrality.astype(np.uint8),
+                bounds=bounds,
+                options=self._milp_options(),
+            )
+        status = self.STATUS.get(res.status, pulp.LpStatusUndefined)
+        # MIP statistics are only reported for problems with integer variables
+        nodes = getattr(res, "mip_node_count", None)
+        bound = getattr(res, "mip_dual_bound", None)
+        stats = dict(
+            gap=getattr(res, "mip_gap", None),
+            best_bound=None if bound is None else sign * bound + matrix.objective_constant,
+            nodes=None if nodes is None else int(nodes),
+        )
+        if res.x is None:
+            return SolveResult(status=status, **stats)
+        return SolveResult(status=status, x=res.x, objective=sign * res.fun + matrix.objective_constant, **stats)
+
+
+class HighsBackend(SolverBackend):
+    """
+    HiGHS through the `highspy` bindings, solved in-process.
+
+    The loaded HiGHS model is kept between solves of the same matrix; re-solves only
+    push changed costs and bounds, and warm starts pass the previous incumbent to HiGHS.
+    Improved solutions are streamed to incumbent callbacks through HiGHS's MIP callback.
+    """
+
+    name = "highs"
+
+    def __init__(self, time_limit: float = None, gap_rel: float = None, **options):
+        """
+        :param time_limit: See SolverBackend.
+        :param gap_rel: See SolverBackend.
+        :param options: Other HiGHS options passed to Highs.setOptionValue.
+        """
+        super().__init__(time_limit=time_limit, gap_rel=gap_rel)
+        self.options = options
+        self._defaults = {}
+        self._loaded = None
+        self._highs = None
+        self._rows = None
+
+    def _load(self, matrix: MatrixProblem):
+        """A Highs instance holding `matrix`, updated in place if `matrix` is already loaded."""
+        highspy = _import_highspy()
+
+        if self._loaded is matrix:
+            h = self._highs
+            self._sync_rows(h, matrix)
+            cols = np.arange(matrix.num_vars, dtype=np.int32)
+            rows = np.arange(matrix.num_rows, dtype=np.int32)
+            h.changeObjectiveSense(highspy.ObjSense.kMaximize if matrix.maximize else highspy.ObjSense.kMinimize)
+            h.changeObjectiveOffset(matrix.objective_constant)
+            h.changeColsCost(matrix.num_vars, cols, matrix.c)
+            h.changeColsBounds(matrix.num_vars, cols, matrix.col_lower, matrix.col_upper)
+            if matrix.num_rows:
+                h.changeRowsBounds(matrix.num_rows, rows, matrix.row_lower, matrix.row_upper)
+            return h
+
+        lp = highspy.HighsLp()
+        lp.num_col_ = matrix.num_vars
+        lp.num_row_ = matrix.num_rows
+        lp.col_cost_ = matrix.c
+        lp.offset_ = matrix.objective_constant
+        lp.sense_ = highspy.ObjSense.kMaximize if matrix.maximize else highspy.ObjSense.kMinimize
+        lp.col_lower_ = matrix.col_lower
+        lp.col_upper_ = matrix.col_upper
+        lp.row_lower_ = matrix.row_lower
+        lp.row_upper_ = matrix.row_upper
+        lp.a_matrix_.format_ = highspy.MatrixFormat.kRowwise
+        lp.a_matrix_.num_col_ = matrix.num_vars
+        lp.a_matrix_.num_row_ = matrix.num_rows
+        lp.a_matrix_.start_ = matrix.indptr
+        lp.a_matrix_.index_ = matrix.indices
+        lp.a_matrix_.value_ = matrix.data
+        lp.integrality_ = [
+            highspy.HighsVarType.kInteger if integer else highspy.HighsVarType.kContinuous
+            for integer in matrix.integrality
+        ]
+
+        h = highspy.Highs()
+        h.setOptionValue("output_flag", False)
+        for option in ("time_limit", "mip_rel_gap"):
+            value = h.getOptionValue(option)
+            # Newer highspy returns (status, value)
+            self._defaults[option] = value[-1] if isinstance(value, tuple) else value
+        for option, value in self.options.items():
+            h.setOptionValue(option, value)
+        h.passModel(lp)
+        self._loaded, self._highs, self._rows = matrix, h, matrix.constraints
+        return h
+
+    def _sync_rows(self, h, matrix: MatrixProblem):
+        """Deletes and adds rows of the loaded model so it matches `matrix` (e.g. after cuts were added)."""
+        kept = common_prefix(self._rows, matrix.constraints)
+        if kept < len(self._rows):
+            h.deleteRows(len(self._rows) - kept, np.arange(kept, len(self._rows), dtype=np.int32))
+        if kept < matrix.num_rows:
+            start = matrix.indptr[kept]
+            h.addRows(
+                matrix.num_rows - kept,
+                matrix.row_lower[kept:],
+                matrix.row_upper[kept:],
+                matrix.indptr[-1] - start,
+                (matrix.indptr[kept:-1] - start).astype(np.int32),
+                matrix.indices[start:].astype(np.int32),
+                matrix.data[start:],
+            )
+        self._rows = matrix.constraints
+
+    def solve_matrix(self, matrix: MatrixProblem, x0: np.ndarray = None, on_incumbent=None) -> SolveResult:
+        highspy = _import_highspy()
+
+        with self._phase("write"):
+            h = self._load(matrix)
+            limits = {"time_limit": self.time_limit, "mip_rel_gap": self.gap_rel}
+            for option, value in limits.items():
+                h.setOptionValue(option, float(self._defaults[option] if value is None else value))
+            if x0 is not None:
+                h.setSolution(matrix.num_vars, np.arange(matrix.num_vars, dtype=np.int32), x0)
+
+        def improved(event):
+            data = event.data_out
+            on_incumbent(np.asarray(data.mip_solution), data.objective_function_value, data.mip_dual_bound)
+
+        if on_incumbent is not None:
+            h.cbMipImprovingSolution.subscribe(improved)
+        try:
+            with self._phase("solve"):
+                h.run()
+        finally:
+            if on_incumbent is not None:
+                h.cbMipImprovingSolution.unsubscribe(improved)
+        model_status = h.getModelStatus()
+        status = {
+            highspy.HighsModelStatus.kOptimal: pulp.LpStatusOptimal,
+            highspy.HighsModelStatus.kInfeasible: pulp.LpStatusInfeasible,
+            highspy.HighsModelStatus.kUnbounded: pulp.LpStatusUnbounded,
+        }.get(model_status, pulp.LpStatusNotSolved)
+        info = h.getInfo()
+        stats = {}
+        if matrix.integrality.any():
+            stats = dict(gap=info.mip_gap, best_bound=info.mip_dual_bound, nodes=int(info.mip_node_count))
+        if info.primal_solution_status == 0:  # no feasible solution
+            return SolveResult(status=status, **stats)
+        with self._phase("read"):
+            x = np.asarray(h.getSolution().col_value)
+        return SolveResult(status=status, x=x, objective=info.objective_function_value, **stats)
+
+
+class RoundingBackend(ScipyBackend):
+    """
+    A quick, usually near-optimal solution from the LP relaxation. Integer columns the
+    relaxation sets to nonzero integers are fixed and the MILP is re-solved over the rest
+    (fixing every integral column if that fails), which is much smaller than the full
+    MILP. The LP optimum is reported as the best bound, so `gap` bounds the loss.
+    Takes the same options as ScipyBackend; `time_limit` applies to the re-solve.
+    """
+
+    name = "round"
+
+    def solve_matrix(self, matrix: MatrixProblem, x0: np.ndarray = None, on_incumbent=None) -> SolveResult:
+        try:
+            from scipy.optimize import Bounds, LinearConstraint, milp
+        except ImportError as e:
+            raise ImportError(_missing("scipy", "scipy", type(self).__name__)) from e
+
+        sign = -1.0 if matrix.maximize else 1.0
+        with self._phase("write"):
+            constraints = []
+            if matrix.num_rows:
+                constraints.append(LinearConstraint(matrix.A, matrix.row_lower, matrix.row_upper))
+        with self._phase("solve"):
+            relaxed = milp(
+                c=sign * matrix.c,
+                constraints=constraints,
+                bounds=Bounds(matrix.col_lower, matrix.col_upper),
+                options={"disp": False, **self.options},
+            )
+            if relaxed.x is None:
+                return SolveResult(status=self.STATUS.get(relaxed.status, pulp.LpStatusUndefined))
+            bound = sign * relaxed.fun + matrix.objective_constant
+            rounded = np.round(relaxed.x)
+            integral = matrix.integrality & (np.abs(relaxed.x - rounded) <= INTEGRALITY_TOLERANCE)
+            res = relaxed
+            if not (integral == matrix.integrality).all():
+                for fixed in (integral & (rounded != 0), integral):
+                    res = milp(
+                        c=sign * matrix.c,
+                        constraints=constraints,
+                        integrality=matrix.integrality.astype(np.uint8),
+                        bounds=Bounds(
+                            np.where(fixed, rounded, matrix.col_lower), np.where(fixed, rounded, matrix.col_upper)
+                        ),
+                        options=self._milp_options(),
+                    )
+                    if res.x is not None:
+                        break
+        if res.x is None:
+            return SolveResult(status=pulp.LpStatusNotSolved, best_bound=bound)
+        objective = sign * res.fun + matrix.objective_constant
+        gap = relative_gap(objective, bound)
+        status = pulp.LpStatusOptimal if gap <= INTEGRALITY_TOLERANCE else pulp.LpStatusNotSolved
+        return SolveResult(status=status, x=res.x, objective=objective, gap=gap, best_bound=bound)
+
+
+BACKENDS = {backend.name: backend for backend in (CBCBackend, ScipyBackend, HighsBackend, RoundingBackend)}
+
+
+def get_backend(backend=None, **options) -> SolverBackend:
+    """
+    Resolves a backend argument to a SolverBackend instance.
+    :param backend: None (CBC), a backend name ('cbc', 'scipy', 'highs', 'round') or a SolverBackend.
+    :param options: Constructor options (e.g. time_limit, gap_rel) when creating a backend by name.
+    """
+    if isinstance(backend, SolverBackend):
+        return backend
+    if backend is None:
+        return CBCBackend(**options)
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown solver backend '{backend}'. Choose from {sorted(BACKENDS)}.")
+    return BACKENDS[backend](**options)
@@ -0,0 +1,276 @@
+"""
+In-process exact solver for the XVSelector problem: position quotas, one budget,
+a per-team cap and a captain whose points count twice.
+
+1. Presolve: dominated candidates are dropped (lionel.selector.core.pruning), which
+   keeps an optimal squad and typically leaves a few hundred candidates.
+2. Bound: without the team cap the problem is a knapsack with per-position cardinalities,
+   solved exactly by dynamic programming over integer prices (tenths). The DP runs
+   through the candidates sorted by position with state (players taken in the current
+   position, captain chosen, money spent), one vectorized update per candidate.
+3. Branch: when the DP squad has more than `max_per_team` players from a team, with
+   selected s_1..s_k from that team, branch j (j = 1..max_per_team + 1) excludes s_j and
+   forces in s_1..s_{j-1}. Every squad within the cap falls in exactly one branch.
+   When the squad is within the cap but the bound is not attained, one player is forced
+   in or out. Nodes are explored best bound first, so search stops once no open node can
+   beat the best squad within the cap.
+
+The team caps are relaxed with Lagrangian multipliers (subgradient steps), which closes most
+of the gap at the root: typical 700-player pools need a single knapsack solve (~15ms).
+Search gives up with SolveLimitReached after `max_solves` knapsack solves; XVSelector then
+falls back to the MILP.
+
+Usage:
+    mask, captain, value = solve_xv(points, prices, positions, teams, budget=1000,
+                                    quotas={"GK": 2, "DEF": 5, "MID": 5, "FWD": 3}, max_per_team=3)
+"""
+
+import heapq
+
+import numpy as np
+import pandas as pd
+
+from ..core.pruning import dominated_mask
+
+MAX_SOLVES = 40
+# Subgradient iterations for the team cap multipliers at the root and at other nodes
+ROOT_ITERATIONS = 30
+NODE_ITERATIONS = 5
+TOLERANCE = 1e-9
+
+
+class SolveLimitReached(Exception):
+    """Raised when branch and bound needs more than `max_solves` knapsack solves."""
+
+
+def _knapsack(points, bonus, prices, segments, budget, forced):
+    """
+    Best squad with the position quotas, budget and a captain, ignoring team caps:
+    maximize sum(points[squad]) + bonus[captain].
+
+    :param segments: (start, stop, quota) per position, over candidates sorted by position.
+    :param forced: Per candidate: 1 must be selected, -1 must not, 0 free.
+    :return: (value, selected positions, captain position), or None if infeasible.
+    """
+    prev = np.full((2, budget + 1), -np.inf)
+    prev[0, 0] = 0.0
+    # Per candidate: None if skipped, else (took, as_captain) over the states it can reach,
+    # i.e. values[1:, :, price:] (one more player, `price` more spent)
+    decisions = []
+    for start, stop, quota in segments:
+        # values[k, f, b]: best points with k players of this position, captain chosen (f), b spent
+        values = np.full((quota + 1, 2, budget + 1), -np.inf)
+        values[0] = prev
+        for i in range(start, stop):
+            price = int(prices[i])
+            if forced[i] < 0 or price > budget:
+                if forced[i] > 0:
+                    return None
+                decisions.append(None)
+                continue
+            source = values[:-1, :, : budget + 1 - price]
+            take = source + points[i]
+            captain = source[:, 0] + (points[i] + bonus[i])
+            as_captain = captain > take[:, 1]
+            np.maximum(take[:, 1], captain, out=take[:, 1])
+            target = values[1:, :, price:]
+            if forced[i] > 0:
+                took = np.ones(take.shape, dtype=bool)
+                # Must take: states without this player become unreachable
+                values[0] = -np.inf
+                values[1:, :, :price] = -np.inf
+                target[...] = take
+            else:
+                took = take > target
+                np.maximum(target, take, out=target)
+            decisions.append((took, as_captain))
+        prev = values[quota]
+
+    best = int(np.argmax(prev[1]))
+    if not np.isfinite(prev[1, best]):
+        return None
+
+    # Walk the decisions back from the final state
+    selected, captain, flag, spent = [], None, 1, best
+    for start, stop, quota in reversed(segments):
+        count = quota
+        for i in range(stop - 1, start - 1, -1):
+            decision, price = decisions[i], int(prices[i])
+            if decision is None or count == 0 or spent < price:
+                continue
+            took, as_captain = decision
+            if not took[count - 1, flag, spent - price]:
+                continue
+            selected.append(i)
+            if flag == 1 and as_captain[count - 1, spent - price]:
+                captain, flag = i, 0
+            count -= 1
+            spent -= price
+    return float(prev[1, best]), np.array(sorted(selected)), captain
+
+
+def solve_xv(
+    points, prices, positions, teams, budget, quotas: dict, max_per_team: int, forced=None, max_solves=MAX_SOLVES
+):
+    """
+    Exact optimum of: maximize sum(points[squad]) + points[captain] subject to the position
+    quotas, sum(prices[squad]) <= budget and at most max_per_team players per team.
+
+    :param prices: Integer prices (e.g. tenths); the budget is rounded down.
+    :param forced: Optional per-row array: 1 must be selected, -1 must not, 0 free.
+    :param max_solves: Limit on knapsack solves over the whole search.
+    :return: (boolean squad mask, captain position, objective value), or None if infeasible.
+    :raises ValueError: If prices are not integers or a position has no quota.
+    :raises SolveLimitReached: If more than max_solves knapsack solves are needed.
+    """
+    points = np.asarray(points, dtype=float)
+    prices = np.asarray(prices, dtype=float)
+    positions, teams = np.asarray(positions), np.asarray(teams)
+    if not np.array_equal(prices, np.round(prices)) or (prices < 0).any():
+        raise ValueError("solve_xv needs non-negative integer prices.")
+    unknown = set(pd.unique(positions)) - set(quotas)
+    if unknown:
+        raise ValueError(f"Positions without quotas: {sorted(unknown)}")
+
+    forced = np.zeros(len(points), dtype=int) if forced is None else np.asarray(forced, dtype=int)
+    # Excluded players can't dominate anyone, so prune among the others
+    keep = np.flatnonzero(forced >= 0)
+    dominated = dominated_mask(
+        points[keep],
+        prices[keep],
+        positions[keep],
+        teams[keep],
+        quotas,
+        max_per_team,
+        squad_size=sum(quotas.values()),
+        protected=forced[keep] > 0,
+    )
+    keep = keep[~dominated]
+    # Candidates sorted by position, in quota order
+    rank = {pos: k for k, pos in enumerate(quotas)}
+    keep = keep[np.argsort([rank[pos] for pos in positions[keep]], kind="stable")]
+    bounds = np.searchsorted([rank[pos] for pos in positions[keep]], np.arange(len(quotas) + 1))
+    segments = [(bounds[k], bounds[k + 1], quota) for k, quota in enumerate(quotas.values())]
+    sub_points, sub_prices = points[keep], prices[keep].astype(int)
+    team_codes = pd.factorize(teams[keep])[0]
+
+    budget = int(np.floor(budget + 1e-9))
+    if budget < 0:
+        return None
+    n_teams = team_codes.max(initial=-1) + 1
+    incumbent = None  # (value, selected, captain)
+    # Best bound first: (-parent bound, tie-breaker, forced, parent multipliers)
+    heap, counter, solves = [(-np.inf, 0, forced[keep], np.zeros(n_teams))], 1, 0
+    while heap:
+        neg_bound, _, forced, multipliers = heapq.heappop(heap)
+        if incumbent is not None and -neg_bound <= incumbent[0] + TOLERANCE:
+            break
+        if solves >= max_solves:
+            raise SolveLimitReached(f"Branch and bound needed more than {max_solves} knapsack solves.")
+        result = _lagrangian_bound(
+            sub_points,
+            sub_prices,
+            team_codes,
+            segments,
+            budget,
+            forced,
+            max_per_team,
+            multipliers,
+            None if incumbent is None else incumbent[0],
+            min(ROOT_ITERATIONS if solves == 0 else NODE_ITERATIONS, max_solves - solves),
+        )
+        if result is None:
+            # Infeasible nodes are found by the first solve
+            solves += 1
+            continue
+        used, bound, selected, counts, multipliers, feasible = result
+        solves += used
+        if feasible is not None and (incumbent is None or feasible[0] > incumbent[0]):
+            incumbent = feasible
+        if incumbent is not None and bound <= incumbent[0] + TOLERANCE:
+            continue
+        for child in _branches(selected, counts, forced, team_codes, sub_points, multipliers, max_per_team):
+            heapq.heappush(heap, (-bound, counter, child, multipliers))
+            counter += 1
+
+    if incumbent is None:
+        return None
+    value, selected, captain = incumbent
+    mask = np.zeros(len(points), dtype=bool)
+    mask[keep[selected]] = True
+    return mask, int(keep[captain]), value
+
+
+def _lagrangian_bound(points, prices, team_codes, segments, budget, forced, cap, multipliers, target, iterations):
+    """
+    Upper bound for a node from the Lagrangian relaxation of the team caps: for multipliers
+    mu >= 0, the knapsack on points - mu[team] plus cap * sum(mu) bounds the node's optimum.
+    Multipliers start from the parent's and follow subgradient steps towards `target`
+    (the incumbent value, if any).
+
+    :return: None if the node is infeasible, else (knapsack solves used, bound, selected, team
+             counts and multipliers of the solution at the best bound, best squad within the
+             caps found or None).
+    """
+    n_teams = len(multipliers)
+    best, feasible, step, stalled = None, None, 1.0, 0
+    for used in range(1, iterations + 1):
+        solution = _knapsack(points - multipliers[team_codes], points, prices, segments, budget, forced)
+        if solution is None:
+            return None
+        value, selected, captain = solution
+        counts = np.bincount(team_codes[selected], minlength=n_teams)
+        slack = cap - counts
+        bound = value + cap * multipliers.sum()
+        if best is None or bound < best[0] - TOLERANCE:
+            best, stalled = (bound, selected, counts, multipliers), 0
+        else:
+            stalled += 1
+            if stalled >= 3:
+                step, stalled = step / 2, 0
+
+        if (slack >= 0).all():
+            true_value = points[selected].sum() + points[captain]
+            if feasible is None or true_value > feasible[0]:
+                feasible = (true_value, selected, captain)
+            if multipliers @ slack <= TOLERANCE:
+                # Complementary slackness: the bound is attained
+                return used, true_value, selected, counts, multipliers, feasible
+        goal = target if target is not None else (feasible[0] if feasible else bound - 0.05 * abs(bound) - 1)
+        if best[0] <= goal + TOLERANCE or not slack.any():
+            break
+        multipliers = np.maximum(0.0, multipliers - step * (best[0] - goal) / (slack @ slack) * slack)
+    return (used, *best, feasible)
+
+
+def _branches(selected, counts, forced, team_codes, points, multipliers, cap):
+    """
+    Children of a node whose relaxed squad is `selected`, splitting on the cap of one team.
+
+    For a team with free members m_1..m_r (best first) and `places` left under its cap,
+    child j (j = 1..places + 1) excludes m_j and forces in m_1..m_{j-1}. Every squad within
+    the cap excludes one of m_1..m_{places+1}, so it falls in exactly one child.
+    The team is the most over-subscribed one in `selected`. If every team is within the cap
+    (a duality gap of the Lagrangian bound), split on one free selected player instead.
+    """
+    over = np.flatnonzero(counts > cap)
+    for team in over[np.argsort(-counts[over], kind="stable")]:
+        members = np.flatnonzero(team_codes == team)
+        free = members[forced[members] == 0]
+        places = cap - np.count_nonzero(forced[members] > 0)
+        if len(free) <= places:
+            continue
+        # Selected members first, then the rest, so every child moves the relaxed squad
+        free = free[np.argsort(~np.isin(free, selected), kind="stable")]
+        children = []
+        for j in range(places + 1):
+            child = forced.copy()
+            child[free[:j]] = 1
+            child[free[j]] = -1
+            children.append(child)
+        return children
+
+    free = selected[forced[selected] == 0]
+    if not len(free):
+        return []
+    return [np.where(np.arange(len(forced)) == free[0], value, forced) for value in (1, -1)]
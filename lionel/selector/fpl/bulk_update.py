@@ -0,0 +1,226 @@
+"""
+Transfer recommendations for many user squads against one candidate pool.
+
+UpdateXVSelector reads the existing squad from the 'xv' column, so serving N users means
+N copies of the pool and N rebuilds of identical position, team and budget constraints.
+BulkUpdateXVSelector writes the transfer limit so that the existing squad only enters
+through variable bounds and a right-hand side:
+
+    keep_i <= x_i,   0 <= keep_i <= current_i,   sum_i keep_i >= 15 - max_transfers
+
+(keep_i can be 1 only for a current player who stays, so the last row allows at most
+`max_transfers` new players). One built problem then serves every squad, budget and
+transfer limit: switching users changes bounds and right-hand sides in place.
+
+Dominated candidates (lionel.selector.core.pruning) are found once for the pool: a dominated
+player outside a user's squad can always be swapped for a dominator without using more
+transfers, so for each user they are banned through their upper bounds.
+
+`update_squads` takes the pool once plus an (n_users, 15) matrix of squads and spreads
+users across worker processes, each building its selector once:
+
+    recs = update_squads(candidate_df, squads, budgets=bank + squad_value, free_transfers=1, n_workers=4)
+    recs.loc[0, "transfers_in"]   # index labels of the players user 0 should bring in
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pulp
+
+from ..core.constraints import CountConstraint
+from ..core.pruning import dominated_mask
+from .xv_selector import XVSelector
+
+# Per-process state set by _init_worker in pool workers; in-process runs use their own dict
+_WORKER = {}
+
+
+class BulkUpdateXVSelector(XVSelector):
+    """
+    XVSelector with a transfer limit from a current squad that can be switched in place
+    with `set_current_squad`, without rebuilding the problem. Equivalent to UpdateXVSelector
+    for each squad.
+
+    With `prune=True`, dominated candidates outside the current squad get an upper bound
+    of 0 instead of being dropped, so row positions stay those of candidate_df.
+    """
+
+    def __init__(
+        self,
+        candidate_df: pd.DataFrame,
+        pred_var: str = "predicted_points",
+        budget: float = 1000.0,
+        backend=None,
+        prune: bool = True,
+    ):
+        super().__init__(candidate_df, pred_var=pred_var, budget=budget, backend=backend)
+        self.dominated = np.zeros(self.num_players, dtype=bool)
+        if prune:
+            self.dominated = dominated_mask(
+                self.candidate_df[pred_var],
+                self.candidate_df["price"],
+                self.candidate_df["position"],
+                self.candidate_df["team"],
+                self.POS_CONSTRAINTS,
+                self.MAX_PER_TEAM,
+            )
+        self.current_xv = np.zeros(self.num_players, dtype=int)
+        self.max_transfers = 15
+        # keep_i: player i is in the current squad and stays; bounded by current_xv
+        self.keep_vars = [pulp.LpVariable(f"keep_{i}", lowBound=0, upBound=0) for i in range(self.num_players)]
+        self.add_constraint(self._constraint_keep_selected)
+        self.add_constraint(self._constraint_min_kept)
+
+    def _cache_params(self):
+        return {**super()._cache_params(), "max_transfers": self.max_transfers, "current_xv": self.current_xv}
+
+    def _constraint_keep_selected(self, candidate_df, decision_vars):
+        """keep_i <= x_i: only selected players count as kept."""
+        return [
+            pulp.LpConstraint(pulp.LpAffineExpression([(k, 1), (x, -1)]), sense=pulp.LpConstraintLE, rhs=0)
+            for k, x in zip(self.keep_vars, decision_vars)
+        ]
+
+    def _constraint_min_kept(self, candidate_df, decision_vars):
+        """At least 15 - max_transfers current players are kept."""
+        return CountConstraint(min=15 - self.max_transfers, name="min_kept")(candidate_df, self.keep_vars)
+
+    def set_current_squad(self, squad, max_transfers: int = None, budget: float = None):
+        """
+        Switches to another user's squad, updating a built problem in place.
+        :param squad: Integer row positions of the 15 current players.
+        :param max_transfers: New transfer limit, if given.
+        :param budget: New budget, if given.
+        """
+        squad = np.asarray(squad, dtype=int)
+        if len(squad) != 15 or len(np.unique(squad)) != 15:
+            raise ValueError("A squad must have 15 distinct players.")
+        self.current_xv = np.zeros(self.num_players, dtype=int)
+        self.current_xv[squad] = 1
+        for var, upper in zip(self.keep_vars, self.current_xv.tolist()):
+            var.upBound = upper
+        banned = self.dominated & (self.current_xv == 0)
+        for var, upper in zip(self.decision_vars, (~banned).astype(int).tolist()):
+            var.upBound = upper
+        if max_transfers is not None:
+            self.max_transfers = max_transfers
+            if self._built:
+                self.set_rhs("min_kept", 15 - max_transfers)
+        if budget is not None:
+            self.set_budget(budget)
+        self.set_initial_squad(self.current_xv)
+        # A previous user's keep values would make the warm start infeasible
+        self.set_initial_values(self.current_xv, self.keep_vars)
+
+
+def _init_worker(candidate_df, pred_var, backend, state=_WORKER):
+    """Builds this process's selector once; users only change its bounds and right-hand sides."""
+    state["selector"] = BulkUpdateXVSelector(candidate_df, pred_var=pred_var, backend=backend)
+
+
+def _solve_users(task, state=_WORKER):
+    """
+    Solves the users in `task` = (squads, budgets, free transfers) on the worker's selector.
+    :return: (new squads as row positions, captain positions, objectives, statuses)
+    """
+    selector = state["selector"]
+    results = []
+    for squad, budget, max_transfers in zip(*task):
+        selector.set_current_squad(squad, max_transfers=int(max_transfers), budget=float(budget))
+        selector.select(warm_start=True)
+        new = np.flatnonzero(selector._values(selector.decision_vars) > 0.5)
+        captain = np.flatnonzero(selector._values(selector.captain_vars) > 0.5)
+        results.append(
+            (new, int(captain[0]) if len(captain) else -1, selector.objective_value, selector.problem.status)
+        )
+    return results
+
+
+def _as_vector(values, n_users: int, name: str) -> np.ndarray:
+    """Broadcasts a scalar or per-user array-like to shape (n_users,)."""
+    values = np.asarray(values, dtype=float)
+    if values.ndim == 0:
+        return np.full(n_users, float(values))
+    if values.shape != (n_users,):
+        raise ValueError(f"{name} must be a scalar or have one value per user.")
+    return values
+
+
+def update_squads(
+    candidate_df: pd.DataFrame,
+    squads,
+    budgets=1000.0,
+    free_transfers=1,
+    n_workers: int = None,
+    pred_var: str = "predicted_points",
+    backend=None,
+    chunk_size: int = None,
+) -> pd.DataFrame:
+    """
+    Best transfers for each user squad, as UpdateXVSelector would recommend them.
+
+    :param candidate_df: The shared pool with pred_var, 'price', 'team' and 'position'.
+    :param squads: Integer array of shape (n_users, 15): each user's current players as row
+                   positions in candidate_df.
+    :param budgets: Budget per user (bank plus squad value), or one for all.
+    :param free_transfers: Transfers allowed per user (no hits are taken), or one for all.
+    :param n_workers: Worker processes. Defaults to os.cpu_count(); 1 solves in this process.
+    :param backend: Solver backend name (instances must be picklable).
+    :param chunk_size: Users per task. Defaults to four tasks per worker.
+    :return: One row per user with 'transfers_out' and 'transfers_in' (lists of candidate_df
+             index labels), 'captain' (label, missing without a solution), 'objective' and
+             'status'. The new squads are in `.attrs["squads"]` as an (n_users, 15) array of
+             row positions (-1 without a solution).
+    """
+    squads = np.asarray(squads, dtype=int)
+    if squads.ndim != 2 or squads.shape[1] != 15:
+        raise ValueError(f"squads must have shape (n_users, 15); got {squads.shape}.")
+    if len(squads) and (squads.min() < 0 or squads.max() >= len(candidate_df)):
+        raise ValueError("squads must hold row positions in candidate_df.")
+    n_users = len(squads)
+    budgets = _as_vector(budgets, n_users, "budgets")
+    free_transfers = _as_vector(free_transfers, n_users, "free_transfers").astype(int)
+
+    pool_df = candidate_df[[pred_var, "price", "team", "position"]].reset_index(drop=True)
+    n_workers = n_workers or os.cpu_count() or 1
+    chunk_size = chunk_size or max(1, -(-n_users // (4 * n_workers)))
+    tasks = [
+        (squads[i : i + chunk_size], budgets[i : i + chunk_size], free_transfers[i : i + chunk_size])
+        for i in range(0, n_users, chunk_size)
+    ]
+
+    if n_workers == 1 or len(tasks) <= 1:
+        state = {}
+        _init_worker(pool_df, pred_var, backend, state)
+        chunks = [_solve_users(task, state) for task in tasks]
+    else:
+        initargs = (pool_df, pred_var, backend)
+        with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker, initargs=initargs) as pool:
+            chunks = list(pool.map(_solve_users, tasks))
+    results = [result for chunk in chunks for result in chunk]
+
+    labels = candidate_df.index
+    new_squads = np.full((n_users, 15), -1)
+    rows = []
+    for u, (new, captain, objective, status) in enumerate(results):
+        current = squads[u]
+        if status == pulp.LpStatusOptimal:
+            new_squads[u] = new
+        else:
+            # No recommendation, e.g. the squad is over the user's budget
+            new, captain = current, -1
+        rows.append(
+            {
+                "transfers_out": labels[np.setdiff1d(current, new)].tolist(),
+                "transfers_in": labels[np.setdiff1d(new, current)].tolist(),
+                "captain": labels[captain] if captain >= 0 else None,
+                "objective": objective,
+                "status": pulp.LpStatus[status],
+            }
+        )
+    recs = pd.DataFrame(rows, index=pd.RangeIndex(n_users, name="user"))
+    recs.attrs["squads"] = new_squads
+    return recs
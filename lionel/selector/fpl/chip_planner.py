@@ -0,0 +1,276 @@
+"""
+Season-long chip planning (wildcard, free hit, bench boost, triple captain).
+
+Each chip is valued against the squad that would otherwise be in force:
+
+  - baseline squad in gameweek s: the baseline squad of gameweek s-1 (the current squad
+    for the first gameweek) after `transfers_per_gw` transfers chosen for gameweek s
+    (an UpdateXVSelector sub-solve)
+  - wildcard in gameweek w: a new squad optimized for gameweeks w..w+h-1 (XVSelector on
+    the summed predictions); in the following gameweeks it is updated with regular
+    transfers like the baseline. After `wildcard_horizon` (h) gameweeks both
+    trajectories are assumed to have converged.
+  - free hit in gameweek s: the best squad for gameweek s alone, for that gameweek only
+  - bench boost / triple captain: the bench / captain points of the squad in force
+
+Squads are scored by their best XI plus captain. Sub-solves run in a process pool and
+are cached on the planner; re-planning with other chips only re-runs the dynamic
+program over (gameweek, chips used, active wildcard). The free hit and wildcard squads
+are independent; the baseline and post-wildcard squads are chained, so they are solved
+one gameweek at a time, all chains advancing together.
+
+This is a planning heuristic: transfers are modelled as a fixed number per gameweek,
+each chosen for its own gameweek only (no banking or planning ahead).
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+from .update_xv_selector import UpdateXVSelector
+from .xv_selector import XVSelector
+
+CHIPS = ("wildcard", "free_hit", "bench_boost", "triple_captain")
+
+# Per-process state set by _init_worker in pool workers; in-process runs use their own dict
+_WORKER = {}
+
+
+def lineup_points(points, positions):
+    """
+    Scores a valid 15-player squad: best XI (1 GK, at least 3 DEF, 2 MID, 1 FWD), its
+    captain and the bench. Filling the minimums and then the best remaining outfield
+    players is optimal because the XV's position counts never exceed the XI maximums.
+    :return: (XI points, captain points, bench points)
+    """
+    points, positions = np.asarray(points, dtype=float), np.asarray(positions)
+    order = np.argsort(-points, kind="stable")
+    points, positions = points[order], positions[order]
+    starters = np.zeros(len(points), dtype=bool)
+    starters[np.flatnonzero(positions == "GK")[:1]] = True
+    for pos, minimum in (("DEF", 3), ("MID", 2), ("FWD", 1)):
+        starters[np.flatnonzero(positions == pos)[:minimum]] = True
+    fill = np.flatnonzero(~starters & (positions != "GK"))[: 11 - starters.sum()]
+    starters[fill] = True
+    xi = points[starters]
+    return xi.sum(), xi.max(initial=0.0), points[~starters].sum()
+
+
+def _init_worker(candidate_df, budget, backend, state=_WORKER):
+    state.update(candidate_df=candidate_df, budget=budget, backend=backend)
+
+
+def _solve_squad(task, state=_WORKER):
+    """
+    Solves one squad: XVSelector on the summed `columns` or, with an anchor squad,
+    UpdateXVSelector from it with `max_transfers` transfers.
+    :return: Boolean squad mask aligned with candidate_df rows.
+    """
+    columns, anchor, max_transfers = task
+    df = state["candidate_df"]
+    df = df.assign(_points=df[list(columns)].sum(axis=1))
+    kwargs = dict(pred_var="_points", budget=state["budget"], backend=state["backend"], prune=True)
+    if anchor is None:
+        selector = XVSelector(df, **kwargs)
+    else:
+        selector = UpdateXVSelector(df.assign(xv=np.asarray(anchor, dtype=int)), max_transfers=max_transfers, **kwargs)
+    # select() returns the full frame, also when candidates were pruned
+    return selector.select()["xv"].to_numpy(dtype=bool)
+
+
+class ChipPlanner:
+    """
+    Picks the gameweek for each chip over the remaining season.
+
+    Usage:
+        planner = ChipPlanner(candidate_df, pred_vars=[f"points_gw{gw}" for gw in range(10, 39)])
+        plan = planner.plan()   # one row per gameweek with the chip played and expected points
+
+    Expects candidate_df to have 'price', 'team', 'position', 'xv' (the current squad)
+    and one predicted points column per remaining gameweek, in order, in `pred_vars`.
+    """
+
+    def __init__(
+        self,
+        candidate_df: pd.DataFrame,
+        pred_vars: list,
+        budget: float = 1000.0,
+        transfers_per_gw: int = 1,
+        wildcard_horizon: int = 4,
+        backend=None,
+        n_workers: int = None,
+    ):
+        """
+        :param pred_vars: Predicted points column per remaining gameweek, in order.
+        :param transfers_per_gw: Transfers assumed per gameweek outside of chips.
+        :param wildcard_horizon: Gameweeks a wildcard squad is optimized for and kept apart from the baseline.
+        :param backend: Solver backend name for the sub-solves (instances must be picklable).
+        :param n_workers: Worker processes for sub-solves. Defaults to os.cpu_count(); 1 solves in this process.
+        """
+        for col in list(pred_vars) + ["xv", "price", "team", "position"]:
+            if col not in candidate_df.columns:
+                raise ValueError(f"'{col}' not found in candidate_df columns.")
+        self.candidate_df = candidate_df.reset_index(drop=True)
+        self.pred_vars = list(pred_vars)
+        self.budget = budget
+        self.transfers_per_gw = transfers_per_gw
+        self.wildcard_horizon = wildcard_horizon
+        self.backend = backend
+        self.n_workers = n_workers or os.cpu_count() or 1
+        self.current_xv = self.candidate_df["xv"].to_numpy(dtype=bool)
+        self.squads = {}  # task -> squad mask, shared across plan() calls
+        self.chip_values = None
+
+    def _task(self, columns, anchor, max_transfers):
+        """Cache key for a sub-solve; anchors are dropped once transfers allow any squad."""
+        if anchor is None or max_transfers >= 15:
+            return (tuple(columns), None, None)
+        return (tuple(columns), tuple(np.asarray(anchor, dtype=bool).tolist()), int(max_transfers))
+
+    @contextmanager
+    def _solver(self):
+        """
+        Yields solve(tasks), which solves the uncached `tasks` into the cache (in parallel when
+        n_workers > 1). The worker processes are started on first use and kept until exit.
+        """
+        initargs = (self.candidate_df.drop(columns=["xv"]), self.budget, self.backend)
+        state, pool = {}, None
+
+        def solve(tasks):
+            nonlocal pool
+            todo = list(dict.fromkeys(task for task in tasks if task not in self.squads))
+            if not todo:
+                return
+            if self.n_workers == 1 or len(todo) == 1:
+                if not state:
+                    _init_worker(*initargs, state)
+                results = [_solve_squad(task, state) for task in todo]
+            else:
+                if pool is None:
+                    pool = ProcessPoolExecutor(self.n_workers, initializer=_init_worker, initargs=initargs)
+                results = list(pool.map(_solve_squad, todo, chunksize=max(1, len(todo) // (4 * self.n_workers))))
+            self.squads.update(zip(todo, results))
+
+        try:
+            yield solve
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+    def _score(self, squad, col):
+        """(XI + captain, captain, bench) points of `squad` in gameweek `col`."""
+        xi, captain, bench = lineup_points(self.candidate_df.loc[squad, col], self.candidate_df.loc[squad, "position"])
+        return xi + captain, captain, bench
+
+    def _weekly_scores(self):
+        """
+        Runs all sub-solves and scores the squad in force in every gameweek.
+        :return: (baseline scores, free hit scores, {wildcard gameweek: scores for its horizon}),
+                 each score a (points, captain, bench) tuple per gameweek.
+        """
+        T, h, tpg = len(self.pred_vars), self.wildcard_horizon, self.transfers_per_gw
+        free_hit_tasks = [self._task([col], None, None) for col in self.pred_vars]
+        wildcard_tasks = [self._task(self.pred_vars[t : t + h], None, None) for t in range(T)]
+        baseline_tasks, anchored_tasks = [], {}
+        with self._solver() as solve:
+            solve(free_hit_tasks + wildcard_tasks)
+            # Each gameweek makes tpg transfers from the previous gameweek's squad, so the
+            # baseline and every wildcard's chain are solved one gameweek at a time
+            for t, col in enumerate(self.pred_vars):
+                previous = self.squads[baseline_tasks[-1]] if baseline_tasks else self.current_xv
+                baseline_tasks.append(self._task([col], previous, tpg))
+                for w in range(max(0, t - h + 1), t):
+                    previous = self.squads[anchored_tasks[w, t - 1] if t - 1 > w else wildcard_tasks[w]]
+                    anchored_tasks[w, t] = self._task([col], previous, tpg)
+                solve([baseline_tasks[t]] + [anchored_tasks[w, t] for w in range(max(0, t - h + 1), t)])
+
+        baseline = [self._score(self.squads[task], col) for task, col in zip(baseline_tasks, self.pred_vars)]
+        free_hit = [self._score(self.squads[task], col) for task, col in zip(free_hit_tasks, self.pred_vars)]
+        wildcard = {}
+        for w in range(T):
+            wildcard[w] = [self._score(self.squads[wildcard_tasks[w]], self.pred_vars[w])] + [
+                self._score(self.squads[anchored_tasks[w, t]], self.pred_vars[t]) for t in range(w + 1, min(w + h, T))
+            ]
+        return baseline, free_hit, wildcard
+
+    def plan(self, chips=CHIPS) -> pd.DataFrame:
+        """
+        Chooses gameweeks for `chips` (at most one chip per gameweek) to maximize expected points.
+        :param chips: Chips still available; repeat a name to allow it more than once.
+        :return: One row per gameweek (indexed by pred_vars) with the 'chip' played (None for
+                 none), 'points' expected that gameweek and 'chip_gain' over the baseline squad
+                 (gameweeks after a wildcard also gain from the wildcard squad).
+                 The plan's total is in `total_points`.
+                 Also sets `chip_values`: each chip's standalone gain per gameweek.
+        """
+        for chip in chips:
+            if chip not in CHIPS:
+                raise ValueError(f"Unknown chip '{chip}'. Choose from {CHIPS}.")
+        chips = list(chips)
+        T, h = len(self.pred_vars), self.wildcard_horizon
+        baseline, free_hit, wildcard = self._weekly_scores()
+
+        def in_force(t, anchor):
+            """Scores of the squad in force in gameweek t with the wildcard played at `anchor` (or None)."""
+            return baseline[t] if anchor is None else wildcard[anchor][t - anchor]
+
+        def week(t, anchor, chip):
+            points, captain, bench = in_force(t, anchor)
+            if chip == "free_hit":
+                return free_hit[t][0]
+            if chip == "bench_boost":
+                return points + bench
+            if chip == "triple_captain":
+                return points + captain
+            return points
+
+        self.chip_values = pd.DataFrame(
+            {
+                "wildcard": [sum(p[0] for p in wildcard[t]) - sum(b[0] for b in baseline[t : t + h]) for t in range(T)],
+                "free_hit": [free_hit[t][0] - baseline[t][0] for t in range(T)],
+                "bench_boost": [baseline[t][2] for t in range(T)],
+                "triple_captain": [baseline[t][1] for t in range(T)],
+            },
+            index=self.pred_vars,
+        )
+
+        # value[mask, anchor]: best points from gameweek t on, with the chips in `mask` used and
+        # the wildcard played in gameweek `anchor` still in force. Solved backwards.
+        full = (1 << len(chips)) - 1
+        value, decisions = {}, []
+        for t in reversed(range(T)):
+            new_value, choice = {}, {}
+            for mask in range(full + 1):
+                # anchor in force at the start of gameweek t (a wildcard played before t)
+                for anchor in [None] + [w for w in range(max(0, t - h + 1), t)]:
+                    options = [(None, mask, anchor)]
+                    for chip in dict.fromkeys(chips):
+                        # Copies of a chip are interchangeable: use the first unused one
+                        unused = [k for k, name in enumerate(chips) if name == chip and not mask >> k & 1]
+                        if unused:
+                            options.append((chip, mask | 1 << unused[0], t if chip == "wildcard" else anchor))
+                    best = None
+                    for chip, next_mask, next_anchor in options:
+                        total = week(t, next_anchor, chip)
+                        carried = next_anchor if next_anchor is not None and t + 1 - next_anchor < h else None
+                        if t + 1 < T:
+                            total += value[next_mask, carried]
+                        if best is None or total > best[0] + 1e-9:
+                            best = (total, chip, next_mask, next_anchor)
+                    new_value[mask, anchor] = best[0]
+                    choice[mask, anchor] = best[1:]
+            value = new_value
+            decisions.append(choice)
+        decisions.reverse()
+
+        rows, mask, anchor = [], 0, None
+        for t, col in enumerate(self.pred_vars):
+            chip, mask, anchor = decisions[t][mask, anchor]
+            points = week(t, anchor, chip)
+            rows.append({"gameweek": col, "chip": chip, "points": points, "chip_gain": points - baseline[t][0]})
+            anchor = anchor if anchor is not None and t + 1 - anchor < h else None
+        self.total_points = value[0, None]
+        return pd.DataFrame(rows).set_index("gameweek")
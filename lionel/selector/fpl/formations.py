@@ -0,0 +1,79 @@
+"""
+Exact lineup selection by enumerating formations, without building a MILP.
+
+Picking `size` players under per-position (min, max) counts has a handful of valid
+formations (8 for the FPL XI). For a fixed formation the best lineup is the top players of
+each position, so the optimum is the best formation evaluated on per-position prefix sums
+of sorted points. `best_lineups` does this for many point vectors at once (e.g. posterior
+draws), vectorized over the draws:
+
+    masks, values = best_lineups(draws.T, squad_df["position"], XISelector.POS_CONSTRAINTS, 11)
+
+Ties between equal points are broken towards the earlier row.
+"""
+
+from itertools import product
+
+import numpy as np
+
+from ..core.expressions import group_positions
+
+
+def formations(pos_constraints: dict, size: int) -> np.ndarray:
+    """
+    All per-position counts within the (min, max) bounds of `pos_constraints` summing to `size`.
+    :return: Integer array of shape (n_formations, n_positions), columns in pos_constraints order.
+    """
+    ranges = [range(low, high + 1) for low, high in pos_constraints.values()]
+    counts = [combo for combo in product(*ranges) if sum(combo) == size]
+    return np.array(counts, dtype=int).reshape(len(counts), len(pos_constraints))
+
+
+def best_lineups(points, positions, pos_constraints: dict, size: int):
+    """
+    Best lineup for each row of `points`.
+
+    :param points: Array of shape (n_draws, n_players), or (n_players,) for a single lineup.
+    :param positions: Position label of each player, length n_players. Every label must be
+                      a key of pos_constraints.
+    :param pos_constraints: {position: (min, max)} counts.
+    :param size: Number of players in the lineup.
+    :return: (masks, values): boolean selections of the same shape as `points` and the lineup
+             totals, shape (n_draws,) or a float for a single lineup.
+    :raises ValueError: If a position is not in pos_constraints or no formation can be filled.
+    """
+    points = np.asarray(points, dtype=float)
+    single = points.ndim == 1
+    points = np.atleast_2d(points)
+    groups = group_positions(positions)
+    unknown = set(groups) - set(pos_constraints)
+    if unknown:
+        raise ValueError(f"Positions without bounds: {sorted(unknown)}")
+
+    available = np.array([len(groups.get(pos, ())) for pos in pos_constraints])
+    counts = formations(pos_constraints, size)
+    counts = counts[(counts <= available).all(axis=1)]
+    if not len(counts):
+        raise ValueError(f"No formation of {size} players can be filled from these candidates.")
+
+    # Per position: points sorted best first (ties keep row order) and their prefix sums
+    n_draws = len(points)
+    values = np.zeros((n_draws, len(counts)))
+    orders = []
+    for k, pos in enumerate(pos_constraints):
+        idxs = groups.get(pos, np.array([], dtype=int))
+        order = np.argsort(-points[:, idxs], axis=1, kind="stable")
+        prefix = np.zeros((n_draws, len(idxs) + 1))
+        np.cumsum(np.take_along_axis(points[:, idxs], order, axis=1), axis=1, out=prefix[:, 1:])
+        values += prefix[:, counts[:, k]]
+        orders.append((idxs, order))
+
+    best = np.argmax(values, axis=1)
+    masks = np.zeros(points.shape, dtype=bool)
+    rows = np.arange(n_draws)[:, None]
+    for k, (idxs, order) in enumerate(orders):
+        # The first counts[best, k] players of each draw's order are in the lineup
+        picked = np.arange(len(idxs)) < counts[best, k][:, None]
+        masks[rows, idxs[order]] = picked
+    totals = values[np.arange(n_draws), best]
+    return (masks[0], float(totals[0])) if single else (masks, totals)
@@ -0,0 +1,160 @@
+import numpy as np
+import pandas as pd
+import pulp
+
+from ..core.constraints import CountConstraint
+from ..core.expressions import linear_constraint
+from .xi_selector import XISelector
+from .xv_selector import XVSelector, _renumbered
+
+
+class SquadSelector(XVSelector):
+    """
+    Selects the XV, starting XI, captain and bench order in a single problem.
+
+    Extends XVSelector (budget, squad size, positions, team limit) with:
+      - Starting XI: 11 of the XV, within XISelector.POS_CONSTRAINTS
+      - Captain: one of the XI
+      - Bench: the 4 remaining players fill ordered slots. Slot 1 is the reserve GK,
+        slots 2-4 are outfield players in substitution order.
+      - Objective: maximize sum of (xi_i + c_i)*predicted_points[i]
+        + sum over bench slots k of bench_weights[k]*predicted_points[bench player k]
+
+    Bench weights roughly reflect how often each bench slot comes on, so the squad is
+    chosen knowing that only the XI scores in full.
+
+    select() sets 'xv', 'xi' and 'captain' flags and 'bench' (0 for the XI and
+    unselected players, otherwise the bench slot 1-4).
+    """
+
+    def __init__(
+        self,
+        candidate_df: pd.DataFrame,
+        pred_var: str = "predicted_points",
+        budget: float = 1000.0,
+        bench_weights=(0.05, 0.3, 0.15, 0.05),
+        backend=None,
+        prune: bool = False,
+    ):
+        """
+        :param bench_weights: Weights for bench slots 1-4 (reserve GK, then outfield order).
+                              Must be non-negative; pruning relies on it.
+        """
+        if len(bench_weights) != 4:
+            raise ValueError("bench_weights needs one weight per bench slot (4).")
+        if min(bench_weights) < 0:
+            raise ValueError("bench_weights must be non-negative.")
+        self.bench_weights = tuple(float(w) for w in bench_weights)
+
+        super().__init__(candidate_df, pred_var=pred_var, budget=budget, backend=backend, prune=prune)
+
+        positions = self.candidate_df["position"].to_numpy()
+        self.xi_vars = [pulp.LpVariable(f"xi_{i}", cat=pulp.LpBinary) for i in range(self.num_players)]
+        # bench_vars[k] maps row position -> variable for bench slot k+1; slot 1 is GK-only
+        self.bench_vars = [
+            {
+                i: pulp.LpVariable(f"bench{k + 1}_{i}", cat=pulp.LpBinary)
+                for i in np.flatnonzero((positions == "GK") if k == 0 else (positions != "GK"))
+            }
+            for k in range(4)
+        ]
+
+        self._xi_position_bounds = XISelector.position_bounds()
+        self.add_constraint(self._constraint_xi)
+        self.add_constraint(self._constraint_bench)
+
+    def _cache_params(self):
+        return {
+            **super()._cache_params(),
+            "bench_weights": self.bench_weights,
+            "xi_positions": XISelector.POS_CONSTRAINTS,
+        }
+
+    def _solution_variables(self):
+        return super()._solution_variables() + self.xi_vars + [var for slot in self.bench_vars for var in slot.values()]
+
+    def _objective_with_captains(self, candidate_df, decision_vars):
+        """
+        Maximize points of the XI, doubled for the captain, plus weighted bench points.
+        """
+        points = candidate_df[self.pred_var].to_numpy(dtype=float)
+        terms = list(zip(self.xi_vars, points.tolist())) + list(zip(self.captain_vars, points.tolist()))
+        for weight, slot in zip(self.bench_weights, self.bench_vars):
+            terms.extend((var, weight * points[i]) for i, var in slot.items())
+        return pulp.LpAffineExpression(terms)
+
+    def _constraint_captain_must_be_selected(self, candidate_df, decision_vars):
+        """
+        For each player i: xi_i >= c_i (the captain must start).
+        """
+        return [
+            pulp.LpConstraint(pulp.LpAffineExpression([(xi, 1), (c, -1)]), sense=pulp.LpConstraintGE, rhs=0)
+            for xi, c in zip(self.xi_vars, self.captain_vars)
+        ]
+
+    def _constraint_xi(self, candidate_df, decision_vars):
+        """
+        Exactly 11 starters, each within position limits.
+        """
+        return CountConstraint(eq=11)(candidate_df, self.xi_vars) + self._xi_position_bounds(candidate_df, self.xi_vars)
+
+    def _constraint_bench(self, candidate_df, decision_vars):
+        """
+        Each squad player either starts or takes exactly one bench slot, and each slot is filled once:
+        x_i = xi_i + sum_k bench_k_i, sum_i bench_k_i = 1.
+        """
+        constraints = [linear_constraint(list(slot.values()), pulp.LpConstraintEQ, 1) for slot in self.bench_vars]
+        for i, (x, xi) in enumerate(zip(decision_vars, self.xi_vars)):
+            slots = [slot[i] for slot in self.bench_vars if i in slot]
+            constraints.append(
+                linear_constraint([x, xi] + slots, pulp.LpConstraintEQ, 0, coefficients=[1, -1] + [-1] * len(slots))
+            )
+        return constraints
+
+    def _remap_rows(self, moved):
+        super()._remap_rows(moved)
+        self.xi_vars = _renumbered(self.xi_vars, moved, self.num_players, "xi")
+        positions = self.candidate_df["position"].to_numpy()
+        for k, slot in enumerate(self.bench_vars):
+            rows = np.flatnonzero((positions == "GK") if k == 0 else (positions != "GK"))
+            moved_slot = {int(moved[i]): var for i, var in slot.items()}
+            self.bench_vars[k] = {}
+            for i in rows.tolist():
+                var = moved_slot.get(i) or pulp.LpVariable(f"bench{k + 1}_{i}", cat=pulp.LpBinary)
+                var.name = f"bench{k + 1}_{i}"
+                self.bench_vars[k][i] = var
+
+    def _bench_slots(self) -> np.ndarray:
+        """Bench slot (1-4) of each candidate in the current solution, 0 if not on the bench."""
+        bench = np.zeros(self.num_players, dtype=int)
+        for k, slot in enumerate(self.bench_vars):
+            idxs = np.fromiter(slot.keys(), dtype=int, count=len(slot))
+            bench[idxs[self._values(list(slot.values())) > 0.5]] = k + 1
+        return bench
+
+    def _selection_flags(self, mask):
+        return {**super()._selection_flags(mask), "xi": self._values(self.xi_vars) > 0.5, "bench": self._bench_slots()}
+
+    def select(self, warm_start: bool = False):
+        """
+        Solves the problem and returns the marked frame (see XVSelector.select), with
+        'xi'=1 for starters and 'bench'=1-4 for the bench order. For a CandidatePool,
+        returns a Selection with 'xv', 'captain', 'xi' and 'bench' flags instead.
+        """
+        result = super().select(warm_start=warm_start)
+        if self.pool is not None:
+            return result
+
+        xi = self._values(self.xi_vars) > 0.5
+        bench = self._bench_slots()
+        xi_labels = self.candidate_df.index[xi]
+        bench_order = pd.Series(bench[bench > 0], index=self.candidate_df.index[bench > 0])
+
+        # Mark the same frames XVSelector marks (the full frame too when pruned)
+        frames = [self.candidate_df, self.selected_df] + ([result] if result is not self.candidate_df else [])
+        for df in frames:
+            df["xi"] = 0
+            df.loc[xi_labels, "xi"] = 1
+            df["bench"] = 0
+            df.loc[bench_order.index, "bench"] = bench_order
+        return result
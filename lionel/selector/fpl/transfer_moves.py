@@ -0,0 +1,227 @@
+"""
+Exact enumeration of every squad reachable from a current squad with at most two transfers.
+
+A transfer swaps a squad player for a non-squad player of the same position (position
+quotas are exact), so one transfer means 15 x (candidates of that position) moves and
+two transfers 105 outgoing pairs x incoming pairs of matching positions. Moves are
+filtered in NumPy, one vectorized pass per outgoing player or pair:
+
+  - budget: the squad's cost minus outgoing plus incoming prices is within the budget;
+  - team cap: the incoming players fit the room their teams have left once the outgoing
+    players are gone (and no team is over the cap after they go);
+  - captain: the new squad's best player, from the best squad players not sold and the
+    incoming players, so the objective is that of the best captain for every move.
+
+Incoming pairs are built once per pair of positions, sorted by points, and shared by all
+outgoing pairs. With `top`, only that many best moves are kept, which keeps the result
+small; without it every feasible move is returned (millions for two transfers on a full
+pool). Outgoing pairs are then tried cheapest in points first, and only the prefix of
+incoming pairs whose points could still beat the current `top`-th best move is filtered,
+so `top=1` (the best move, as UpdateXVSelector.select uses it) checks few pairs.
+Positions with more than `max_pairs` incoming pairs (a pool of tens of thousands of players)
+raise PairLimitReached instead of exhausting memory; UpdateXVSelector then falls back to the MILP.
+
+Usage:
+    moves = rank_moves(points, prices, positions, teams, squad, budget=1000, max_transfers=2, top=50)
+    moves.iloc[0]   # the best move: row positions out_1, out_2, in_1, in_2 (-1 if unused)
+"""
+
+from itertools import combinations
+
+import numpy as np
+import pandas as pd
+
+TOLERANCE = 1e-9
+COLUMNS = ["transfers", "out_1", "out_2", "in_1", "in_2", "objective", "cost", "captain"]
+# Most incoming pairs of one pair of positions held at once (about 70 bytes each at peak)
+MAX_PAIRS = 20_000_000
+
+
+class PairLimitReached(Exception):
+    """Raised when two transfers need more than `max_pairs` incoming pairs of one pair of positions."""
+
+
+def _in_pairs(by_position, first, second, points, prices, teams, min_points=-np.inf, max_pairs=MAX_PAIRS):
+    """
+    Incoming pairs (first position, second position) as arrays of positions, sums and teams,
+    by points, best first. Pairs scoring less than `min_points` together are left out.
+    """
+    a, b = by_position.get(first, np.empty(0, int)), by_position.get(second, np.empty(0, int))
+    if len(a) and len(b):
+        # Players who can't reach min_points even with the best partner are in no pair
+        a, b = a[points[a] + points[b].max() >= min_points], b[points[b] + points[a].max() >= min_points]
+    n_pairs = len(a) * (len(a) - 1) // 2 if first == second else len(a) * len(b)
+    if n_pairs > max_pairs:
+        raise PairLimitReached(f"{n_pairs} incoming {first}/{second} pairs exceed the limit of {max_pairs}.")
+    if first == second:
+        i, j = np.triu_indices(len(a), 1)
+        in_1, in_2 = a[i], a[j]
+    else:
+        in_1, in_2 = np.repeat(a, len(b)), np.tile(b, len(a))
+    pair_points = points[in_1] + points[in_2]
+    candidates = np.flatnonzero(pair_points >= min_points)
+    order = candidates[np.argsort(-pair_points[candidates], kind="stable")]
+    in_1, in_2 = in_1[order], in_2[order]
+    return {
+        "in_1": in_1,
+        "in_2": in_2,
+        "price": prices[in_1] + prices[in_2],
+        "points": points[in_1] + points[in_2],
+        "best": np.where(points[in_1] >= points[in_2], in_1, in_2),
+        "team_1": teams[in_1],
+        "team_2": teams[in_2],
+        "same_team": teams[in_1] == teams[in_2],
+    }
+
+
+def _keep_top(objective, top):
+    """Positions of the `top` largest objectives (all of them when top is None)."""
+    if top is None or len(objective) <= top:
+        return np.arange(len(objective))
+    return np.argpartition(-objective, top - 1)[:top]
+
+
+def rank_moves(
+    points,
+    prices,
+    positions,
+    teams,
+    squad,
+    budget: float,
+    max_transfers: int = 2,
+    max_per_team: int = 3,
+    top: int = None,
+    max_pairs: int = MAX_PAIRS,
+) -> pd.DataFrame:
+    """
+    Every feasible squad within `max_transfers` transfers of `squad`, best first.
+
+    :param points: Per-candidate predicted points.
+    :param prices: Per-candidate prices.
+    :param positions: Per-candidate positions.
+    :param teams: Per-candidate teams.
+    :param squad: Row positions of the 15 current players.
+    :param budget: Maximum cost of the new squad.
+    :param max_transfers: 0, 1 or 2.
+    :param max_per_team: Maximum players from one team.
+    :param top: Keep only the best `top` moves. Defaults to all.
+    :param max_pairs: Limit on the incoming pairs of one pair of positions.
+    :return: DataFrame with 'transfers', 'out_1', 'out_2', 'in_1', 'in_2' (row positions,
+             -1 where unused), 'objective' (squad points plus the best captain's), 'cost'
+             and 'captain' (row position), sorted by objective (fewer transfers first on ties).
+    :raises PairLimitReached: If two transfers need more than max_pairs incoming pairs.
+    """
+    if max_transfers not in (0, 1, 2):
+        raise ValueError("Transfer enumeration handles at most 2 transfers.")
+    points = np.asarray(points, dtype=float)
+    prices = np.asarray(prices, dtype=float)
+    positions = np.asarray(positions)
+    teams = pd.factorize(np.asarray(teams))[0]
+    squad = np.asarray(squad, dtype=int)
+    if len(squad) != 15 or len(np.unique(squad)) != 15:
+        raise ValueError("A squad must have 15 distinct players.")
+
+    in_squad = np.zeros(len(points), dtype=bool)
+    in_squad[squad] = True
+    outside = np.flatnonzero(~in_squad)
+    by_position = {position: outside[positions[outside] == position] for position in np.unique(positions[outside])}
+    counts = np.bincount(teams[squad], minlength=teams.max() + 1)
+    cost, total = prices[squad].sum(), points[squad].sum()
+    # Squad players by points, best first: the captain of a move is among the first three or incoming
+    ranked = squad[np.argsort(-points[squad], kind="stable")]
+
+    blocks = []
+    # The `top` best objectives so far; moves below the worst of them can be skipped
+    best_objectives = np.empty(0)
+
+    def threshold():
+        return best_objectives.min() - TOLERANCE if top is not None and len(best_objectives) >= top else -np.inf
+
+    def add(transfers, out, incoming, objective, new_cost, captain):
+        nonlocal best_objectives
+        keep = _keep_top(objective, top)
+        if top is not None:
+            best_objectives = np.concatenate([best_objectives, objective[keep]])
+            best_objectives = best_objectives[_keep_top(best_objectives, top)]
+        n = len(keep)
+        columns = [np.full(n, transfers)]
+        for group in (out, incoming):
+            columns += [np.broadcast_to(group[k], n) if np.ndim(group[k]) == 0 else group[k][keep] for k in (0, 1)]
+        columns += [objective[keep], new_cost[keep], captain[keep]]
+        blocks.append(columns)
+
+    none = np.array(-1)
+    if counts.max() <= max_per_team and cost <= budget + TOLERANCE:
+        captain = np.array([ranked[0]])
+        add(0, (none, none), (none, none), np.array([total + points[ranked[0]]]), np.array([cost]), captain)
+
+    if max_transfers >= 1:
+        for out in squad:
+            remaining = counts.copy()
+            remaining[teams[out]] -= 1
+            incoming = by_position.get(positions[out])
+            if remaining.max() > max_per_team or incoming is None:
+                continue
+            new_cost = cost - prices[out] + prices[incoming]
+            ok = (new_cost <= budget + TOLERANCE) & (remaining[teams[incoming]] < max_per_team)
+            incoming, new_cost = incoming[ok], new_cost[ok]
+            kept = ranked[0] if ranked[0] != out else ranked[1]
+            captain = np.where(points[incoming] > points[kept], incoming, kept)
+            objective = total - points[out] + points[incoming] + points[captain]
+            add(1, (np.array(out), none), (incoming, none), objective, new_cost, captain)
+
+    if max_transfers >= 2:
+        pairs = {}
+        # The best captain any move can have, to bound objectives before filtering
+        best_points = points.max()
+        # No move can gain more than selling the two lowest scorers; pairs that can't reach the
+        # threshold from there are never needed
+        min_points = threshold() - (total - np.sort(points[squad])[:2].sum() + best_points)
+        # Selling the lowest scorers first finds good moves early, raising the threshold
+        for out_1, out_2 in combinations(squad[np.argsort(points[squad], kind="stable")].tolist(), 2):
+            remaining = counts.copy()
+            remaining[teams[out_1]] -= 1
+            remaining[teams[out_2]] -= 1
+            if remaining.max() > max_per_team:
+                continue
+            # Incoming pairs only need to match the outgoing positions as a set
+            key = tuple(sorted((positions[out_1], positions[out_2])))
+            if key not in pairs:
+                pairs[key] = _in_pairs(by_position, *key, points, prices, teams, min_points, max_pairs)
+            incoming = pairs[key]
+            base = total - points[out_1] - points[out_2] + best_points
+            # Incoming points are sorted best first: only a prefix can reach the threshold
+            end = len(incoming["points"])
+            if top is not None:
+                end = np.searchsorted(-incoming["points"], base - threshold(), side="right")
+            if end == 0:
+                continue
+            incoming = {name: values[:end] for name, values in incoming.items()}
+            room = max_per_team - remaining
+            fits = np.where(
+                incoming["same_team"],
+                room[incoming["team_1"]] >= 2,
+                (room[incoming["team_1"]] >= 1) & (room[incoming["team_2"]] >= 1),
+            )
+            new_cost = cost - prices[out_1] - prices[out_2] + incoming["price"]
+            ok = np.flatnonzero(fits & (new_cost <= budget + TOLERANCE))
+            kept = next(player for player in ranked[:3] if player != out_1 and player != out_2)
+            best = incoming["best"][ok]
+            captain = np.where(points[best] > points[kept], best, kept)
+            objective = total - points[out_1] - points[out_2] + incoming["points"][ok] + points[captain]
+            add(
+                2,
+                (np.array(out_1), np.array(out_2)),
+                (incoming["in_1"][ok], incoming["in_2"][ok]),
+                objective,
+                new_cost[ok],
+                captain,
+            )
+
+    if not blocks:
+        return pd.DataFrame({column: [] for column in COLUMNS}).astype({"objective": float, "cost": float})
+    columns = [np.concatenate(parts) for parts in zip(*blocks)]
+    order = _keep_top(columns[5], top)
+    # Best objective first; on ties, fewer transfers first
+    order = order[np.lexsort((columns[0][order], -columns[5][order]))]
+    return pd.DataFrame({column: values[order] for column, values in zip(COLUMNS, columns)}).reset_index(drop=True)
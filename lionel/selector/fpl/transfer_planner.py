@@ -0,0 +1,280 @@
+import numpy as np
+import pandas as pd
+import pulp
+
+from ..core.constraints import CountConstraint
+from ..core.expressions import linear_expression
+from ..core.solvers import get_backend
+from .update_xv_selector import UpdateXVSelector
+
+
+class TransferPlanner(UpdateXVSelector):
+    """
+    Plans squads and transfers over several gameweeks in a single MILP.
+
+    Extends UpdateXVSelector: the first gameweek uses the inherited decision and
+    captain variables, and every later gameweek gets its own copy of the XV
+    constraints (size, budget, positions, team cap, one captain in the squad).
+    Squads are linked between gameweeks by transfer variables:
+
+      - transfers_t = number of players in squad t that were not in squad t-1
+      - used_t = min(free_t, transfers_t) free transfers are used first, as in the game
+      - hits_t = transfers_t - used_t (each hit costs `hit_cost` points)
+      - free_{t+1} = min(free_t - used_t + 1, `max_free_transfers`) (unused free transfers
+        are banked)
+
+    The minimums are modelled with one binary per gameweek each, so hits can't be taken to
+    bank free transfers.
+
+    Objective: sum over gameweeks of (squad + captain) predicted points, each weighted
+    by discount**t, minus hit costs.
+
+    Expects the input DataFrame to have the UpdateXVSelector columns ('xv' marking the
+    current squad, 'price', 'team', 'position') plus one predicted points column per
+    gameweek, listed in order in `pred_vars`.
+    """
+
+    def __init__(
+        self,
+        candidate_df: pd.DataFrame,
+        pred_vars: list,
+        free_transfers: int = 1,
+        max_free_transfers: int = 5,
+        hit_cost: float = 4.0,
+        max_transfers: int = None,
+        discount: float = 1.0,
+        budget: float = 1000.0,
+        backend=None,
+        time_limit: float = None,
+        gap_rel: float = None,
+    ):
+        """
+        :param pred_vars: Predicted points column per gameweek, e.g. ['points_gw1', 'points_gw2', ...].
+        :param free_transfers: Free transfers available in the first gameweek.
+        :param max_free_transfers: Most free transfers that can be banked.
+        :param hit_cost: Points deducted per transfer beyond the free ones.
+        :param max_transfers: Optional cap on transfers in every gameweek.
+        :param discount: Weight multiplier per gameweek ahead (1.0 = no discounting).
+        :param time_limit: Solver wall-clock limit in seconds; the best plan found is returned.
+        :param gap_rel: Relative MIP gap at which the solver may stop.
+        """
+        if len(pred_vars) == 0:
+            raise ValueError("pred_vars must name at least one predicted points column.")
+        for col in pred_vars:
+            if col not in candidate_df.columns:
+                raise ValueError(f"'{col}' not found in candidate_df columns.")
+
+        self.pred_vars = list(pred_vars)
+        self.horizon = len(self.pred_vars)
+        self.free_transfers = free_transfers
+        self.max_free_transfers = max_free_transfers
+        self.hit_cost = hit_cost
+        self.discount = discount
+        if backend is None or isinstance(backend, str):
+            backend = get_backend(backend, time_limit=time_limit, gap_rel=gap_rel)
+
+        super().__init__(
+            candidate_df,
+            max_transfers=max_transfers,
+            pred_var=self.pred_vars[0],
+            budget=budget,
+            backend=backend,
+        )
+
+        # Gameweek 0 reuses the inherited variables; later gameweeks get their own
+        n = self.num_players
+        self.squad_vars = [self.decision_vars] + [
+            [pulp.LpVariable(f"x{t}_{i}", cat=pulp.LpBinary) for i in range(n)] for t in range(1, self.horizon)
+        ]
+        self.captain_vars_by_gw = [self.captain_vars] + [
+            [pulp.LpVariable(f"capt{t}_{i}", cat=pulp.LpBinary) for i in range(n)] for t in range(1, self.horizon)
+        ]
+        # transfer_in_vars[t][i] >= x_t[i] - x_{t-1}[i]; gameweek 0 compares against the fixed squad
+        self.transfer_in_vars = [None] + [
+            [pulp.LpVariable(f"in{t}_{i}", lowBound=0, upBound=1) for i in range(n)] for t in range(1, self.horizon)
+        ]
+        self.hit_vars = [pulp.LpVariable(f"hits_{t}", lowBound=0, cat=pulp.LpInteger) for t in range(self.horizon)]
+        self.free_transfer_vars = [pulp.LpVariable("free_0", lowBound=free_transfers, upBound=free_transfers)] + [
+            pulp.LpVariable(f"free_{t}", lowBound=0, upBound=max_free_transfers, cat=pulp.LpInteger)
+            for t in range(1, self.horizon)
+        ]
+        self.used_free_vars = [
+            pulp.LpVariable(f"used_{t}", lowBound=0, cat=pulp.LpInteger) for t in range(self.horizon)
+        ]
+        # 1 when gameweek t uses all its free transfers (used_t = free_t), 0 when used_t = transfers_t
+        self.all_free_used_vars = [pulp.LpVariable(f"all_used_{t}", cat=pulp.LpBinary) for t in range(self.horizon)]
+        # 1 when free_{t+1} is held at max_free_transfers
+        self.free_capped_vars = [None] + [
+            pulp.LpVariable(f"capped_{t}", cat=pulp.LpBinary) for t in range(1, self.horizon)
+        ]
+
+        self.set_objective_function(self._objective_horizon)
+        self.add_constraint(self._constraint_later_squads)
+        self.add_constraint(self._constraint_transfers)
+
+    def _cache_columns(self):
+        return super()._cache_columns() + self.pred_vars
+
+    def _cache_params(self):
+        return {
+            **super()._cache_params(),
+            "pred_vars": self.pred_vars,
+            "free_transfers": self.free_transfers,
+            "max_free_transfers": self.max_free_transfers,
+            "hit_cost": self.hit_cost,
+            "discount": self.discount,
+        }
+
+    def _solution_variables(self):
+        later = [var for t in range(1, self.horizon) for var in self.squad_vars[t] + self.captain_vars_by_gw[t]]
+        return super()._solution_variables() + later
+
+    def _transfers_expression(self, t):
+        """Number of players brought in at gameweek t."""
+        if t == 0:
+            new_players = np.flatnonzero(self.current_xv == 0)
+            return linear_expression([self.decision_vars[i] for i in new_players])
+        return linear_expression(self.transfer_in_vars[t])
+
+    def _objective_horizon(self, candidate_df, decision_vars):
+        """
+        Maximize discounted (squad + captain) predicted points over the horizon, minus hit costs.
+        """
+        terms = []
+        for t, col in enumerate(self.pred_vars):
+            points = candidate_df[col].to_numpy(dtype=float) * self.discount**t
+            terms.extend(zip(self.squad_vars[t], points.tolist()))
+            terms.extend(zip(self.captain_vars_by_gw[t], points.tolist()))
+            terms.append((self.hit_vars[t], -self.hit_cost))
+        return pulp.LpAffineExpression(terms)
+
+    def _constraint_max_transfers(self, candidate_df, decision_vars):
+        """
+        Optional cap on transfers in each gameweek (replaces UpdateXVSelector's single-gameweek limit).
+        """
+        if self.max_transfers is None:
+            return []
+        return [
+            pulp.LpConstraint(
+                self._transfers_expression(t),
+                sense=pulp.LpConstraintLE,
+                rhs=self.max_transfers,
+                name="max_transfers" if t == 0 else f"max_transfers_{t}",
+            )
+            for t in range(self.horizon)
+        ]
+
+    def _constraint_later_squads(self, candidate_df, decision_vars):
+        """
+        Repeats the XV constraints (size, budget, positions, team cap, captaincy) for gameweeks 1..N-1.
+        """
+        constraints = []
+        for t in range(1, self.horizon):
+            squad, captains = self.squad_vars[t], self.captain_vars_by_gw[t]
+            constraints.extend(self._constraint_xv_size(candidate_df, squad))
+            constraints.extend(self._constraint_budget(candidate_df, squad))
+            constraints.extend(self._constraint_positions(candidate_df, squad))
+            constraints.extend(self._constraint_max_team(candidate_df, squad))
+            constraints.extend(CountConstraint(eq=1)(candidate_df, captains))
+            constraints.extend(
+                pulp.LpConstraint(pulp.LpAffineExpression([(x, 1), (c, -1)]), sense=pulp.LpConstraintGE, rhs=0)
+                for x, c in zip(squad, captains)
+            )
+        for con in constraints:
+            con.name = None  # names like 'budget' belong to gameweek 0
+        return constraints
+
+    def _constraint_transfers(self, candidate_df, decision_vars):
+        """
+        Links consecutive squads: counts transfers, uses free transfers first, charges hits and
+        banks unused free transfers.
+        """
+        # Bounds transfers_t (at most 15) and free_t, for the big-M rows of the minimums
+        big_m = max(15, self.free_transfers, self.max_free_transfers)
+        constraints = []
+        for t in range(self.horizon):
+            if t > 0:
+                for x_in, x_now, x_prev in zip(self.transfer_in_vars[t], self.squad_vars[t], self.squad_vars[t - 1]):
+                    constraints.append(
+                        pulp.LpConstraint(
+                            pulp.LpAffineExpression([(x_in, 1), (x_now, -1), (x_prev, 1)]),
+                            sense=pulp.LpConstraintGE,
+                            rhs=0,
+                        )
+                    )
+            transfers = self._transfers_expression(t)
+            free, hits, used, all_used = (
+                self.free_transfer_vars[t],
+                self.hit_vars[t],
+                self.used_free_vars[t],
+                self.all_free_used_vars[t],
+            )
+            # used_t = min(free_t, transfers_t)
+            constraints.append(used - free <= 0)
+            constraints.append(used - transfers <= 0)
+            constraints.append(used - free - big_m * all_used >= -big_m)
+            constraints.append(used - transfers + big_m * all_used >= 0)
+            # hits_t = transfers_t - used_t
+            constraints.append(hits - transfers + used == 0)
+            if t + 1 < self.horizon:
+                # free_{t+1} = min(free_t - used_t + 1, max_free_transfers); the cap is its upper bound
+                following, capped = self.free_transfer_vars[t + 1], self.free_capped_vars[t + 1]
+                constraints.append(following - free + used <= 1)
+                constraints.append(following - free + used + big_m * capped >= 1)
+                constraints.append(following - self.max_free_transfers * capped >= 0)
+        return constraints
+
+    def set_max_transfers(self, max_transfers: int):
+        """
+        Changes the cap on transfers in every gameweek; a built problem is updated in place
+        unless the cap is added or removed (None).
+        """
+        previous, self.max_transfers = self.max_transfers, max_transfers
+        if not self._built:
+            return
+        if previous is None or max_transfers is None:
+            self._built = False
+            return
+        for t in range(self.horizon):
+            self.set_rhs("max_transfers" if t == 0 else f"max_transfers_{t}", max_transfers)
+
+    def select(self, warm_start: bool = False):
+        """
+        Solves the plan. Marks the first gameweek's squad in 'xv'/'captain' like UpdateXVSelector
+        and sets:
+          - squads: 0/1 DataFrame (candidates x gameweeks) of the planned squads
+          - captains: same shape, the planned captains
+          - transfers: one row per transfer with 'gameweek', 'out' and 'in' index labels
+          - summary: per-gameweek transfers, free transfers, hits and predicted points
+        """
+        result = super().select(warm_start=warm_start)
+
+        index = self.candidate_df.index
+        squads = np.column_stack([self._values(v) > 0.5 for v in self.squad_vars]).astype(int)
+        captains = np.column_stack([self._values(v) > 0.5 for v in self.captain_vars_by_gw]).astype(int)
+        self.squads = pd.DataFrame(squads, index=index, columns=self.pred_vars)
+        self.captains = pd.DataFrame(captains, index=index, columns=self.pred_vars)
+
+        rows, summary = [], []
+        previous, free = self.current_xv.astype(bool), self.free_transfers
+        for t, col in enumerate(self.pred_vars):
+            current = squads[:, t].astype(bool)
+            outs, ins = index[previous & ~current], index[current & ~previous]
+            rows.extend({"gameweek": col, "out": o, "in": i} for o, i in zip(outs, ins))
+            # Hits follow the game's rules: only transfers beyond the free ones are charged
+            hits = max(0, len(ins) - free)
+            points = self.candidate_df[col].to_numpy(dtype=float)
+            summary.append(
+                {
+                    "gameweek": col,
+                    "transfers": len(ins),
+                    "free_transfers": free,
+                    "hits": hits,
+                    "predicted_points": float(points @ (squads[:, t] + captains[:, t])) - self.hit_cost * hits,
+                }
+            )
+            free = min(free - (len(ins) - hits) + 1, self.max_free_transfers)
+            previous = current
+        self.transfers = pd.DataFrame(rows, columns=["gameweek", "out", "in"])
+        self.summary = pd.DataFrame(summary).set_index("gameweek")
+        return result
@@ -1,6 +1,8 @@
+import numpy as np
 import pandas as pd
-import pulp
 
+from ..core.constraints import CountConstraint
+from .transfer_moves import PairLimitReached, rank_moves
 from .xv_selector import XVSelector
 
 
@@ -16,6 +18,17 @@ class UpdateXVSelector(XVSelector):
 
     Adds one extra constraint:
       - You can only add up to 'max_transfers' new players (i.e., those who previously had xv=0).
+
+    `prune=True` drops dominated non-squad candidates (see XVSelector).
+
+    The existing squad is captured at construction, so the problem can be re-solved with new
+    predictions (`set_predictions`) or transfer limits (`set_max_transfers`) without rebuilding.
+    `select(warm_start=True)` starts from the existing squad on the first solve and from the
+    previous incumbent afterwards.
+
+    With `exact=True` and at most 2 transfers, `select()` enumerates every reachable squad in
+    NumPy (see lionel.selector.fpl.transfer_moves) instead of solving the MILP.
+    `rank_transfers()` always enumerates, returning every reachable squad ranked.
     """
 
     def __init__(
@@ -24,27 +37,133 @@ class UpdateXVSelector(XVSelector):
         max_transfers: int = 1,
         pred_var: str = "predicted_points",
         budget: float = 1000.0,
+        backend=None,
+        prune: bool = False,
+        exact: bool = False,
     ):
-        super().__init__(candidate_df, pred_var=pred_var, budget=budget)
-        self.max_transfers = max_transfers
-
         # Validate that the existing team has exactly 15 players selected
-        if "xv" not in self.candidate_df.columns:
+        if "xv" not in candidate_df.columns:
             raise ValueError("candidate_df must have an 'xv' column to track existing squad.")
-        if self.candidate_df["xv"].sum() != 15:
+        if candidate_df["xv"].sum() != 15:
             raise ValueError("The existing squad must have exactly 15 players set to 'xv=1'.")
 
+        super().__init__(candidate_df, pred_var=pred_var, budget=budget, backend=backend, prune=prune, exact=exact)
+        self.max_transfers = max_transfers
+
+        # Snapshot the existing squad: select() overwrites the 'xv' column with the new squad
+        self.current_xv = self.candidate_df["xv"].to_numpy().copy()
+        self.set_initial_squad(self.current_xv, captain=self._current_captain())
+
         # Add the constraint for the maximum number of new players
         self.add_constraint(self._constraint_max_transfers)
 
+    def _cache_params(self):
+        return {**super()._cache_params(), "max_transfers": self.max_transfers, "current_xv": self.current_xv}
+
     def _constraint_max_transfers(self, candidate_df, decision_vars):
         """
         For players who currently have xv=0 (not in the existing squad),
         limit how many of those can be added to at most 'max_transfers'.
         """
-        # Identify row labels where xv==0
-        new_player_labels = candidate_df.index[candidate_df["xv"] == 0].tolist()
-        # Convert those labels to integer positions
-        new_player_positions = [candidate_df.index.get_loc(lbl) for lbl in new_player_labels]
+        return CountConstraint(max=self.max_transfers, where=self.current_xv == 0, name="max_transfers")(
+            candidate_df, decision_vars
+        )
+
+    def _builtin_constraints(self):
+        return super()._builtin_constraints() + [self._constraint_max_transfers]
+
+    def _solve_direct(self):
+        """Enumerates the moves for up to 2 transfers; without a binding limit, XVSelector's branch and bound."""
+        if not self._exact_problem():
+            return None
+        if self.max_transfers is None or self.max_transfers >= 15:
+            return super()._solve_direct()
+        if self.max_transfers > 2:
+            return None
+        if any(var.lowBound not in (None, 0) or var.upBound not in (None, 1) for var in self.decision_vars):
+            return None
+        try:
+            moves = self._rank_moves(self.max_transfers, top=1)
+        except PairLimitReached:
+            # Too many incoming pairs to hold (a very large pool): leave it to the MILP
+            return None
+        if moves.empty:
+            # Infeasible: let the MILP report the status
+            return None
+        best = moves.iloc[0]
+        out = [int(best[column]) for column in ("out_1", "out_2") if best[column] >= 0]
+        incoming = [int(best[column]) for column in ("in_1", "in_2") if best[column] >= 0]
+        values = np.zeros(2 * self.num_players)
+        values[np.flatnonzero(self.current_xv == 1)] = 1
+        values[out] = 0
+        values[incoming] = 1
+        values[self.num_players + int(best["captain"])] = 1
+        return values, float(best["objective"])
 
-        return pulp.lpSum([decision_vars[i] for i in new_player_positions]) <= self.max_transfers
+    def _rank_moves(self, max_transfers: int, top: int = None) -> pd.DataFrame:
+        """rank_moves on this selector's candidates, squad and budget (row positions)."""
+        df = self.candidate_df
+        return rank_moves(
+            df[self.pred_var],
+            df["price"],
+            df["position"],
+            df["team"],
+            np.flatnonzero(self.current_xv == 1),
+            self.budget,
+            max_transfers=max_transfers,
+            max_per_team=self.MAX_PER_TEAM,
+            top=top,
+        )
+
+    def rank_transfers(self, max_transfers: int = None, top: int = None) -> pd.DataFrame:
+        """
+        Every squad reachable from the existing one with at most `max_transfers` (0-2) transfers,
+        ranked by objective, rather than the single optimum `select()` finds.
+        Variable bounds and added constraints are not taken into account.
+        :param max_transfers: Defaults to the selector's limit.
+        :param top: Keep only the best `top` moves. Two transfers on a full pool give millions.
+        :return: DataFrame with 'transfers', 'out_1', 'out_2', 'in_1', 'in_2' and 'captain'
+                 (candidate_df index labels, missing where unused), 'objective' (squad points
+                 plus the captain's), 'gain' (over keeping the squad with its best captain)
+                 and 'cost', best first.
+        :raises PairLimitReached: If two transfers need too many incoming pairs (see transfer_moves).
+        """
+        max_transfers = self.max_transfers if max_transfers is None else max_transfers
+        moves = self._rank_moves(max_transfers, top=top)
+        points = self.candidate_df[self.pred_var].to_numpy(dtype=float)[self.current_xv == 1]
+        moves.insert(6, "gain", moves["objective"] - points.sum() - points.max())
+        labels = self.candidate_df.index
+        for column in ("out_1", "out_2", "in_1", "in_2", "captain"):
+            positions = moves[column].to_numpy(dtype=int)
+            values = pd.Series(labels.take(np.maximum(positions, 0)), index=moves.index)
+            if pd.api.types.is_integer_dtype(values):
+                values = values.astype("Int64")
+            moves[column] = values.mask(positions < 0)
+        return moves
+
+    def _protected_rows(self, candidate_df):
+        """
+        Never prune the existing squad: swapping an existing player for a dominator
+        could cost a transfer. Non-squad players can be replaced by any dominator.
+        """
+        return candidate_df["xv"].to_numpy() == 1
+
+    def _remap_rows(self, moved):
+        super()._remap_rows(moved)
+        # Restored candidates are outside the existing squad, which is never pruned
+        current_xv = np.zeros(self.num_players, dtype=self.current_xv.dtype)
+        current_xv[moved] = self.current_xv
+        self.current_xv = current_xv
+
+    def _current_captain(self):
+        """Integer position of the existing captain, or None if there isn't a valid one."""
+        if "captain" not in self.candidate_df.columns:
+            return None
+        captains = np.flatnonzero((self.candidate_df["captain"].to_numpy() == 1) & (self.current_xv == 1))
+        return int(captains[0]) if len(captains) == 1 else None
+
+    def set_max_transfers(self, max_transfers: int):
+        """Changes the transfer limit; a built problem is updated in place."""
+        self.max_transfers = max_transfers
+        if self._built:
+            self.set_rhs("max_transfers", max_transfers)
@@ -1,7 +1,10 @@
+import numpy as np
 import pandas as pd
-import pulp
 
 from ..core.base_selector import BaseSelector
+from ..core.constraints import CountConstraint
+from ..core.expressions import linear_expression
+from .formations import best_lineups
 
 
 class XISelector(BaseSelector):
@@ -12,6 +15,11 @@ class XISelector(BaseSelector):
       - Maximize a column of predicted points (pred_var).
       - Enforce exactly 11 selections.
       - Enforce position constraints (using POS_CONSTRAINTS).
+
+    With `exact=True` and only these built-in objective and constraints, `select()` solves the
+    problem exactly by enumerating formations (see lionel.selector.fpl.formations) instead of
+    building and solving a MILP. It reaches the MILP's objective, but when predicted points tie
+    it may pick another of the tied XIs. `best_xi_batch` enumerates many point vectors at once.
     """
 
     # Minimum and maximum number of each position allowed
@@ -22,28 +30,71 @@ class XISelector(BaseSelector):
         "FWD": (1, 3),
     }
 
-    def __init__(self, candidate_df: pd.DataFrame, pred_var: str = "predicted_points"):
-        super().__init__(candidate_df)
+    def __init__(
+        self, candidate_df: pd.DataFrame, pred_var: str = "predicted_points", backend=None, exact: bool = False
+    ):
+        super().__init__(candidate_df, backend=backend)
         self.pred_var = pred_var
+        self.exact = exact
 
         if self.pred_var not in self.candidate_df.columns:
             raise ValueError(f"'{self.pred_var}' not found in candidate_df columns.")
 
+        # Kept so its position groups are computed once per frame (see SumConstraint)
+        self._position_bounds = self.position_bounds()
+
         self.set_objective_function(self.default_objective)
         self.add_constraint(self.constraint_xi_size)
         self.add_constraint(self.constraint_positions)
 
+    def _cache_columns(self):
+        return [self.pred_var, "position"]
+
+    def _cache_params(self):
+        return {**super()._cache_params(), "positions": self.POS_CONSTRAINTS, "exact": self.exact}
+
+    @classmethod
+    def best_xi_batch(cls, points, positions):
+        """
+        Best XI for each row of `points`, e.g. posterior draws for a squad.
+        :param points: Array of shape (n_draws, n_players), or (n_players,).
+        :param positions: Position of each player.
+        :return: (masks, values) as returned by lionel.selector.fpl.formations.best_lineups.
+        """
+        return best_lineups(points, positions, cls.POS_CONSTRAINTS, 11)
+
+    def _solve_direct(self):
+        """Formation enumeration, when the problem is exactly the built-in one."""
+        if not self.exact or self.objective_func != self.default_objective:
+            return None
+        if self.custom_constraints != [self.constraint_xi_size, self.constraint_positions]:
+            return None
+        if any(var.lowBound not in (None, 0) or var.upBound not in (None, 1) for var in self.decision_vars):
+            return None
+        points = self.candidate_df[self.pred_var].to_numpy(dtype=float)
+        if "position" not in self.candidate_df.columns or np.isnan(points).any():
+            return None
+        try:
+            mask, value = self.best_xi_batch(points, self.candidate_df["position"])
+        except ValueError:
+            # Unbounded positions or no feasible formation: leave it to the MILP
+            return None
+        return mask.astype(float), value
+
+    def _selection_flags(self, mask):
+        return {"xi": mask}
+
     def default_objective(self, candidate_df, decision_vars):
         """
         By default, maximize the sum of pred_var for selected players.
         """
-        return pulp.lpSum(decision_vars[i] * candidate_df.iloc[i][self.pred_var] for i in range(self.num_players))
+        return linear_expression(decision_vars, candidate_df[self.pred_var].to_numpy(dtype=float))
 
     def constraint_xi_size(self, candidate_df, decision_vars):
         """
         Enforces exactly 11 selected players.
         """
-        return pulp.lpSum(decision_vars) == 11
+        return CountConstraint(eq=11)(candidate_df, decision_vars)
 
     def constraint_positions(self, candidate_df, decision_vars):
         """
@@ -54,17 +105,22 @@ class XISelector(BaseSelector):
         if "position" not in candidate_df.columns:
             raise ValueError("'candidate_df' must have a 'position' column for XISelector constraints.")
 
-        constraints = []
-        for pos, (min_pos, max_pos) in self.POS_CONSTRAINTS.items():
-            pos_labels = candidate_df.index[candidate_df["position"] == pos].tolist()
-            pos_ints = [candidate_df.index.get_loc(lbl) for lbl in pos_labels]
+        return self._position_bounds(candidate_df, decision_vars)
 
-            constraints.append(pulp.lpSum([decision_vars[i] for i in pos_ints]) >= min_pos)
-            constraints.append(pulp.lpSum([decision_vars[i] for i in pos_ints]) <= max_pos)
-        return constraints
+    @classmethod
+    def position_bounds(cls) -> CountConstraint:
+        """Per-position bounds of POS_CONSTRAINTS as a CountConstraint."""
+        return CountConstraint(
+            by="position",
+            min={pos: low for pos, (low, _) in cls.POS_CONSTRAINTS.items()},
+            max={pos: high for pos, (_, high) in cls.POS_CONSTRAINTS.items()},
+        )
 
-    def select(self):
-        selected_subset = super().select()
+    def select(self, warm_start: bool = False):
+        selected_subset = super().select(warm_start=warm_start)
+        if self.pool is not None:
+            # A Selection with an 'xi' mask; the shared pool is not marked
+            return selected_subset
         # Mark columns
         self.candidate_df["xi"] = 0
         self.candidate_df.loc[selected_subset.index, "xi"] = 1
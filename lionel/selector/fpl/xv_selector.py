@@ -1,7 +1,15 @@
+import numpy as np
 import pandas as pd
 import pulp
 
 from ..core.base_selector import BaseSelector
+from ..core.constraints import CountConstraint, SumConstraint
+from ..core.expressions import linear_expression
+from ..core.pool import CandidatePool
+from ..core.pruning import dominated_mask
+from ..core.sensitivity import TOLERANCE
+from ..core.solvers import remove_constraints
+from .branch_and_bound import SolveLimitReached, solve_xv
 
 
 class XVSelector(BaseSelector):
@@ -13,6 +21,20 @@ class XVSelector(BaseSelector):
       - Position minimums (e.g. 2 GKs, 5 DEF, 5 MID, 3 FWD)
       - Exactly 1 captain (doubling predicted points)
       - Objective: maximize sum of (predicted_points) + an additional (predicted_points) for the captain
+
+    With `prune=True`, candidates that provably cannot be needed in an optimal squad
+    (see lionel.selector.core.pruning) are dropped before the problem is built.
+    `candidate_df` then holds the remaining candidates, `source_df` the full frame and
+    `n_pruned` the number removed; `select()` still marks and returns the full frame (or, for
+    a CandidatePool, masks over all of its rows).
+    Pruning assumes only the built-in constraints; custom constraints that single out
+    particular players may exclude the remaining optimum.
+
+    With `exact=True`, only the built-in objective and constraints and integer prices, `select()`
+    runs an in-process branch and bound (see lionel.selector.fpl.branch_and_bound) instead of
+    building and solving a MILP, falling back to the MILP if the search hits its limit. Bounds set
+    with `set_bounds` or `lock`/`ban` (players forced in or out) are respected. Where several squads
+    tie for the optimum, it may return a different one from the MILP.
     """
 
     # Example distribution. Adjust as needed.
@@ -24,27 +46,52 @@ class XVSelector(BaseSelector):
         candidate_df: pd.DataFrame,
         pred_var: str = "predicted_points",
         budget: float = 1000.0,
+        backend=None,
+        prune: bool = False,
+        exact: bool = False,
     ):
-        super().__init__(candidate_df)
         self.pred_var = pred_var
         self.budget = budget
+        self.exact = exact
 
         # Ensure candidate_df has needed columns
-        if self.pred_var not in self.candidate_df.columns:
+        if self.pred_var not in candidate_df.columns:
             raise ValueError(f"'{self.pred_var}' not found in candidate_df columns.")
-        if "price" not in self.candidate_df.columns:
+        if "price" not in candidate_df.columns:
             raise ValueError("'price' column is required for budget constraints.")
-        if "team" not in self.candidate_df.columns:
+        if "team" not in candidate_df.columns:
             raise ValueError("'team' column is required for max-team constraints.")
-        if "position" not in self.candidate_df.columns:
+        if "position" not in candidate_df.columns:
             raise ValueError("'position' column is required for position constraints.")
 
+        is_pool = isinstance(candidate_df, CandidatePool)
+        self.source_df = candidate_df.frame if is_pool else candidate_df
+        self.pruned_mask = np.zeros(len(candidate_df), dtype=bool)
+        if prune:
+            # Kept to restore candidates a ban leaves undominated (see _fix)
+            self._source_pool = candidate_df if is_pool else None
+            self._protected = self._protected_rows(candidate_df)
+            self.pruned_mask = self._dominated(candidate_df, self._protected)
+            if not is_pool:
+                # select() marks the full frame: mark the selector's own copy, never the caller's
+                self.source_df = candidate_df.copy()
+            candidate_df = candidate_df.take(np.flatnonzero(~self.pruned_mask))
+        self.n_pruned = int(self.pruned_mask.sum())
+
+        super().__init__(candidate_df, backend=backend)
+        if not self.n_pruned:
+            self.source_df = self.candidate_df
+
         # Create captain decision variables (one per row)
         self.captain_vars = [pulp.LpVariable(f"capt_{i}", cat=pulp.LpBinary) for i in range(self.num_players)]
 
         # Objective: sum( (x_i + c_i)*pred_var )
         self.set_objective_function(self._objective_with_captains)
 
+        # Grouped constraints are kept so their groups are computed once per frame (see SumConstraint)
+        self._position_counts = CountConstraint(by="position", eq=self.POS_CONSTRAINTS)
+        self._team_counts = CountConstraint(by="team", max=self.MAX_PER_TEAM)
+
         # Add constraints
         self.add_constraint(self._constraint_xv_size)
         self.add_constraint(self._constraint_budget)
@@ -53,76 +100,336 @@ class XVSelector(BaseSelector):
         self.add_constraint(self._constraint_exactly_one_captain)
         self.add_constraint(self._constraint_captain_must_be_selected)
 
+    def _cache_columns(self):
+        return [self.pred_var, "price", "team", "position"]
+
+    def _cache_params(self):
+        return {
+            **super()._cache_params(),
+            "budget": self.budget,
+            "positions": self.POS_CONSTRAINTS,
+            "exact": self.exact,
+            "max_per_team": self.MAX_PER_TEAM,
+        }
+
+    def _solution_variables(self):
+        return super()._solution_variables() + self.captain_vars
+
+    def _builtin_constraints(self) -> list:
+        """The constraints registered by the constructor."""
+        return [
+            self._constraint_xv_size,
+            self._constraint_budget,
+            self._constraint_positions,
+            self._constraint_max_team,
+            self._constraint_exactly_one_captain,
+            self._constraint_captain_must_be_selected,
+        ]
+
+    def _exact_problem(self) -> bool:
+        """Whether the problem is exactly the built-in one, as the in-process exact solvers assume."""
+        if not self.exact or self.objective_func != self._objective_with_captains:
+            return False
+        if self.custom_constraints != self._builtin_constraints():
+            return False
+        if any(var.lowBound not in (None, 0) or var.upBound not in (None, 1) for var in self.captain_vars):
+            return False
+        return not np.isnan(self.candidate_df[self.pred_var].to_numpy(dtype=float)).any()
+
+    def _solve_direct(self):
+        """Branch and bound on the squad, when the problem is exactly the built-in one."""
+        if not self._exact_problem():
+            return None
+        low = np.array([var.lowBound or 0 for var in self.decision_vars])
+        up = np.array([1 if var.upBound is None else var.upBound for var in self.decision_vars])
+        if not np.isin(low, (0, 1)).all() or not np.isin(up, (0, 1)).all():
+            return None
+        points = self.candidate_df[self.pred_var].to_numpy(dtype=float)
+        try:
+            result = solve_xv(
+                points,
+                self.candidate_df["price"].to_numpy(dtype=float),
+                self.candidate_df["position"],
+                self.candidate_df["team"],
+                self.budget,
+                self.POS_CONSTRAINTS,
+                self.MAX_PER_TEAM,
+                forced=np.where(low > 0, 1, np.where(up < 1, -1, 0)),
+            )
+        except (ValueError, SolveLimitReached):
+            # Fractional prices, unknown positions or a hard instance: leave it to the MILP
+            return None
+        if result is None:
+            # Infeasible: let the MILP report the status
+            return None
+        mask, captain, value = result
+        captains = np.zeros(self.num_players)
+        captains[captain] = 1
+        return np.concatenate([mask.astype(float), captains]), value
+
+    def _points_variables(self):
+        return [[x, c] for x, c in zip(self.decision_vars, self.captain_vars)]
+
+    def _selection_flags(self, mask):
+        return {"xv": mask, "captain": self._values(self.captain_vars) > 0.5}
+
+    def _source_rows(self, values):
+        if not self.n_pruned:
+            return values
+        # Pruned rows are never selected
+        full = np.zeros(len(self.pruned_mask), dtype=values.dtype)
+        full[~self.pruned_mask] = values
+        return full
+
+    def _protected_rows(self, candidate_df):
+        """Rows pruning must keep (boolean array aligned with candidate_df), or None."""
+        return None
+
+    def _dominated(self, candidate_df, protected):
+        """Candidates pruning can drop under the built-in constraints (see dominated_mask)."""
+        return dominated_mask(
+            candidate_df[self.pred_var],
+            candidate_df["price"],
+            candidate_df["position"],
+            candidate_df["team"],
+            self.POS_CONSTRAINTS,
+            self.MAX_PER_TEAM,
+            protected=protected,
+        )
+
+    def _fix(self, players, state):
+        """
+        With pruning, a pruned player can't be locked and banning or releasing one changes
+        nothing (it is never selected). A ban first restores the pruned players that are no
+        longer dominated without the banned ones.
+        """
+        if not self.n_pruned:
+            return super()._fix(players, state)
+        labels = pd.Index(np.atleast_1d(players))
+        pruned = labels.isin(self.source_df.index[self.pruned_mask])
+        if state == "lock" and pruned.any():
+            raise ValueError(
+                f"Cannot lock {labels[pruned].tolist()}: pruned as dominated. "
+                "Create the selector with prune=False to lock them."
+            )
+        if state == "ban":
+            self._restore_dominated(self.banned + labels.tolist())
+        super()._fix(labels[~pruned], state)
+
+    def _restore_dominated(self, banned):
+        """
+        Restores the pruned candidates that are not dominated once `banned` (index labels) can't
+        be selected, since a banned player may be what made another one dominated.
+        """
+        available = np.flatnonzero(~self.source_df.index.isin(banned))
+        protected = None if self._protected is None else self._protected[available]
+        # Banned players stay pruned
+        dominated = np.ones(len(self.pruned_mask), dtype=bool)
+        dominated[available] = self._dominated(self.source_df.iloc[available], protected)
+        if not (self.pruned_mask & ~dominated).any():
+            return
+        kept = np.flatnonzero(~self.pruned_mask)
+        self.pruned_mask &= dominated
+        self.n_pruned = int(self.pruned_mask.sum())
+        rows = np.flatnonzero(~self.pruned_mask)
+        if self.pool is not None:
+            self.pool = self._source_pool.take(rows)
+            self.candidate_df = self.pool.frame
+        else:
+            self.candidate_df = self.source_df.iloc[rows].copy()
+        self.num_players = len(rows)
+        self._remap_rows(np.searchsorted(rows, kept))
+        self._built = False
+
+    def _remap_rows(self, moved):
+        """
+        Moves the per-row state after candidates are restored: row k of the previous candidate_df
+        is row moved[k] now. Subclasses with more variables or arrays per row extend this.
+        """
+        self.decision_vars = _renumbered(self.decision_vars, moved, self.num_players, "x")
+        self.captain_vars = _renumbered(self.captain_vars, moved, self.num_players, "capt")
+        self._fixed = {int(moved[i]): state for i, state in self._fixed.items()}
+        self._free_bounds = {int(moved[i]): bounds for i, bounds in self._free_bounds.items()}
+        self._bound_history = [[(int(moved[i]), *rest) for i, *rest in step] for step in self._bound_history]
+
     def _objective_with_captains(self, candidate_df, decision_vars):
         """
         Maximize sum of predicted points + an extra predicted_points for the captain.
         i.e. (x_i + c_i)*predicted_points[i].
         """
-        return pulp.lpSum(
-            (decision_vars[i] + self.captain_vars[i]) * candidate_df.iloc[i][self.pred_var]
-            for i in range(self.num_players)
-        )
+        points = candidate_df[self.pred_var].to_numpy(dtype=float)
+        return linear_expression(decision_vars + self.captain_vars, np.concatenate([points, points]))
 
     def _constraint_xv_size(self, candidate_df, decision_vars):
         """Enforce exactly 15 selected players."""
-        return pulp.lpSum(decision_vars) == 15
+        return CountConstraint(eq=15, name="xv_size")(candidate_df, decision_vars)
 
     def _constraint_budget(self, candidate_df, decision_vars):
         """Total cost of selected players must not exceed the budget."""
-        return (
-            pulp.lpSum(decision_vars[i] * candidate_df.iloc[i]["price"] for i in range(self.num_players)) <= self.budget
-        )
+        return SumConstraint("price", max=self.budget, name="budget")(candidate_df, decision_vars)
 
     def _constraint_positions(self, candidate_df, decision_vars):
         """
         Enforce standard position requirements.
         Example: {'GK':2, 'DEF':5, 'MID':5, 'FWD':3}.
         """
-        constraints = []
-        for pos, required_count in self.POS_CONSTRAINTS.items():
-            # Get the integer-based positions for this 'pos'
-            idxs = candidate_df.index[candidate_df["position"] == pos].tolist()
-            # Convert index labels -> integer positions
-            int_positions = [candidate_df.index.get_loc(label) for label in idxs]
-            constraints.append(pulp.lpSum(decision_vars[j] for j in int_positions) == required_count)
-        return constraints
+        return self._position_counts(candidate_df, decision_vars)
 
     def _constraint_max_team(self, candidate_df, decision_vars):
         """
         Enforce no more than MAX_PER_TEAM players from the same club.
         """
-        constraints = []
-        unique_teams = candidate_df["team"].unique()
-        for team in unique_teams:
-            idxs = candidate_df.index[candidate_df["team"] == team].tolist()
-            int_positions = [candidate_df.index.get_loc(label) for label in idxs]
-            constraints.append(pulp.lpSum(decision_vars[j] for j in int_positions) <= self.MAX_PER_TEAM)
-        return constraints
+        return self._team_counts(candidate_df, decision_vars)
 
     def _constraint_exactly_one_captain(self, candidate_df, decision_vars):
         """Enforce exactly 1 captain among all selected players."""
-        return pulp.lpSum(self.captain_vars) == 1
+        return CountConstraint(eq=1)(candidate_df, self.captain_vars)
 
     def _constraint_captain_must_be_selected(self, candidate_df, decision_vars):
         """
         For each player i: x_i >= c_i
         (i.e. a player can't be captain if not in the team).
         """
-        constraints = []
-        for i in range(self.num_players):
-            constraints.append(decision_vars[i] - self.captain_vars[i] >= 0)
-        return constraints
+        return [
+            pulp.LpConstraint(pulp.LpAffineExpression([(x, 1), (c, -1)]), sense=pulp.LpConstraintGE, rhs=0)
+            for x, c in zip(decision_vars, self.captain_vars)
+        ]
+
+    def budget_range(self):
+        """
+        Budgets over which the current squad stays optimal: from its cost up to the cost of the
+        cheapest squad with a strictly higher objective (excluded; inf if there is none). The
+        upper end takes one re-solve of the built problem, minimizing cost subject to beating
+        the current objective. Solves first if needed; the current selection is unchanged.
+        :return: (lower, upper) budgets.
+        """
+        if self.objective_value is None or self.problem.status != pulp.LpStatusOptimal:
+            self.select()
+            if self.problem.status != pulp.LpStatusOptimal:
+                raise ValueError("budget_range needs an optimal selection.")
+        if not self._built:
+            self.build().status = pulp.LpStatusOptimal
+        prices = self.candidate_df["price"].to_numpy(dtype=float)
+        chosen = self._values(self.decision_vars) > 0.5
+        solution_vars = self._solution_variables()
+        solution, status, optimum = self._values(solution_vars), self.problem.status, self.objective_value
+
+        objective, budget = self.problem.objective, self.get_constraint("budget")
+        better = pulp.LpConstraint(objective.copy(), sense=pulp.LpConstraintGE, rhs=optimum + TOLERANCE, name="_better")
+        self.problem.addConstraint(better)
+        budget.changeRHS(prices.sum())
+        self.problem.setObjective(linear_expression(self.decision_vars, -prices))
+        try:
+            self.backend.solve(self.problem)
+            better_found = self.problem.status == pulp.LpStatusOptimal
+            upper = -pulp.value(self.problem.objective) if better_found else np.inf
+        finally:
+            remove_constraints(self.problem, ["_better"])
+            budget.changeRHS(self.budget)
+            self.problem.setObjective(objective)
+            for var, value in zip(solution_vars, solution.tolist()):
+                var.varValue = value
+            self.problem.status, self.objective_value = status, optimum
+        return float(prices[chosen].sum()), float(upper)
+
+    def budget_frontier(self, min_budget: float, max_budget: float, step: float = 1.0) -> pd.DataFrame:
+        """
+        Best objective at every budget in [min_budget, max_budget], as the breakpoints where it
+        increases. The budget is swept downwards in place: the squad optimal at budget b, of
+        cost c, stays optimal for every budget in [c, b], so those are skipped and the next
+        solve is at c - step. That is one solve per breakpoint (plus one per cheaper tied squad),
+        by branch and bound where XVSelector uses it, else by re-solving the built problem.
+        The budget is restored afterwards; call `select()` again for its selection.
+        :param step: Budget resolution. Prices must be multiples of it (e.g. 1 for prices in tenths).
+        :return: One row per breakpoint in increasing order, with 'budget' (from which the row
+                 holds, up to the next row's budget), 'objective', 'cost', 'squad' (list of
+                 candidate_df index labels) and 'captain'; empty if no squad fits max_budget.
+                 The number of solves is in `.attrs["solves"]`.
+        """
+        labels = self.candidate_df.index
+        prices = self.candidate_df["price"].to_numpy(dtype=float)
+        original, budget, solves = self.budget, float(max_budget), 0
+        rows = []
+        try:
+            while budget >= min_budget:
+                self.set_budget(budget)
+                self.select()
+                solves += 1
+                if self.problem.status != pulp.LpStatusOptimal:
+                    # Nothing fits this budget, nor any lower one
+                    break
+                squad = self._values(self.decision_vars) > 0.5
+                captain = np.flatnonzero(self._values(self.captain_vars) > 0.5)
+                cost = float(prices[squad].sum())
+                row = {
+                    "budget": max(cost, float(min_budget)),
+                    "objective": float(self.objective_value),
+                    "cost": cost,
+                    "squad": labels[squad].tolist(),
+                    "captain": labels[captain[0]] if len(captain) else None,
+                }
+                if rows and row["objective"] >= rows[-1]["objective"] - TOLERANCE:
+                    # A cheaper squad with the same objective: the breakpoint is lower
+                    rows[-1] = row
+                else:
+                    rows.append(row)
+                budget = cost - step
+        finally:
+            self.set_budget(original)
+        frontier = pd.DataFrame(rows[::-1], columns=["budget", "objective", "cost", "squad", "captain"])
+        frontier.attrs["solves"] = solves
+        return frontier
+
+    def set_budget(self, budget: float):
+        """Changes the budget; a built problem is updated in place."""
+        self.budget = budget
+        if self._built:
+            self.set_rhs("budget", budget)
+
+    def set_predictions(self, predictions):
+        """
+        Replaces the pred_var column and updates the objective of a built problem in place.
+        :param predictions: Array-like aligned with the rows of candidate_df.
+        """
+        if self.n_pruned:
+            raise ValueError("Pruning depends on the predictions; create a new selector instead.")
+        if self.pool is not None:
+            # The pool's frame is shared: switch to a pool with the new column instead of writing it
+            self.pool = self.pool.with_column(self.pred_var, np.asarray(predictions, dtype=float))
+            self.candidate_df = self.source_df = self.pool.frame
+        else:
+            self.candidate_df[self.pred_var] = np.asarray(predictions, dtype=float)
+        self.update_objective()
+
+    def set_initial_squad(self, squad, captain=None):
+        """
+        Sets the warm-start values used by `select(warm_start=True)`.
+        :param squad: Boolean/0-1 array-like aligned with candidate_df rows (e.g. an 'xv' column).
+        :param captain: Integer position of the captain. Defaults to the squad's highest pred_var.
+        """
+        squad = np.asarray(squad, dtype=float)
+        if captain is None:
+            points = self.candidate_df[self.pred_var].to_numpy(dtype=float)
+            captain = int(np.argmax(np.where(squad > 0, points, -np.inf)))
+        captains = np.zeros(self.num_players)
+        captains[captain] = 1
+        self.set_initial_values(squad)
+        self.set_initial_values(captains, self.captain_vars)
 
-    def select(self):
+    def select(self, warm_start: bool = False):
         """
         Solves the optimization problem and returns the chosen subset of candidate_df.
         Also sets 'xv'=1 for selected players, 'captain'=1 for the captain.
+        For a CandidatePool, returns a Selection with 'xv' and 'captain' masks instead.
+        :param warm_start: Start from the previous incumbent (see BaseSelector.select).
         """
-        selected_subset = super().select()  # This calls the base solve logic
-        selected_capt_idxs = [i for i in range(self.num_players) if pulp.value(self.captain_vars[i]) == 1]
+        selected_subset = super().select(warm_start=warm_start)  # This calls the base solve logic
+        if self.pool is not None:
+            return selected_subset
+        selected_capt_idxs = np.flatnonzero(self._values(self.captain_vars) > 0.5)
         captain_labels = self.candidate_df.index[selected_capt_idxs]
 
-        # Mark columns in the original candidate_df
+        # Mark columns in the selector's candidate_df (a copy of the caller's frame)
         self.candidate_df["xv"] = 0
         self.candidate_df.loc[selected_subset.index, "xv"] = 1
         self.candidate_df["captain"] = 0
@@ -134,4 +441,28 @@ class XVSelector(BaseSelector):
         # Note: Some rows in selected_df might not be captain
         self.selected_df.loc[captain_labels.intersection(self.selected_df.index), "captain"] = 1
 
+        if self.source_df is not self.candidate_df:
+            # Pruned: mark the full frame too (pruned rows are never selected)
+            self.source_df["xv"] = 0
+            self.source_df.loc[selected_subset.index, "xv"] = 1
+            self.source_df["captain"] = 0
+            self.source_df.loc[captain_labels, "captain"] = 1
+            return self.source_df
+
         return self.candidate_df
+
+
+def _renumbered(variables, moved, size: int, prefix: str) -> list:
+    """
+    Binary variables for `size` rows: variables[k] at row moved[k] and new variables at the
+    other rows, all named '{prefix}_{row}'.
+    """
+    rows = [None] * size
+    for var, i in zip(variables, moved.tolist()):
+        rows[i] = var
+    for i in range(size):
+        if rows[i] is None:
+            rows[i] = pulp.LpVariable(f"{prefix}_{i}", cat=pulp.LpBinary)
+        else:
+            rows[i].name = f"{prefix}_{i}"
+    return rows
@@ -32,3 +32,17 @@ def picks():
     with open(DATA_DIR / "my_team.json") as f:
         picks = json.load(f)["picks"]
     return picks
+
+
+@pytest.fixture
+def candidates_xv_df():
+    with open(DATA_DIR / "candidates_xv.json", "r") as f:
+        data = json.load(f)
+    return pd.DataFrame(data)
+
+
+@pytest.fixture
+def candidates_xi_df():
+    with open(DATA_DIR / "candidates_xi.json", "r") as f:
+        data = json.load(f)
+    return pd.DataFrame(data)
@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+import pulp
+import pytest
+
+from lionel.selector.fpl.xv_selector import XVSelector
+
+
+def _random_pool(seed, n_players=400, n_teams=20):
+    rng = np.random.default_rng(seed)
+    price = rng.integers(40, 131, size=n_players)
+    return pd.DataFrame(
+        {
+            "team": [f"team_{t}" for t in rng.integers(0, n_teams, size=n_players)],
+            "position": rng.choice(["GK", "DEF", "MID", "FWD"], size=n_players, p=[0.1, 0.35, 0.35, 0.2]),
+            "price": price,
+            "predicted_points": np.round(price / 20 + rng.normal(0, 1.5, size=n_players), 2),
+        }
+    )
+
+
+def _is_feasible(selection, budget=1000):
+    return (
+        len(selection) == 15
+        and selection["price"].sum() <= budget
+        and selection["team"].value_counts().max() <= XVSelector.MAX_PER_TEAM
+        and selection["position"].value_counts().to_dict() == XVSelector.POS_CONSTRAINTS
+    )
+
+
+@pytest.fixture(scope="module")
+def pool():
+    df = _random_pool(0)
+    selector = XVSelector(df.copy())
+    selector.select()
+    return df, selector.objective_value
+
+
+def test_rounding_backend(pool):
+    df, optimum = pool
+    selector = XVSelector(df.copy(), backend="round")
+    selected = selector.select()
+    stats = selector.stats
+
+    assert _is_feasible(selected[selected["xv"] == 1])
+    assert stats.status == pulp.LpStatusOptimal
+    assert stats.best_bound >= optimum - 1e-6 >= stats.objective - 2e-6
+    assert stats.gap == pytest.approx((stats.best_bound - stats.objective) / stats.objective)
+    if stats.gap > 1e-6:
+        assert selector.problem.sol_status == pulp.LpSolutionIntegerFeasible
+
+
+def test_highs_streams_incumbents(pool):
+    df, optimum = pool
+    selector = XVSelector(df.copy(), backend="highs")
+    seen = []
+    selector.set_incumbent_callback(lambda selection, objective, bound: seen.append((selection, objective, bound)))
+    selector.select()
+
+    objectives = [objective for _, objective, _ in seen]
+    assert objectives == sorted(objectives) and len(set(objectives)) == len(objectives)
+    assert objectives[-1] == pytest.approx(optimum)
+    assert all(_is_feasible(selection) for selection, _, _ in seen)
+    assert all(bound >= objective - 1e-6 for _, objective, bound in seen)
+
+
+@pytest.mark.parametrize("backend", ["cbc", "scipy", "highs"])
+def test_limits_report_bound(pool, backend):
+    df, optimum = pool
+    selector = XVSelector(df.copy(), backend=backend)
+    selector.set_solve_options(time_limit=0.05, gap_rel=0.05)
+    seen = []
+    selector.set_incumbent_callback(lambda selection, objective, bound: seen.append(objective))
+    selected = selector.select()
+    stats = selector.stats
+
+    assert (selector.backend.time_limit, selector.backend.gap_rel) == (0.05, 0.05)
+    assert stats.status == pulp.LpStatusOptimal
+    assert _is_feasible(selected[selected["xv"] == 1])
+    assert stats.objective <= optimum + 1e-6
+    assert stats.best_bound >= optimum - 1e-6
+    assert seen[-1] == pytest.approx(stats.objective)
+
+    selector.set_solve_options()
+    assert selector.backend.time_limit is None and selector.backend.gap_rel is None
+
+
+def test_exact_solve_reports_once(candidates_xv_df):
+    selector = XVSelector(candidates_xv_df.copy(), exact=True)
+    seen = []
+    selector.set_incumbent_callback(lambda selection, objective, bound: seen.append((len(selection), objective, bound)))
+    selector.select()
+
+    assert selector.stats.backend == "direct"
+    assert selector.stats.gap == 0 and selector.stats.best_bound == selector.objective_value
+    assert seen == [(15, selector.objective_value, selector.objective_value)]
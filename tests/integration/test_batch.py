@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from lionel.selector.core.batch import select_batch
+from lionel.selector.core.cache import MemoryCache
+from lionel.selector.core.pool import CandidatePool, Selection
+from lionel.selector.core.service import _run_selection
+from lionel.selector.core.solvers import CBCBackend
+from lionel.selector.fpl.squad_selector import SquadSelector
+from lionel.selector.fpl.xv_selector import XVSelector
+
+
+def _squad(result):
+    """(squad, captain) masks of a frame or pool selection."""
+    selection = result.selection
+    if isinstance(selection, Selection):
+        return selection.flags["xv"], selection.flags["captain"]
+    return selection["xv"].to_numpy() == 1, selection["captain"].to_numpy() == 1
+
+
+def test_concurrent_solves_match_serial(candidates_xv_df):
+    df = candidates_xv_df.copy()
+    columns = list(df.columns)
+    pool = CandidatePool.from_frame(df)
+    # Frames and a pool shared by every job, exact and MILP solves, repeated budgets for cache hits
+    jobs = [(df if k % 2 else pool, {"budget": 800 + 2 * (k % 100)}) for k in range(200)]
+    jobs += [(df if k % 2 else pool, {"budget": 850 + 10 * (k % 8), "exact": True}) for k in range(24)]
+    cache = MemoryCache()
+
+    serial = [_run_selection(XVSelector, candidate_df, kwargs, None) for candidate_df, kwargs in jobs]
+    threaded = select_batch(XVSelector, jobs, max_workers=16, setup=lambda selector: selector.set_cache(cache))
+
+    assert len(threaded) == len(jobs)
+    for (candidate_df, kwargs), expected, result in zip(jobs, serial, threaded):
+        assert result.objective == pytest.approx(expected.objective)
+        for got, want in zip(_squad(result), _squad(expected)):
+            assert np.array_equal(got, want), kwargs
+        squad = _squad(result)[0]
+        assert squad.sum() == 15 and df["price"].to_numpy()[squad].sum() <= kwargs["budget"]
+    assert 0 < len(cache) < len(jobs)
+    # Nothing was written to the shared frame or pool
+    assert list(df.columns) == columns and list(pool.frame.columns) == columns
+    assert df.equals(candidates_xv_df)
+
+
+@pytest.mark.parametrize("selector_cls", [XVSelector, SquadSelector])
+@pytest.mark.parametrize("prune", [False, True])
+def test_frame_not_modified(candidates_xv_df, selector_cls, prune):
+    df = candidates_xv_df.copy()
+    selected = selector_cls(df, budget=1000, prune=prune).select()
+    assert "xv" in selected.columns and selected is not df
+    assert df.equals(candidates_xv_df)
+
+    # Threads sharing one frame each mark their own copy
+    jobs = [(df, {"budget": budget, "prune": prune}) for budget in (900, 950, 1000, 900)]
+    results = select_batch(selector_cls, jobs, max_workers=4)
+    assert df.equals(candidates_xv_df) and list(df.columns) == list(candidates_xv_df.columns)
+    assert all(result.selection is not df and result.selection["xv"].sum() == 15 for result in results)
+    assert results[0].objective == pytest.approx(results[3].objective)
+
+
+def test_backend_instances_rejected(candidates_xv_df):
+    with pytest.raises(ValueError):
+        select_batch(XVSelector, [(candidates_xv_df, {"backend": CBCBackend()})])
+    assert select_batch(XVSelector, []) == []
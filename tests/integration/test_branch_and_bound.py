@@ -0,0 +1,95 @@
+import numpy as np
+import pandas as pd
+import pulp
+import pytest
+
+from lionel.selector.fpl.branch_and_bound import SolveLimitReached, solve_xv
+from lionel.selector.fpl.xv_selector import XVSelector
+
+
+def _random_pool(seed, n_players=300, n_teams=20):
+    rng = np.random.default_rng(seed)
+    price = rng.integers(40, 131, size=n_players)
+    return pd.DataFrame(
+        {
+            "player": [f"player_{i}" for i in range(n_players)],
+            "team": [f"team_{t}" for t in rng.integers(0, n_teams, size=n_players)],
+            "position": rng.choice(["GK", "DEF", "MID", "FWD"], size=n_players, p=[0.1, 0.35, 0.35, 0.2]),
+            "price": price,
+            "predicted_points": np.round(price / 20 + rng.gamma(2.0, 1.5, size=n_players), 1),
+        }
+    )
+
+
+def _check_squad(selector, budget):
+    df = selector.candidate_df
+    squad = df[df["xv"] == 1]
+    assert len(squad) == 15
+    assert squad["price"].sum() <= budget
+    assert squad["team"].value_counts().max() <= XVSelector.MAX_PER_TEAM
+    assert squad["position"].value_counts().to_dict() == XVSelector.POS_CONSTRAINTS
+    assert df["captain"].sum() == 1 and squad["captain"].sum() == 1
+    points = squad["predicted_points"].sum() + squad.loc[squad["captain"] == 1, "predicted_points"].sum()
+    assert points == pytest.approx(selector.objective_value)
+
+
+@pytest.mark.parametrize("seed, n_teams, budget", [(0, 20, 1000), (1, 20, 800), (2, 10, 900), (4, 5, 1000)])
+def test_matches_cbc(seed, n_teams, budget):
+    df = _random_pool(seed, n_teams=n_teams)
+    exact = XVSelector(df.copy(), budget=budget, exact=True)
+    exact.select()
+    cbc = XVSelector(df.copy(), budget=budget)
+    cbc.select()
+
+    assert exact.stats.backend == "direct"
+    assert exact.problem.status == pulp.LpStatusOptimal
+    assert exact.objective_value == pytest.approx(pulp.value(cbc.problem.objective))
+    _check_squad(exact, budget)
+
+
+def test_bounds_force_players(candidates_xv_df):
+    df = candidates_xv_df.copy()
+    results = []
+    for exact in (True, False):
+        selector = XVSelector(df.copy(), exact=exact)
+        selector.set_bounds([0, 2], lower=1)  # force in two low scorers
+        selector.set_bounds(1, upper=0)  # ban the best forward
+        selector.select()
+        assert selector.candidate_df["xv"].iloc[[0, 2]].tolist() == [1, 1]
+        assert selector.candidate_df["xv"].iloc[1] == 0
+        results.append(selector.objective_value)
+    assert results[0] == pytest.approx(results[1])
+
+
+def test_falls_back_to_milp(candidates_xv_df):
+    # Fractional prices can't be used by the dynamic program
+    df = candidates_xv_df.assign(price=candidates_xv_df["price"] / 10)
+    selector = XVSelector(df, budget=100, exact=True)
+    selector.select()
+    assert selector.stats.backend == "cbc"
+    assert selector.candidate_df["xv"].sum() == 15
+
+    # Custom constraints are only handled by the MILP
+    selector = XVSelector(candidates_xv_df.copy(), exact=True)
+    selector.add_constraint(lambda df, dvs: dvs[1] == 0)
+    selector.select()
+    assert selector.stats.backend == "cbc"
+
+
+def test_infeasible_budget(candidates_xv_df):
+    df = candidates_xv_df
+    args = (df["predicted_points"], df["price"], df["position"], df["team"], 100, XVSelector.POS_CONSTRAINTS, 3)
+    assert solve_xv(*args) is None
+
+    selector = XVSelector(df.copy(), budget=100, exact=True)
+    selector.select()
+    assert selector.problem.status == pulp.LpStatusInfeasible
+
+
+def test_solve_limit():
+    df = _random_pool(3, n_teams=5)
+    args = (df["predicted_points"], df["price"], df["position"], df["team"], 1000, XVSelector.POS_CONSTRAINTS, 3)
+    with pytest.raises(SolveLimitReached):
+        solve_xv(*args, max_solves=1)
+    with pytest.raises(ValueError):
+        solve_xv(df["predicted_points"], df["price"] + 0.5, *args[2:])
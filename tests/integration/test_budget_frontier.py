@@ -0,0 +1,47 @@
+import pytest
+
+from lionel.selector.fpl.xv_selector import XVSelector
+
+
+def _objective(df, budget, exact=True):
+    selector = XVSelector(df.copy(), budget=budget, exact=exact)
+    selector.select()
+    return selector.objective_value
+
+
+def test_frontier_matches_selects(candidates_xv_df):
+    df = candidates_xv_df
+    selector = XVSelector(df.copy(), budget=950, exact=True)
+    frontier = selector.budget_frontier(800, 1000)
+
+    assert selector.budget == 950
+    assert frontier["budget"].is_monotonic_increasing and frontier["objective"].is_monotonic_increasing
+    assert frontier.attrs["solves"] == len(frontier)
+    assert frontier["budget"].iloc[0] == 800
+    for budget in range(800, 1001, 3):
+        expected = frontier.loc[frontier["budget"] <= budget, "objective"].iloc[-1]
+        assert _objective(df, budget) == pytest.approx(expected)
+
+    for row in frontier.itertuples():
+        squad = df.loc[row.squad]
+        assert len(squad) == 15 and squad["price"].sum() == row.cost
+        assert row.objective == pytest.approx(squad["predicted_points"].sum() + df.loc[row.captain, "predicted_points"])
+
+
+def test_frontier_on_built_problem(candidates_xv_df):
+    df = candidates_xv_df
+    exact = XVSelector(df.copy(), exact=True).budget_frontier(850, 950)
+    selector = XVSelector(df.copy())
+    frontier = selector.budget_frontier(850, 950)
+
+    assert selector._built
+    assert frontier["objective"].tolist() == pytest.approx(exact["objective"].tolist())
+    assert frontier["budget"].tolist() == exact["budget"].tolist()
+
+
+def test_frontier_below_cheapest_squad(candidates_xv_df):
+    selector = XVSelector(candidates_xv_df.copy())
+    assert selector.budget_frontier(100, 200).empty
+    frontier = selector.budget_frontier(100, 800)
+    # Starts at the first budget a squad fits
+    assert frontier["budget"].iloc[0] == frontier["cost"].iloc[0] > 100
@@ -0,0 +1,82 @@
+import numpy as np
+import pandas as pd
+import pulp
+import pytest
+
+from lionel.selector.fpl.bulk_update import BulkUpdateXVSelector, update_squads
+from lionel.selector.fpl.update_xv_selector import UpdateXVSelector
+from lionel.selector.fpl.xv_selector import XVSelector
+
+N_USERS = 5
+
+
+@pytest.fixture
+def squads(candidates_xv_df):
+    """Valid squads picked with perturbed predictions, as row positions."""
+    rng = np.random.default_rng(0)
+    squads = []
+    for _ in range(N_USERS):
+        points = candidates_xv_df["predicted_points"] * rng.uniform(0.2, 1.8, len(candidates_xv_df))
+        selector = XVSelector(candidates_xv_df.assign(predicted_points=points))
+        selector.select()
+        squads.append(np.flatnonzero(selector.candidate_df["xv"] == 1))
+    return np.array(squads)
+
+
+def _update_one(df, squad, budget, max_transfers):
+    xv = np.zeros(len(df), dtype=int)
+    xv[squad] = 1
+    selector = UpdateXVSelector(df.assign(xv=xv), max_transfers=max_transfers, budget=budget)
+    selector.select()
+    return selector
+
+
+@pytest.mark.parametrize("n_workers", [1, 2])
+def test_matches_update_xv_selector(candidates_xv_df, squads, n_workers):
+    df = candidates_xv_df.set_index("player")
+    budgets = np.array([1000, 950, 1000, 900, 1000])
+    free_transfers = np.array([1, 2, 0, 3, 2])
+    recs = update_squads(df, squads, budgets, free_transfers, n_workers=n_workers)
+
+    assert list(recs.index) == list(range(N_USERS))
+    for u in range(N_USERS):
+        expected = _update_one(df, squads[u], budgets[u], free_transfers[u])
+        rec = recs.loc[u]
+        assert rec["status"] == "Optimal"
+        assert rec["objective"] == pytest.approx(expected.objective_value)
+        assert len(rec["transfers_in"]) == len(rec["transfers_out"]) <= free_transfers[u]
+
+        new = recs.attrs["squads"][u]
+        assert set(df.index[new]) == (set(df.index[squads[u]]) - set(rec["transfers_out"])) | set(rec["transfers_in"])
+        assert df["price"].iloc[new].sum() <= budgets[u]
+        assert rec["captain"] in df.index[new]
+    assert recs.loc[2, "transfers_in"] == []
+
+
+def test_infeasible_user(candidates_xv_df, squads):
+    recs = update_squads(candidates_xv_df, squads[:2], budgets=[1000, 100])
+    assert recs["status"].tolist() == ["Optimal", "Infeasible"]
+    assert recs.loc[1, "transfers_in"] == [] and pd.isna(recs.loc[1, "captain"])
+    assert (recs.attrs["squads"][1] == -1).all()
+
+
+def test_switching_squads_keeps_the_problem(candidates_xv_df, squads):
+    selector = BulkUpdateXVSelector(candidates_xv_df.copy())
+    selector.set_current_squad(squads[0], max_transfers=1)
+    selector.select()
+    problem = selector.problem
+
+    selector.set_current_squad(squads[1], max_transfers=2, budget=950)
+    selector.select(warm_start=True)
+    assert selector.problem is problem
+    assert selector.problem.status == pulp.LpStatusOptimal
+    assert selector.objective_value == pytest.approx(_update_one(candidates_xv_df, squads[1], 950, 2).objective_value)
+
+
+def test_validation(candidates_xv_df, squads):
+    with pytest.raises(ValueError):
+        update_squads(candidates_xv_df, squads[:, :14])
+    with pytest.raises(ValueError):
+        update_squads(candidates_xv_df, squads + len(candidates_xv_df))
+    with pytest.raises(ValueError):
+        update_squads(candidates_xv_df, squads, budgets=[1000, 1000])
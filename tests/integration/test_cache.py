@@ -0,0 +1,140 @@
+import numpy as np
+import pulp
+import pytest
+
+from lionel.selector.core.cache import DiskCache, MemoryCache, selection_key
+from lionel.selector.fpl.update_xv_selector import UpdateXVSelector
+from lionel.selector.fpl.xv_selector import XVSelector
+
+
+def _select(df, cache, **kwargs):
+    selector = XVSelector(df.copy(), **kwargs)
+    selector.set_cache(cache)
+    result = selector.select()
+    return selector, result
+
+
+@pytest.mark.parametrize("kind", ["memory", "disk"])
+def test_repeated_select_hits_cache(candidates_xv_df, tmp_path, kind):
+    cache = MemoryCache() if kind == "memory" else DiskCache(tmp_path)
+    first, first_df = _select(candidates_xv_df, cache)
+    second, second_df = _select(candidates_xv_df, cache)
+
+    assert not first.cache_hit and second.cache_hit
+    assert not second._built  # nothing was built or solved
+    assert second.problem.status == pulp.LpStatusOptimal
+    assert second.objective_value == pytest.approx(first.objective_value)
+    assert (second_df[["xv", "captain"]] == first_df[["xv", "captain"]]).all().all()
+    assert len(cache) == 1
+
+
+def test_key_tracks_inputs(candidates_xv_df):
+    base = XVSelector(candidates_xv_df.copy())
+    key = selection_key(base)
+    assert selection_key(XVSelector(candidates_xv_df.copy())) == key
+
+    # Columns the selector does not read do not matter
+    assert selection_key(XVSelector(candidates_xv_df.assign(note="x"))) == key
+
+    assert selection_key(XVSelector(candidates_xv_df.copy(), budget=900)) != key
+    changed = candidates_xv_df.copy()
+    changed.loc[0, "predicted_points"] += 1
+    assert selection_key(XVSelector(changed)) != key
+
+    bounded = XVSelector(candidates_xv_df.copy())
+    bounded.set_bounds([0], lower=1)
+    assert selection_key(bounded) != key
+
+    def with_limit(limit):
+        selector = XVSelector(candidates_xv_df.copy())
+        selector.add_constraint(lambda df, x: pulp.lpSum(x[:10]) <= limit)
+        return selection_key(selector)
+
+    assert with_limit(2) == with_limit(2)
+    assert with_limit(2) != with_limit(3) != key
+
+
+def test_key_tracks_bound_method_state(candidates_xv_df):
+    class Limit:
+        def __init__(self, limit):
+            self.limit = limit
+
+        def constraint(self, df, x):
+            return pulp.lpSum(x[:10]) <= self.limit
+
+    def with_limit(limit):
+        selector = XVSelector(candidates_xv_df.copy())
+        selector.add_constraint(Limit(limit).constraint)
+        return selection_key(selector)
+
+    assert with_limit(2) == with_limit(2)
+    assert with_limit(2) != with_limit(3)
+
+    class Capped(XVSelector):
+        def __init__(self, candidate_df, limit):
+            super().__init__(candidate_df)
+            self.limit = limit
+            self.add_constraint(self.constraint_limit)
+
+        def constraint_limit(self, df, x):
+            return pulp.lpSum(x[:10]) <= self.limit
+
+    # Its own methods may read any attribute, so the selector is not cached
+    selector = Capped(candidates_xv_df.copy(), 2)
+    assert selection_key(selector) is None
+    selector.set_cache(MemoryCache())
+    selector.select()
+    selector.select()
+    assert not selector.cache_hit and len(selector.cache) == 0
+
+
+def test_update_selector_key_uses_current_squad(candidates_xv_df):
+    df = candidates_xv_df.copy()
+    df["xv"] = 0
+    for pos, count in XVSelector.POS_CONSTRAINTS.items():
+        df.loc[df[df["position"] == pos].nsmallest(count, "price").index, "xv"] = 1
+    cache = MemoryCache()
+    selector = UpdateXVSelector(df.copy(), max_transfers=2)
+    selector.set_cache(cache)
+    selector.select()
+    # select() overwrote 'xv' with the new squad; the key still uses the squad it started from
+    selector.select()
+    assert selector.cache_hit
+
+    selector.set_max_transfers(3)
+    selector.select()
+    assert not selector.cache_hit
+
+
+def test_memory_cache_evicts_least_recently_used():
+    entry = {"values": np.zeros(100), "status": 1, "objective": 0.0}  # 864 bytes
+    cache = MemoryCache(max_bytes=2000)
+    cache.put("a", entry)
+    cache.put("b", entry)
+    cache.get("a")
+    cache.put("c", entry)
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    assert cache.size <= 2000
+
+
+def test_disk_cache_evicts_and_persists(tmp_path):
+    entry = {"values": np.arange(1000, dtype=float), "status": 1, "objective": 2.5}
+    cache = DiskCache(tmp_path, max_bytes=20_000)
+    for i in range(5):
+        cache.put(f"k{i}", entry)
+    assert len(cache) < 5
+    assert cache.get("k4") is not None
+
+    reopened = DiskCache(tmp_path)
+    stored = reopened.get("k4")
+    assert stored["objective"] == 2.5 and stored["status"] == 1
+    np.testing.assert_array_equal(stored["values"], entry["values"])
+
+
+def test_top_k_bypasses_cache(candidates_xv_df):
+    selector = XVSelector(candidates_xv_df.copy())
+    selector.set_cache(MemoryCache())
+    solutions = selector.select_top_k(3, min_distance=2)
+    assert len({tuple(s.index) for s in solutions}) == 3
+    assert len(selector.cache) == 0
@@ -0,0 +1,92 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from lionel.selector.core.pool import CandidatePool, Selection
+from lionel.selector.fpl.squad_selector import SquadSelector
+from lionel.selector.fpl.update_xv_selector import UpdateXVSelector
+from lionel.selector.fpl.xi_selector import XISelector
+from lionel.selector.fpl.xv_selector import XVSelector
+
+
+@pytest.fixture
+def pool(candidates_xv_df):
+    return CandidatePool.from_frame(candidates_xv_df)
+
+
+def test_pool_arrays(candidates_xv_df, pool):
+    assert len(pool) == len(candidates_xv_df)
+    assert (pool.ids == candidates_xv_df.index).all()
+    price = pool.values("price")
+    assert np.shares_memory(pool.frame["price"].to_numpy(), price)
+    with pytest.raises(ValueError):
+        price[0] = 0
+
+    codes, labels = pool.codes("team")
+    assert (labels[codes] == candidates_xv_df["team"].to_numpy()).all()
+    groups = pool.groups("position")
+    assert list(groups) == list(pd.unique(candidates_xv_df["position"]))
+    for label, positions in groups.items():
+        assert (positions == np.flatnonzero(candidates_xv_df["position"] == label)).all()
+
+    other = pool.with_column("predicted_points", np.zeros(len(pool)))
+    assert np.shares_memory(other.values("price"), price)
+    assert other.frame["predicted_points"].sum() == 0
+    assert pool.frame["predicted_points"].equals(candidates_xv_df["predicted_points"])
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"exact": True}, {"prune": True}])
+def test_xv_selection_matches_frame(candidates_xv_df, pool, kwargs):
+    columns = list(pool.columns)
+    frame = XVSelector(candidates_xv_df.copy(), budget=1000, **kwargs).select()
+    selection = XVSelector(pool, budget=1000, **kwargs).select()
+
+    assert isinstance(selection, Selection)
+    assert (selection.mask == (frame["xv"] == 1)).all() and (selection.flags["xv"] == selection.mask).all()
+    assert (selection.flags["captain"] == (frame["captain"] == 1)).all()
+    assert selection.objective == pytest.approx((frame["predicted_points"] * (frame["xv"] + frame["captain"])).sum())
+    # The shared pool is not marked
+    assert list(pool.frame.columns) == columns
+
+
+def test_selectors_share_pool(pool):
+    selectors = [XVSelector(pool, budget=budget) for budget in (900, 1000)]
+    assert all(selector.candidate_df is pool.frame for selector in selectors)
+    cheap, rich = (selector.select() for selector in selectors)
+    prices = pool.values("price")
+    assert prices[cheap.mask].sum() <= 900 and prices[rich.mask].sum() <= 1000
+    assert cheap.objective <= rich.objective
+
+    selectors[0].set_predictions(np.ones(len(pool)))
+    assert selectors[0].select().objective == pytest.approx(16)
+    assert selectors[1].candidate_df is pool.frame
+    assert (pool.values("predicted_points") != 1).any()
+
+
+def test_xi_and_squad_flags(candidates_xi_df, candidates_xv_df):
+    frame = XISelector(candidates_xi_df.copy()).select()
+    selection = XISelector(CandidatePool.from_frame(candidates_xi_df)).select()
+    assert (selection.flags["xi"] == (frame["xi"] == 1)).all()
+
+    frame = SquadSelector(candidates_xv_df.copy(), budget=1000).select()
+    selection = SquadSelector(CandidatePool.from_frame(candidates_xv_df), budget=1000).select()
+    for flag in ("xv", "captain", "xi", "bench"):
+        assert (selection.flags[flag] == frame[flag].to_numpy()).all(), flag
+
+
+def test_update_selector_and_analysis(candidates_xv_df):
+    df = XVSelector(candidates_xv_df, budget=900).select()
+    pool = CandidatePool.from_frame(df)
+
+    selector = UpdateXVSelector(pool, max_transfers=1, budget=1000)
+    selection = selector.select()
+    assert (selection.mask & (df["xv"] == 0).to_numpy()).sum() <= 1
+
+    # Analyses that shift points or add cuts leave the pool as it was
+    points = pool.frame["predicted_points"].copy()
+    sens = XVSelector(pool, budget=1000).sensitivity(positions=[0, 1])
+    assert sens["exact"].all()
+    top = XVSelector(pool, budget=1000).select_top_k(3, min_distance=2)
+    assert len(top) == 3 and all(isinstance(s, Selection) for s in top)
+    assert top[0].objective >= top[1].objective >= top[2].objective
+    assert pool.frame["predicted_points"].equals(points)
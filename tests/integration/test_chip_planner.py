@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from lionel.selector.fpl.chip_planner import ChipPlanner, lineup_points
+from lionel.selector.fpl.xi_selector import XISelector
+from lionel.selector.fpl.xv_selector import XVSelector
+
+GAMEWEEKS = ["gw1", "gw2", "gw3", "gw4", "gw5"]
+
+
+@pytest.fixture
+def season_df(candidates_xv_df):
+    """The candidate pool with a cheap squad in 'xv' and five gameweeks of predictions."""
+    df = candidates_xv_df.copy()
+    df["xv"] = 0
+    for pos, count in XVSelector.POS_CONSTRAINTS.items():
+        df.loc[df[df["position"] == pos].nsmallest(count, "price").index, "xv"] = 1
+    rng = np.random.default_rng(0)
+    for col in GAMEWEEKS:
+        df[col] = np.clip(df["predicted_points"] + rng.normal(0, 2, len(df)), 0, None)
+    return df
+
+
+def test_lineup_points_matches_xi_selector(candidates_xi_df):
+    rng = np.random.default_rng(1)
+    for _ in range(5):
+        df = candidates_xi_df.copy()
+        df["predicted_points"] = rng.normal(5, 2, len(df))
+        xi = XISelector(df).select()
+        starters = xi.loc[xi["xi"] == 1, "predicted_points"]
+
+        xi_points, captain, bench = lineup_points(df["predicted_points"], df["position"])
+        assert xi_points == pytest.approx(starters.sum())
+        assert captain == pytest.approx(starters.max())
+        assert bench == pytest.approx(df["predicted_points"].sum() - starters.sum())
+
+
+def test_plan_uses_each_chip_once(season_df):
+    planner = ChipPlanner(season_df, GAMEWEEKS, n_workers=1)
+    plan = planner.plan()
+
+    assert list(plan.index) == GAMEWEEKS
+    played = plan["chip"].dropna()
+    assert played.is_unique and set(played) <= {"wildcard", "free_hit", "bench_boost", "triple_captain"}
+    assert plan["points"].sum() == pytest.approx(planner.total_points)
+    assert (plan.loc[plan["chip"].notna(), "chip_gain"] >= -1e-9).all()
+    # More chips never lower the plan's value
+    no_chips = planner.plan([])
+    assert no_chips["chip"].isna().all()
+    assert no_chips["points"].sum() <= plan["points"].sum() + 1e-9
+
+
+def test_single_chip_goes_to_its_best_gameweek(season_df):
+    planner = ChipPlanner(season_df, GAMEWEEKS, n_workers=1)
+    for chip in ["bench_boost", "triple_captain", "free_hit"]:
+        plan = planner.plan([chip])
+        assert plan["chip"].dropna().tolist() == [chip]
+        assert plan["chip"].eq(chip).idxmax() == planner.chip_values[chip].idxmax()
+
+
+def test_parallel_matches_serial(season_df):
+    serial = ChipPlanner(season_df, GAMEWEEKS, n_workers=1).plan()
+    parallel = ChipPlanner(season_df, GAMEWEEKS, n_workers=2).plan()
+    pd.testing.assert_frame_equal(serial, parallel)
+
+
+def test_baseline_squads_are_chained(season_df):
+    planner = ChipPlanner(season_df, GAMEWEEKS, transfers_per_gw=1, n_workers=1)
+    planner.plan([])
+    squads = {anchor for _, anchor, _ in planner.squads if anchor is not None}
+    squads.discard(tuple(planner.current_xv.tolist()))
+    for (columns, anchor, max_transfers), squad in planner.squads.items():
+        if anchor is not None:
+            # One transfer per gameweek from the squad of the gameweek before
+            assert max_transfers == 1
+            assert (np.asarray(anchor) & ~squad).sum() <= 1
+    # Later gameweeks start from the squads solved for earlier ones
+    assert squads <= {tuple(squad.tolist()) for squad in planner.squads.values()}
+    assert squads
+
+
+def test_unknown_chip(season_df):
+    with pytest.raises(ValueError):
+        ChipPlanner(season_df, GAMEWEEKS, n_workers=1).plan(["park_the_bus"])
@@ -0,0 +1,107 @@
+import numpy as np
+import pandas as pd
+import pulp
+import pytest
+
+from lionel.selector.core import constraints
+from lionel.selector.core.base_selector import BaseSelector
+from lionel.selector.core.constraints import CountConstraint, ForceConstraint, SumConstraint
+from lionel.selector.core.expressions import group_positions, linear_expression
+from lionel.selector.fpl.xv_selector import XVSelector
+
+
+@pytest.fixture
+def pool():
+    return pd.DataFrame(
+        {
+            "team": ["a", "a", "a", "b", "b", "c"],
+            "position": ["GK", "DEF", "DEF", "MID", "FWD", "MID"],
+            "price": [40.0, 50.0, 60.0, 70.0, 80.0, 90.0],
+            "points": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+        },
+        index=["p0", "p1", "p2", "p3", "p4", "p5"],
+    )
+
+
+def _selector(pool, *constraints):
+    selector = BaseSelector(pool)
+    selector.set_objective_function(lambda df, x: linear_expression(x, df["points"].to_numpy()))
+    for constraint in constraints:
+        selector.add_constraint(constraint)
+    return selector
+
+
+def _selected(selector):
+    return sorted(selector.select().index)
+
+
+def test_group_rows_compile_to_positions(pool):
+    rows = CountConstraint(by="team", max=2, name="team").rows(pool)
+    assert [row.name for row in rows] == ["team_a", "team_b", "team_c"]
+    assert [row.positions.tolist() for row in rows] == [[0, 1, 2], [3, 4], [5]]
+    assert all(row.sense == pulp.LpConstraintLE and row.rhs == 2 for row in rows)
+
+    rows = SumConstraint("price", max=100, by="team", where=pool["position"] != "GK").rows(pool)
+    assert rows[0].positions.tolist() == [1, 2]
+    np.testing.assert_array_equal(rows[0].coefficients, [50.0, 60.0])
+
+
+def test_groups_computed_once_per_frame(pool, monkeypatch):
+    calls = []
+    monkeypatch.setattr(constraints, "group_positions", lambda values: calls.append(1) or group_positions(values))
+    bounds = CountConstraint(by="team", max=2)
+    first = [row.positions.tolist() for row in bounds.rows(pool)]
+    assert [row.positions.tolist() for row in bounds.rows(pool)] == first
+    assert len(calls) == 1
+
+    # The where mask is applied to the kept groups
+    rows = SumConstraint("price", max=100, by="team", where=pool["position"] != "GK").rows(pool)
+    assert [row.positions.tolist() for row in rows] == [[1, 2], [3, 4], [5]]
+
+    # Another frame is grouped again
+    bounds.rows(pool.iloc[::-1])
+    assert len(calls) == 3
+
+    selector = XVSelector(pool.assign(predicted_points=pool["points"]), budget=1000)
+    calls.clear()
+    selector.build()
+    selector.build()
+    assert len(calls) == 2  # position and team, on the first build only
+
+
+def test_dict_bounds(pool):
+    bounds = CountConstraint(by="position", min={"DEF": 1, "GK": 1, "FWD": 1}, max={"DEF": 2, "GK": 1}, name="pos")
+    rows = {row.name: row for row in bounds.rows(pool)}
+    # Equal bounds give one equality row, groups without bounds (MID) are left out
+    assert set(rows) == {"pos_DEF_min", "pos_DEF_max", "pos_GK", "pos_FWD"}
+    assert rows["pos_GK"].sense == pulp.LpConstraintEQ
+
+    rows = CountConstraint(by="position", eq={"GK": 1, "WING": 0}).rows(pool)
+    assert rows[1].positions.size == 0  # absent labels still get their row
+
+
+def test_constraints_in_selector(pool):
+    selector = _selector(pool, CountConstraint(eq=3), CountConstraint(by="team", max=1))
+    assert _selected(selector) == ["p2", "p4", "p5"]
+
+    selector = _selector(pool, SumConstraint("price", max=150, name="budget"))
+    assert _selected(selector) == ["p2", "p5"]
+    selector.set_rhs("budget", 230)
+    assert _selected(selector) == ["p2", "p4", "p5"]
+
+
+def test_force_constraint(pool):
+    selector = _selector(pool, CountConstraint(eq=2), ForceConstraint(include=["p0"], exclude=["p5"]))
+    assert _selected(selector) == ["p0", "p4"]
+
+    with pytest.raises(ValueError):
+        ForceConstraint(include=["missing"]).rows(pool)
+
+
+def test_invalid_bounds():
+    with pytest.raises(ValueError):
+        CountConstraint()
+    with pytest.raises(ValueError):
+        CountConstraint(eq=1, max=2)
+    with pytest.raises(ValueError):
+        CountConstraint(max={"a": 1})
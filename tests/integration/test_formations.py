@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+import pulp
+import pytest
+
+from lionel.selector.fpl.formations import best_lineups, formations
+from lionel.selector.fpl.xi_selector import XISelector
+
+
+def _squad(seed):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "position": ["GK"] * 2 + ["DEF"] * 5 + ["MID"] * 5 + ["FWD"] * 3,
+            "predicted_points": np.round(rng.gamma(2.0, 2.0, size=15) - 1, 1),
+        },
+        index=rng.permutation(100)[:15],
+    )
+
+
+def _xi(selector):
+    selector.select()
+    return selector.candidate_df["xi"].to_numpy()
+
+
+def test_formations():
+    counts = formations(XISelector.POS_CONSTRAINTS, 11)
+    assert len(counts) == 8
+    assert (counts.sum(axis=1) == 11).all()
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_exact_matches_milp(seed):
+    df = _squad(seed)
+    exact = XISelector(df.copy(), exact=True)
+    milp = XISelector(df.copy(), exact=False)
+    exact_xi, milp_xi = _xi(exact), _xi(milp)
+
+    assert exact.stats.backend == "direct" and not exact._built
+    assert milp.stats.backend == "cbc"
+    assert exact.problem.status == pulp.LpStatusOptimal
+    assert exact.objective_value == pytest.approx(milp.objective_value)
+    # Points are rounded, so ties are possible: compare selections only when the optimum is unique
+    if len(set(df["predicted_points"])) == len(df):
+        np.testing.assert_array_equal(exact_xi, milp_xi)
+
+
+def test_exact_matches_milp_on_fixture(candidates_xi_df):
+    exact, milp = XISelector(candidates_xi_df.copy(), exact=True), XISelector(candidates_xi_df.copy(), exact=False)
+    np.testing.assert_array_equal(_xi(exact), _xi(milp))
+    assert exact.objective_value == pytest.approx(milp.objective_value)
+
+
+def test_ties_match_milp_by_default():
+    # Every outfield player ties, so many XIs share the optimum
+    df = _squad(2).assign(predicted_points=[4.0, 3.0] + [2.0] * 13)
+    default, milp = XISelector(df.copy()), XISelector(df.copy(), exact=False)
+    exact = XISelector(df.copy(), exact=True)
+    np.testing.assert_array_equal(_xi(default), _xi(milp))
+    assert default.stats.backend == "cbc"
+    assert _xi(exact).sum() == 11 and exact.objective_value == pytest.approx(milp.objective_value)
+
+
+def test_falls_back_to_milp():
+    df = _squad(0)
+    constrained = XISelector(df.copy(), exact=True)
+    constrained.add_constraint(lambda candidate_df, x: x[0] + x[1] == 2)
+    _xi(constrained)
+    assert constrained.stats.backend == "cbc"
+
+    bounded = XISelector(df.copy(), exact=True)
+    bounded.set_bounds([2], upper=0)
+    assert _xi(bounded)[2] == 0 and bounded.stats.backend == "cbc"
+
+    no_keeper = XISelector(df[df["position"] != "GK"].copy())
+    no_keeper.select()
+    assert no_keeper.problem.status == pulp.LpStatusInfeasible
+
+
+def test_batch_matches_single():
+    df = _squad(1)
+    draws = np.random.default_rng(0).normal(3, 2, size=(200, 15))
+    masks, values = XISelector.best_xi_batch(draws, df["position"])
+
+    assert masks.shape == draws.shape and (masks.sum(axis=1) == 11).all()
+    np.testing.assert_allclose(values, (draws * masks).sum(axis=1))
+    for row in [0, 57, 199]:
+        mask, value = best_lineups(draws[row], df["position"], XISelector.POS_CONSTRAINTS, 11)
+        np.testing.assert_array_equal(mask, masks[row])
+        selector = XISelector(df.assign(predicted_points=draws[row]), exact=False)
+        selector.select()
+        assert value == pytest.approx(selector.objective_value)
+
+
+def test_unknown_position_raises():
+    with pytest.raises(ValueError):
+        best_lineups(np.ones(3), ["GK", "DEF", "COACH"], XISelector.POS_CONSTRAINTS, 11)
@@ -0,0 +1,87 @@
+import pulp
+import pytest
+
+from lionel.selector.core.cache import MemoryCache
+from lionel.selector.fpl.xi_selector import XISelector
+from lionel.selector.fpl.xv_selector import XVSelector
+
+
+def _squad(selector):
+    return set(selector.candidate_df.index[selector.candidate_df["xv"] == 1])
+
+
+@pytest.mark.parametrize("exact", [True, False])
+def test_lock_and_ban(candidates_xv_df, exact):
+    selector = XVSelector(candidates_xv_df.copy(), exact=exact)
+    selector.select()
+    first = _squad(selector)
+    outside = sorted(set(selector.candidate_df.index) - first)[:2]
+    inside = sorted(first)[0]
+
+    selector.lock(outside)
+    selector.ban(inside)
+    selector.select()
+    squad = _squad(selector)
+    assert set(outside) <= squad and inside not in squad
+    assert selector.locked == outside and selector.banned == [inside]
+
+    # Same answer as a fresh selector with the bounds set directly
+    fresh = XVSelector(candidates_xv_df.copy(), exact=exact)
+    fresh.set_bounds(fresh.candidate_df.index.get_indexer(outside), lower=1)
+    fresh.set_bounds(fresh.candidate_df.index.get_indexer([inside]), upper=0)
+    fresh.select()
+    assert selector.objective_value == pytest.approx(fresh.objective_value)
+
+
+def test_undo_and_release(candidates_xv_df):
+    selector = XVSelector(candidates_xv_df.copy())
+    selector.select()
+    first, optimum = _squad(selector), selector.objective_value
+    label = sorted(first)[0]
+
+    selector.ban(label)
+    selector.select()
+    assert label not in _squad(selector)
+    selector.lock(label)  # a lock replaces the ban
+    assert selector.locked == [label] and selector.banned == []
+    selector.undo()
+    assert selector.banned == [label]
+    selector.undo()
+    assert selector.banned == [] and selector.locked == []
+    var = selector.decision_vars[selector.candidate_df.index.get_loc(label)]
+    assert (var.lowBound, var.upBound) == (0, 1)
+    selector.select()
+    assert selector.objective_value == pytest.approx(optimum)
+
+    selector.ban(sorted(first)[:3])
+    selector.release()
+    assert selector.banned == []
+    selector.undo()
+    assert len(selector.banned) == 3
+    with pytest.raises(ValueError):
+        XVSelector(candidates_xv_df.copy()).undo()
+    with pytest.raises(KeyError):
+        selector.lock("no such player")
+
+
+def test_built_problem_is_not_rebuilt(candidates_xi_df):
+    selector = XISelector(candidates_xi_df.copy(), exact=False)
+    selector.select()
+    problem = selector.problem
+    label = selector.candidate_df.index[selector.candidate_df["xi"] == 1][0]
+    selector.ban(label)
+    selector.select()
+    assert selector.problem is problem
+    assert selector.candidate_df.loc[label, "xi"] == 0
+
+
+def test_undo_hits_cache(candidates_xv_df):
+    selector = XVSelector(candidates_xv_df.copy())
+    selector.set_cache(MemoryCache())
+    selector.select()
+    selector.ban(selector.candidate_df.index[selector.candidate_df["xv"] == 1][0])
+    selector.select()
+    assert not selector.cache_hit
+    selector.undo()
+    selector.select()
+    assert selector.cache_hit and selector.problem.status == pulp.LpStatusOptimal
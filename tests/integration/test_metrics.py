@@ -0,0 +1,78 @@
+import pulp
+import pytest
+
+from lionel.selector.core.cache import MemoryCache
+from lionel.selector.core.metrics import PHASES, add_metrics_hook, remove_metrics_hook
+from lionel.selector.core.solvers import problem_constraints
+from lionel.selector.fpl.xv_selector import XVSelector
+
+
+@pytest.mark.parametrize("backend", ["cbc", "scipy", "highs"])
+def test_select_records_stats(candidates_xv_df, backend):
+    selector = XVSelector(candidates_xv_df.copy(), backend=backend)
+    selector.select()
+    stats = selector.stats
+
+    assert stats.backend == backend
+    assert stats.status == pulp.LpStatusOptimal and stats.status_name == "Optimal"
+    assert stats.objective == pytest.approx(selector.objective_value)
+    assert not stats.cache_hit
+
+    # One decision and one captain variable per player
+    assert stats.num_variables == 2 * len(candidates_xv_df)
+    assert stats.num_constraints == len(problem_constraints(selector.problem))
+    assert stats.num_nonzeros > stats.num_variables
+
+    assert set(stats.timings) == set(PHASES) | {"total"}
+    assert all(stats.timings[phase] > 0 for phase in ("constraints", "write", "solve", "total"))
+    assert sum(stats.timings[phase] for phase in PHASES) <= stats.timings["total"]
+
+    assert stats.gap == pytest.approx(0, abs=1e-6)
+    assert stats.best_bound == pytest.approx(stats.objective, rel=1e-6)
+    assert stats.nodes is not None and stats.nodes >= 0
+
+
+def test_rebuilt_problem_has_no_constraints_time(candidates_xv_df):
+    selector = XVSelector(candidates_xv_df.copy())
+    selector.select()
+    selector.select()
+    assert selector.stats.timings["constraints"] == 0
+
+
+def test_metrics_hooks_called(candidates_xv_df):
+    seen = []
+
+    def hook(selector, stats):
+        seen.append(("global", stats))
+
+    add_metrics_hook(hook)
+    try:
+        selector = XVSelector(candidates_xv_df.copy())
+        selector.add_metrics_hook(lambda s, stats: seen.append(("selector", stats)))
+        selector.select()
+    finally:
+        remove_metrics_hook(hook)
+
+    assert [name for name, _ in seen] == ["global", "selector"]
+    assert all(stats is selector.stats for _, stats in seen)
+
+    XVSelector(candidates_xv_df.copy()).select()
+    assert len(seen) == 2
+
+
+def test_cache_hit_stats(candidates_xv_df):
+    cache = MemoryCache()
+    for _ in range(2):
+        selector = XVSelector(candidates_xv_df.copy())
+        selector.set_cache(cache)
+        selector.select()
+
+    stats = selector.stats
+    assert stats.cache_hit
+    assert stats.status == pulp.LpStatusOptimal
+    assert stats.objective == pytest.approx(selector.objective_value)
+    assert stats.nodes is None and stats.gap is None and stats.num_variables is None
+    assert stats.timings["solve"] == 0 and stats.timings["total"] > 0
+
+    exported = stats.as_dict()
+    assert exported["cache_hit"] and exported["time_solve"] == 0 and "timings" not in exported
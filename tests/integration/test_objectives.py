@@ -0,0 +1,110 @@
+from itertools import combinations
+
+import numpy as np
+import pandas as pd
+import pulp
+import pytest
+
+from lionel.selector.core.base_selector import BaseSelector
+from lionel.selector.core.constraints import CountConstraint
+from lionel.selector.core.objectives import CVaRObjective, DefaultObjective, MeanStdObjective, ThresholdObjective
+from lionel.selector.core.solvers import problem_constraints
+from lionel.selector.fpl.xv_selector import XVSelector
+
+PICK = 2
+
+
+@pytest.fixture
+def draws():
+    rng = np.random.default_rng(3)
+    means = np.array([5.0, 4.8, 4.5, 4.0, 3.0, 2.0])
+    spreads = np.array([6.0, 0.5, 3.0, 0.2, 1.0, 4.0])
+    noise = rng.standard_normal((6, 40))
+    noise = (noise - noise.mean(axis=1, keepdims=True)) / noise.std(axis=1, keepdims=True)
+    return means[:, None] + spreads[:, None] * noise
+
+
+@pytest.fixture
+def pool(draws):
+    return pd.DataFrame({"predicted_points": draws.mean(axis=1)}, index=[f"p{i}" for i in range(len(draws))])
+
+
+def _select(pool, objective):
+    selector = BaseSelector(pool.copy())
+    objective.apply(selector)
+    selector.add_constraint(CountConstraint(eq=PICK))
+    selected = selector.select()
+    assert selector.problem.status == pulp.LpStatusOptimal
+    return tuple(pool.index.get_indexer(selected.index)), selector.objective_value
+
+
+def _brute_force(draws, score):
+    """Best PICK-subset of players under `score(team points per draw)`."""
+    return max(combinations(range(len(draws)), PICK), key=lambda team: score(draws[list(team)].sum(axis=0)))
+
+
+def test_default_objective(pool):
+    team, objective = _select(pool, DefaultObjective())
+    assert team == (0, 1)
+    assert objective == pytest.approx(pool["predicted_points"].nlargest(PICK).sum())
+
+
+def test_mean_std(pool, draws):
+    assert _select(pool, MeanStdObjective(draws, risk_aversion=0))[0] == (0, 1)
+    # Penalizing spread swaps the volatile player 0 for the steady player 3
+    assert _select(pool, MeanStdObjective(draws, risk_aversion=1))[0] == (1, 3)
+
+
+@pytest.mark.parametrize("alpha", [0.1, 0.25, 1.0])
+def test_cvar_matches_brute_force(pool, draws, alpha):
+    def cvar(points):
+        worst = np.sort(points)[: int(round(alpha * len(points)))]
+        return worst.mean()
+
+    team, objective = _select(pool, CVaRObjective(draws, alpha=alpha))
+    best = _brute_force(draws, cvar)
+    assert objective == pytest.approx(cvar(draws[list(best)].sum(axis=0)))
+    assert cvar(draws[list(team)].sum(axis=0)) == pytest.approx(objective)
+
+
+def test_threshold_matches_brute_force(pool, draws):
+    def probability(points):
+        return (points >= 9).mean()
+
+    team, objective = _select(pool, ThresholdObjective(draws, threshold=9))
+    best = _brute_force(draws, probability)
+    assert objective == pytest.approx(probability(draws[list(best)].sum(axis=0)))
+    assert probability(draws[list(team)].sum(axis=0)) == pytest.approx(objective)
+
+
+def test_draws_are_subsampled(pool):
+    draws = np.random.default_rng(0).normal(size=(len(pool), 500))
+    objective = CVaRObjective(draws, max_draws=30)
+    assert objective.points.shape == (len(pool), 30)
+
+    selector = BaseSelector(pool.copy())
+    objective.apply(selector)
+    selector.build()
+    assert len(problem_constraints(selector.problem)) == 30
+
+
+def test_draws_frame_aligns_with_pruned_candidates(candidates_xv_df):
+    df = candidates_xv_df.copy()
+    frame = pd.DataFrame(np.repeat(df[["predicted_points"]].to_numpy(), 5, axis=1), index=df.index)
+
+    selector = XVSelector(df.copy(), prune=True)
+    MeanStdObjective(frame, risk_aversion=1).apply(selector)
+    selector.select()
+
+    # Identical draws have no spread, and apply() counts the captain twice, as the default objective does
+    assert selector.n_pruned > 0
+    assert selector.objective_value == pytest.approx(_default_xv(df))
+
+    with pytest.raises(ValueError):
+        MeanStdObjective(frame.to_numpy()).apply(XVSelector(df.copy(), prune=True)).build()
+
+
+def _default_xv(df):
+    selector = XVSelector(df.copy())
+    selector.select()
+    return selector.objective_value
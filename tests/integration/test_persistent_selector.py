@@ -0,0 +1,68 @@
+import numpy as np
+import pulp
+import pytest
+
+from lionel.selector.fpl.update_xv_selector import UpdateXVSelector
+from lionel.selector.fpl.xv_selector import XVSelector
+
+
+@pytest.fixture
+def squad_df(candidates_xv_df):
+    """The candidate pool with an existing (cheap) squad marked in 'xv'."""
+    df = candidates_xv_df.copy()
+    df["xv"] = 0
+    for pos, count in XVSelector.POS_CONSTRAINTS.items():
+        df.loc[df[df["position"] == pos].nsmallest(count, "price").index, "xv"] = 1
+    return df
+
+
+def _fresh_objective(df, **kwargs):
+    selector = UpdateXVSelector(df.copy(), **kwargs)
+    selector.select()
+    return selector.objective_value
+
+
+@pytest.mark.parametrize("backend", ["cbc", "highs"])
+def test_update_in_place_matches_fresh_build(squad_df, backend):
+    if backend == "highs":
+        pytest.importorskip("highspy")
+    rng = np.random.default_rng(0)
+    selector = UpdateXVSelector(squad_df.copy(), max_transfers=1, backend=backend)
+    selector.select(warm_start=True)
+    problem = selector.problem
+
+    for max_transfers in [1, 3]:
+        points = squad_df["predicted_points"].to_numpy() + rng.normal(0, 1, len(squad_df))
+        selector.set_predictions(points)
+        selector.set_max_transfers(max_transfers)
+        selector.select(warm_start=True)
+
+        assert selector.problem is problem  # nothing was rebuilt
+        expected_df = squad_df.assign(predicted_points=points)
+        assert pulp.value(selector.problem.objective) == pytest.approx(
+            _fresh_objective(expected_df, max_transfers=max_transfers)
+        )
+        new_players = (selector.candidate_df["xv"] == 1) & (selector.current_xv == 0)
+        assert new_players.sum() <= max_transfers
+
+
+def test_set_budget_in_place(candidates_xv_df):
+    selector = XVSelector(candidates_xv_df.copy(), budget=1000)
+    selector.select()
+    selector.set_budget(800)
+    selector.select(warm_start=True)
+
+    fresh = XVSelector(candidates_xv_df.copy(), budget=800)
+    fresh.select()
+    assert pulp.value(selector.problem.objective) == pytest.approx(pulp.value(fresh.problem.objective))
+    assert (selector.candidate_df["price"] * selector.candidate_df["xv"]).sum() <= 800
+
+
+def test_adding_constraint_rebuilds(candidates_xv_df):
+    selector = XVSelector(candidates_xv_df.copy())
+    selector.select()
+    problem = selector.problem
+    selector.add_constraint(lambda df, dvs: dvs[0] == 0)
+    selector.select()
+    assert selector.problem is not problem
+    assert selector.candidate_df["xv"].iloc[0] == 0
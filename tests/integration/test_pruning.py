@@ -0,0 +1,111 @@
+import numpy as np
+import pandas as pd
+import pulp
+import pytest
+
+from lionel.selector.core.pruning import dominated_mask
+from lionel.selector.fpl.squad_selector import SquadSelector
+from lionel.selector.fpl.update_xv_selector import UpdateXVSelector
+from lionel.selector.fpl.xv_selector import XVSelector
+
+
+def _random_pool(seed, n_players=120, n_teams=5):
+    rng = np.random.default_rng(seed)
+    price = rng.integers(40, 131, size=n_players)
+    return pd.DataFrame(
+        {
+            "player": [f"player_{i}" for i in range(n_players)],
+            "team": [f"team_{t}" for t in rng.integers(0, n_teams, size=n_players)],
+            "position": rng.choice(["GK", "DEF", "MID", "FWD"], size=n_players, p=[0.1, 0.35, 0.35, 0.2]),
+            "price": price,
+            # rounded so that ties in points are common
+            "predicted_points": np.round(price / 20 + rng.normal(0, 1.5, size=n_players)),
+        }
+    )
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_pruning_preserves_optimum(seed):
+    df = _random_pool(seed)
+    budget = [750, 1000][seed % 2]
+    full = XVSelector(df.copy(), budget=budget)
+    full.select()
+    pruned = XVSelector(df.copy(), budget=budget, prune=True)
+    result = pruned.select()
+
+    assert pruned.n_pruned > 0
+    assert len(pruned.candidate_df) == len(df) - pruned.n_pruned
+    assert pruned.objective_value == pytest.approx(full.objective_value)
+    # The full frame is marked and pruned rows are never selected
+    assert len(result) == len(df)
+    assert result["xv"].sum() == 15
+    assert result.loc[pruned.pruned_mask, "xv"].sum() == 0
+
+
+def test_team_cap_blocks_pruning():
+    # Four cheap, strong DEFs share one team, so only three can be picked:
+    # the weaker DEF from another team must survive even though it has four dominators.
+    df = pd.DataFrame(
+        {
+            "position": ["DEF"] * 5,
+            "team": ["a", "a", "a", "a", "b"],
+            "price": [40, 40, 40, 40, 50],
+            "predicted_points": [5.0, 5.0, 5.0, 5.0, 4.0],
+        }
+    )
+    mask = dominated_mask(df["predicted_points"], df["price"], df["position"], df["team"], {"DEF": 4}, 3)
+    assert not mask[4]
+
+
+def test_update_xv_pruning_keeps_squad(candidates_xv_df):
+    df = candidates_xv_df.copy()
+    df["xv"] = 0
+    for pos, count in XVSelector.POS_CONSTRAINTS.items():
+        df.loc[df[df["position"] == pos].nsmallest(count, "predicted_points").index, "xv"] = 1
+
+    full = UpdateXVSelector(df.copy(), max_transfers=2, budget=1200)
+    full.select()
+    pruned = UpdateXVSelector(df.copy(), max_transfers=2, budget=1200, prune=True)
+    pruned.select()
+
+    assert pruned.current_xv.sum() == 15
+    assert pruned.problem.status == pulp.LpStatusOptimal
+    assert pruned.objective_value == pytest.approx(full.objective_value)
+
+
+@pytest.mark.parametrize("selector_cls, exact", [(XVSelector, False), (XVSelector, True), (SquadSelector, False)])
+def test_ban_restores_dominated(selector_cls, exact):
+    df = _random_pool(0)
+    kwargs = {"exact": exact} if selector_cls is XVSelector else {}
+    pruned = selector_cls(df.copy(), budget=1000, prune=True, **kwargs)
+    pruned.select()
+    n_pruned = pruned.n_pruned
+    locked = pruned.candidate_df.index[pruned.candidate_df["xv"] == 1][0]
+    pruned.lock(locked)
+    # Ban the MIDs that dominated the pruned ones, leaving too few to fill the position
+    mids = pruned.candidate_df.index[(pruned.candidate_df["position"] == "MID")].drop(locked, errors="ignore")
+    banned = mids[: len(mids) - 3]
+    pruned.ban(banned)
+    result = pruned.select()
+
+    full = selector_cls(df.copy(), budget=1000, **kwargs)
+    full.lock(locked)
+    full.ban(banned)
+    full.select()
+
+    assert 0 < pruned.n_pruned < n_pruned
+    assert pruned.locked == [locked] and pruned.banned == banned.tolist()
+    assert pruned.objective_value == pytest.approx(full.objective_value)
+    assert len(result) == len(df) and result["xv"].sum() == 15
+    assert result.loc[banned, "xv"].sum() == 0 and result.loc[locked, "xv"] == 1
+
+
+def test_lock_pruned_player_raises():
+    df = _random_pool(0)
+    selector = XVSelector(df.copy(), prune=True)
+    player = df.index[selector.pruned_mask][0]
+    with pytest.raises(ValueError, match="pruned"):
+        selector.lock(player)
+    # Banning one changes nothing: it is never selected
+    selector.ban(player)
+    assert selector.banned == [] and selector.select()["xv"].sum() == 15
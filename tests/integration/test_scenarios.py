@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from lionel.selector.core.scenarios import solve_scenarios
+from lionel.selector.fpl.xi_selector import XISelector
+from lionel.selector.fpl.xv_selector import XVSelector
+
+
+@pytest.fixture
+def draws(candidates_xv_df):
+    rng = np.random.default_rng(0)
+    return candidates_xv_df["predicted_points"].to_numpy()[:, None] + rng.normal(0, 2, (len(candidates_xv_df), 50))
+
+
+def test_xv_scenarios_reproducible_across_workers(candidates_xv_df, draws):
+    serial = solve_scenarios(XVSelector, candidates_xv_df, draws, n_scenarios=6, n_workers=1, seed=3)
+    parallel = solve_scenarios(XVSelector, candidates_xv_df, draws, n_scenarios=6, n_workers=2, seed=3)
+
+    pd.testing.assert_frame_equal(serial, parallel)
+    assert serial.attrs["n_scenarios"] == 6
+    assert serial["selection_frequency"].sum() == pytest.approx(15)
+    assert serial["captain_frequency"].sum() == pytest.approx(1)
+    assert "predicted_points" not in serial.columns
+
+
+def test_xi_scenarios_every_draw(candidates_xi_df):
+    draws = np.tile(candidates_xi_df["predicted_points"].to_numpy()[:, None], (1, 3))
+    freq = solve_scenarios(XISelector, candidates_xi_df, draws, n_workers=1)
+
+    assert freq.attrs["n_scenarios"] == 3
+    assert sorted(freq[freq["selection_frequency"] == 1].player.tolist()) == [
+        "player_1",
+        "player_19",
+        "player_24",
+        "player_28",
+        "player_45",
+        "player_46",
+        "player_50",
+        "player_53",
+        "player_68",
+        "player_73",
+        "player_79",
+    ]
+
+
+def test_pruned_scenarios_match_unpruned(candidates_xv_df, draws):
+    full = solve_scenarios(XVSelector, candidates_xv_df, draws, n_scenarios=4, n_workers=1, seed=1)
+    pruned = solve_scenarios(XVSelector, candidates_xv_df, draws, n_scenarios=4, n_workers=1, seed=1, prune=True)
+
+    assert len(pruned) == len(candidates_xv_df)
+    assert pruned["selection_frequency"].sum() == pytest.approx(15)
+    assert pruned["captain_frequency"].sum() == pytest.approx(1)
+    # Draws are continuous, so each scenario's optimum is unique
+    pd.testing.assert_frame_equal(full, pruned)
+
+
+def test_draws_shape_checked(candidates_xv_df):
+    with pytest.raises(ValueError):
+        solve_scenarios(XVSelector, candidates_xv_df, np.zeros((3, 10)), n_workers=1)
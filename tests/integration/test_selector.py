@@ -1,9 +1,6 @@
-import json
 import random
 
 import numpy as np
-import pandas as pd
-import pytest
 
 from lionel.selector.fpl.xi_selector import XISelector
 from lionel.selector.fpl.xv_selector import XVSelector
@@ -12,20 +9,6 @@ from lionel.utils import setup_logger
 logger = setup_logger(__name__)
 
 
-@pytest.fixture
-def candidates_xv_df():
-    with open("tests/data/candidates_xv.json", "r") as f:
-        data = json.load(f)
-    return pd.DataFrame(data)
-
-
-@pytest.fixture
-def candidates_xi_df():
-    with open("tests/data/candidates_xi.json", "r") as f:
-        data = json.load(f)
-    return pd.DataFrame(data)
-
-
 def test_xv_selector(candidates_xv_df, candidates_xi_df):
     """Make sure that it makes consistent selections"""
 
@@ -0,0 +1,83 @@
+import numpy as np
+import pulp
+import pytest
+
+from lionel.selector.fpl.xi_selector import XISelector
+from lionel.selector.fpl.xv_selector import XVSelector
+
+
+def _noisy(df, seed=0):
+    # Break ties so thresholds are unique
+    rng = np.random.default_rng(seed)
+    return df.assign(predicted_points=df["predicted_points"] + rng.uniform(0, 0.01, size=len(df)))
+
+
+def _squad(df, position, points, **kwargs):
+    df = df.copy()
+    df.iloc[position, df.columns.get_loc("predicted_points")] = points
+    selector = XVSelector(df, **kwargs)
+    selector.select()
+    return selector.candidate_df["xv"].to_numpy()
+
+
+@pytest.mark.parametrize("exact", [True, False])
+def test_thresholds_match_resolves(candidates_xv_df, exact):
+    df = _noisy(candidates_xv_df)
+    selector = XVSelector(df.copy(), exact=exact)
+    selector.select()
+    before = selector.candidate_df["xv"].to_numpy().copy()
+    sens = selector.sensitivity()
+
+    assert (sens["selected"].to_numpy() == (before == 1)).all()
+    assert (selector.candidate_df["xv"].to_numpy() == before).all()
+    assert selector.problem.status == pulp.LpStatusOptimal
+    for i in [0, 1, 5, 20, 40]:
+        row = sens.iloc[i]
+        if not np.isfinite(row["change"]):
+            continue
+        step = 1e-4 if row["change"] > 0 else -1e-4
+        assert (_squad(df, i, row["threshold"] - step, exact=exact) == before).all()
+        assert (_squad(df, i, row["threshold"] + step, exact=exact) != before).any()
+
+
+def test_within_reports_bounds(candidates_xv_df):
+    selector = XVSelector(_noisy(candidates_xv_df))
+    full = selector.sensitivity()
+    screened = selector.sensitivity(within=1)
+
+    assert not screened["exact"].all()
+    assert screened["solves"].sum() < full["solves"].sum()
+    assert (screened.loc[screened["exact"], "change"] == full.loc[screened["exact"], "change"]).all()
+    # Screened changes are lower bounds on their size
+    rest = ~screened["exact"]
+    assert (screened.loc[rest, "change"].abs() > 1).all()
+    assert (screened.loc[rest, "change"].abs() <= full.loc[rest, "change"].abs() + 1e-6).all()
+
+
+def test_xi_sensitivity(candidates_xi_df):
+    df = _noisy(candidates_xi_df)
+    selector = XISelector(df.copy())
+    sens = selector.sensitivity(positions=[0, 1, 2])
+
+    assert len(sens) == 3 and sens["exact"].all()
+    for i, row in enumerate(sens.itertuples()):
+        shifted = df.copy()
+        shifted.iloc[i, shifted.columns.get_loc("predicted_points")] = row.threshold + np.sign(row.change) * 1e-4
+        other = XISelector(shifted)
+        other.select()
+        assert other.candidate_df["xi"].iloc[i] != int(row.selected)
+
+
+def test_budget_range(candidates_xv_df):
+    df = candidates_xv_df
+    selector = XVSelector(df.copy(), budget=900)
+    selector.select()
+    optimum = selector.objective_value
+    lower, upper = selector.budget_range()
+
+    assert lower == selector.candidate_df.loc[selector.candidate_df["xv"] == 1, "price"].sum()
+    assert selector.objective_value == optimum
+    for budget, better in ((lower, False), (upper - 1, False), (upper, True)):
+        other = XVSelector(df.copy(), budget=budget)
+        other.select()
+        assert (other.objective_value > optimum + 1e-6) == better
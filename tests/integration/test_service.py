@@ -0,0 +1,93 @@
+import asyncio
+import threading
+
+import pytest
+
+from lionel.selector.core.service import QueueFull, SelectionService
+from lionel.selector.fpl.xi_selector import XISelector
+from lionel.selector.fpl.xv_selector import XVSelector
+
+
+def _ban_first(selector):
+    selector.set_bounds(0, upper=0)
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_select_matches_direct(candidates_xv_df, executor):
+    expected = XVSelector(candidates_xv_df.copy())
+    expected.select()
+
+    async def main():
+        async with SelectionService(max_workers=2, executor=executor) as service:
+            results = await asyncio.gather(
+                *(service.select(XVSelector, candidates_xv_df.copy()) for _ in range(4)),
+                service.select(XVSelector, candidates_xv_df.copy(), setup=_ban_first),
+            )
+            return results, service.metrics()
+
+    results, metrics = asyncio.run(main())
+    for result in results[:4]:
+        assert result.objective == pytest.approx(expected.objective_value)
+        assert result.selection["xv"].sum() == 15
+        assert result.stats.objective == pytest.approx(result.objective)
+    assert results[4].selection["xv"].iloc[0] == 0
+    assert metrics["submitted"] == metrics["completed"] == 5
+    assert metrics["queue_depth"] == metrics["running"] == 0
+    assert 0 <= metrics["wait_p50"] <= metrics["latency_p50"] <= metrics["latency_p99"]
+
+
+def test_backpressure_and_timeouts():
+    release = threading.Event()
+
+    async def main():
+        service = SelectionService(max_workers=1, max_queue=1, block=False)
+        # One job runs, one waits in the queue; a third is rejected
+        jobs = [asyncio.create_task(service.run(release.wait)) for _ in range(2)]
+        await asyncio.sleep(0.05)
+        assert (service.running, service.queue_depth) == (1, 1)
+        with pytest.raises(QueueFull):
+            await service.run(release.wait)
+
+        release.set()
+        await asyncio.gather(*jobs)
+
+        # A job that outlives its timeout raises, and its slot is freed once it ends
+        release.clear()
+        with pytest.raises(TimeoutError):
+            await service.run(release.wait, timeout=0.05)
+        release.set()
+        await asyncio.sleep(0.05)
+        assert await service.run(sum, [1, 2]) == 3
+        service.close()
+        return service.metrics()
+
+    metrics = asyncio.run(main())
+    assert metrics["rejected"] == 1
+    assert metrics["timed_out"] == 1
+    assert metrics["completed"] == 3
+    assert metrics["queue_depth"] == 0
+
+
+def test_blocking_service_waits_for_a_slot(candidates_xi_df):
+    async def main():
+        service = SelectionService(max_workers=1, max_queue=0)
+        results = await asyncio.gather(*(service.select(XISelector, candidates_xi_df.copy()) for _ in range(3)))
+        service.close()
+        return results, service.metrics()
+
+    results, metrics = asyncio.run(main())
+    assert all(result.selection["xi"].sum() == 11 for result in results)
+    assert metrics["completed"] == 3 and metrics["rejected"] == 0
+
+
+def test_failures_are_counted():
+    async def main():
+        service = SelectionService(max_workers=1)
+        with pytest.raises(ZeroDivisionError):
+            await service.run(divmod, 1, 0)
+        service.close()
+        return service.metrics()
+
+    metrics = asyncio.run(main())
+    assert metrics["failed"] == 1 and metrics["completed"] == 0
+    assert metrics["latency_p50"] is None
@@ -0,0 +1,86 @@
+import sys
+
+import pulp
+import pytest
+
+from lionel.selector.core.solvers import (
+    CBCBackend,
+    HighsBackend,
+    MatrixProblem,
+    ScipyBackend,
+    get_backend,
+    problem_constraints,
+)
+from lionel.selector.fpl.xi_selector import XISelector
+from lionel.selector.fpl.xv_selector import XVSelector
+
+
+def _objective(selector):
+    return pulp.value(selector.problem.objective)
+
+
+@pytest.mark.parametrize("backend", ["scipy", "highs"])
+def test_in_process_backends_match_cbc(candidates_xv_df, backend):
+    pytest.importorskip("scipy" if backend == "scipy" else "highspy")
+
+    cbc = XVSelector(candidates_xv_df.copy())
+    cbc.select()
+
+    other = XVSelector(candidates_xv_df.copy(), backend=backend)
+    other.select()
+
+    assert other.problem.status == pulp.LpStatusOptimal
+    assert _objective(other) == pytest.approx(_objective(cbc))
+    assert other.candidate_df["xv"].sum() == 15
+    assert other.candidate_df["captain"].sum() == 1
+
+
+def test_xi_selector_scipy_backend(candidates_xi_df):
+    pytest.importorskip("scipy")
+    xi = XISelector(candidates_xi_df, backend="scipy", exact=False)
+    xi.select()
+    assert sorted(xi.candidate_df[xi.candidate_df["xi"] == 1].player.tolist()) == [
+        "player_1",
+        "player_19",
+        "player_24",
+        "player_28",
+        "player_45",
+        "player_46",
+        "player_50",
+        "player_53",
+        "player_68",
+        "player_73",
+        "player_79",
+    ]
+
+
+def test_matrix_problem_round_trip(candidates_xv_df):
+    pytest.importorskip("scipy")
+    selector = XVSelector(candidates_xv_df)
+    matrix = MatrixProblem.from_pulp(selector.build())
+
+    assert matrix.num_vars == 2 * len(candidates_xv_df)
+    assert matrix.num_rows == len(problem_constraints(selector.problem))
+    assert matrix.A.shape == (matrix.num_rows, matrix.num_vars)
+
+    cbc = CBCBackend().solve_matrix(matrix)
+    highs = ScipyBackend().solve_matrix(matrix)
+    assert cbc.status == highs.status == pulp.LpStatusOptimal
+    assert cbc.objective == pytest.approx(highs.objective)
+
+
+def test_get_backend():
+    assert isinstance(get_backend(None), CBCBackend)
+    assert isinstance(get_backend("highs"), HighsBackend)
+    with pytest.raises(ValueError):
+        get_backend("gurobi")
+
+
+@pytest.mark.parametrize(
+    "backend, module, extra", [("highs", "highspy", "highs"), ("scipy", "scipy.optimize", "scipy")]
+)
+def test_missing_package_names_extra(candidates_xv_df, monkeypatch, backend, module, extra):
+    # A None entry in sys.modules makes the import fail as if the package were not installed
+    monkeypatch.setitem(sys.modules, module, None)
+    with pytest.raises(ImportError, match=rf"lionel\[{extra}\]"):
+        XVSelector(candidates_xv_df.copy(), backend=backend).select()
@@ -0,0 +1,64 @@
+import pulp
+import pytest
+
+from lionel.selector.fpl.squad_selector import SquadSelector
+from lionel.selector.fpl.xi_selector import XISelector
+from lionel.selector.fpl.xv_selector import XVSelector
+
+
+def test_squad_selector_flags(candidates_xv_df):
+    selector = SquadSelector(candidates_xv_df.copy())
+    df = selector.select()
+    assert selector.problem.status == pulp.LpStatusOptimal
+
+    xv, xi = df[df["xv"] == 1], df[df["xi"] == 1]
+    assert len(xv) == 15 and len(xi) == 11
+    assert (df.loc[df["xi"] == 1, "xv"] == 1).all()
+    assert df.loc[df["captain"] == 1, "xi"].tolist() == [1]
+    for pos, (min_pos, max_pos) in XISelector.POS_CONSTRAINTS.items():
+        assert min_pos <= (xi["position"] == pos).sum() <= max_pos
+
+    bench = xv[xv["xi"] == 0].sort_values("bench")
+    assert bench["bench"].tolist() == [1, 2, 3, 4]
+    assert bench["position"].iloc[0] == "GK"
+    assert (df.loc[df["xv"] == 0, "bench"] == 0).all()
+    # With decreasing outfield weights the best substitute comes first
+    outfield = bench["predicted_points"].iloc[1:].tolist()
+    assert outfield == sorted(outfield, reverse=True)
+
+
+def test_joint_beats_sequential(candidates_xv_df):
+    weights = (0.05, 0.3, 0.15, 0.05)
+    joint = SquadSelector(candidates_xv_df.copy(), bench_weights=weights)
+    joint.select()
+
+    # Sequential: XVSelector, then XISelector on the 15, scored by the same objective
+    squad = XVSelector(candidates_xv_df.copy()).select()
+    xv = squad[squad["xv"] == 1].copy()
+    xi = XISelector(xv.copy()).select()
+    points = xi["predicted_points"]
+    starters, bench = points[xi["xi"] == 1], xi[xi["xi"] == 0]
+    bench_gk = bench.loc[bench["position"] == "GK", "predicted_points"].sum()
+    subs = sorted(bench.loc[bench["position"] != "GK", "predicted_points"], reverse=True)
+    sequential = starters.sum() + starters.max() + weights[0] * bench_gk
+    sequential += sum(w * p for w, p in zip(weights[1:], subs))
+
+    assert pulp.value(joint.problem.objective) >= sequential - 1e-6
+
+
+def test_pruned_squad_selector_matches(candidates_xv_df):
+    full = SquadSelector(candidates_xv_df.copy())
+    full.select()
+    pruned = SquadSelector(candidates_xv_df.copy(), prune=True)
+    df = pruned.select()
+    assert pruned.n_pruned > 0
+    assert len(df) == len(candidates_xv_df)
+    assert pulp.value(pruned.problem.objective) == pytest.approx(pulp.value(full.problem.objective))
+    assert sorted(df["bench"].tolist())[-4:] == [1, 2, 3, 4]
+
+
+def test_invalid_bench_weights(candidates_xv_df):
+    with pytest.raises(ValueError):
+        SquadSelector(candidates_xv_df, bench_weights=(0.1, 0.1))
+    with pytest.raises(ValueError):
+        SquadSelector(candidates_xv_df, bench_weights=(0.1, -0.1, 0.1, 0.1))
@@ -0,0 +1,64 @@
+from itertools import combinations
+
+import numpy as np
+import pandas as pd
+import pulp
+import pytest
+
+from lionel.selector.core.solvers import problem_constraints
+from lionel.selector.fpl.xi_selector import XISelector
+from lionel.selector.fpl.xv_selector import XVSelector
+
+
+def _brute_force_xi_objectives(df):
+    """Objective of every feasible XI, best first."""
+    points = df["predicted_points"].to_numpy()
+    positions = df["position"].to_numpy()
+    objectives = []
+    for xi in combinations(range(len(df)), 11):
+        counts = {pos: (positions[list(xi)] == pos).sum() for pos in XISelector.POS_CONSTRAINTS}
+        if all(lo <= counts[pos] <= hi for pos, (lo, hi) in XISelector.POS_CONSTRAINTS.items()):
+            objectives.append(points[list(xi)].sum())
+    return sorted(objectives, reverse=True)
+
+
+@pytest.mark.parametrize("backend", ["cbc", "highs"])
+def test_top_k_matches_enumeration(candidates_xi_df, backend):
+    if backend == "highs":
+        pytest.importorskip("highspy")
+    df = candidates_xi_df.copy()
+    df["predicted_points"] = np.random.default_rng(0).normal(5, 2, len(df))
+
+    selector = XISelector(df, backend=backend)
+    solutions = selector.select_top_k(8)
+    assert [s.attrs["objective"] for s in solutions] == pytest.approx(_brute_force_xi_objectives(df)[:8])
+    assert len({tuple(s.index) for s in solutions}) == 8
+
+
+def test_top_k_min_distance_and_cleanup(candidates_xv_df):
+    selector = XVSelector(candidates_xv_df.copy())
+    selector.select()
+    n_constraints = len(problem_constraints(selector.problem))
+    best = pulp.value(selector.problem.objective)
+
+    solutions = selector.select_top_k(4, min_distance=4)
+    assert len(solutions) == 4
+    objectives = [s.attrs["objective"] for s in solutions]
+    assert objectives[0] == pytest.approx(best)
+    assert objectives == sorted(objectives, reverse=True)
+    for a, b in combinations(solutions, 2):
+        assert len(a.index.symmetric_difference(b.index)) >= 4
+    assert all(s["captain"].sum() == 1 for s in solutions)
+
+    # Cuts are removed again: re-solving gives the optimum
+    assert len(problem_constraints(selector.problem)) == n_constraints
+    selector.select()
+    assert pulp.value(selector.problem.objective) == pytest.approx(best)
+
+
+def test_top_k_stops_when_exhausted(candidates_xi_df):
+    # A pool of exactly 11 valid players has a single feasible XI
+    counts = {"GK": 1, "DEF": 4, "MID": 4, "FWD": 2}
+    df = pd.concat([candidates_xi_df[candidates_xi_df["position"] == pos].head(n) for pos, n in counts.items()])
+    solutions = XISelector(df.copy()).select_top_k(3)
+    assert len(solutions) == 1
@@ -0,0 +1,129 @@
+from functools import partial
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+from lionel.selector.fpl import update_xv_selector
+from lionel.selector.fpl.transfer_moves import PairLimitReached, rank_moves
+from lionel.selector.fpl.update_xv_selector import UpdateXVSelector
+from lionel.selector.fpl.xv_selector import XVSelector
+
+
+@pytest.fixture
+def squad_df(candidates_xv_df):
+    """The candidate pool with a cheap existing squad marked in 'xv'."""
+    df = candidates_xv_df.copy()
+    df["xv"] = 0
+    for pos, count in XVSelector.POS_CONSTRAINTS.items():
+        df.loc[df[df["position"] == pos].nsmallest(count, "price").index, "xv"] = 1
+    return df
+
+
+def _brute_force(df, budget, max_transfers):
+    """Objectives of every feasible squad within max_transfers transfers, by checking each one."""
+    squad = np.flatnonzero(df["xv"] == 1)
+    outside = np.flatnonzero(df["xv"] == 0)
+    points, positions = df["predicted_points"].to_numpy(), df["position"].to_numpy()
+    objectives = []
+    for k in range(max_transfers + 1):
+        for out in combinations(squad, k):
+            for incoming in combinations(outside, k):
+                if sorted(positions[list(out)]) != sorted(positions[list(incoming)]):
+                    continue
+                new = np.union1d(np.setdiff1d(squad, out), np.array(incoming, dtype=int))
+                new_df = df.iloc[new]
+                if new_df["price"].sum() > budget or new_df["team"].value_counts().max() > 3:
+                    continue
+                objectives.append(points[new].sum() + points[new].max())
+    return np.sort(objectives)[::-1]
+
+
+@pytest.mark.parametrize("max_transfers", [1, 2])
+def test_matches_brute_force(squad_df, max_transfers):
+    # A smaller pool keeps brute force quick
+    df = squad_df[(squad_df["xv"] == 1) | (np.arange(len(squad_df)) % 3 == 0)]
+    budget = 850
+    moves = rank_moves(
+        df["predicted_points"],
+        df["price"],
+        df["position"],
+        df["team"],
+        np.flatnonzero(df["xv"] == 1),
+        budget,
+        max_transfers,
+    )
+    expected = _brute_force(df, budget, max_transfers)
+
+    assert len(moves) == len(expected)
+    assert moves["objective"].to_numpy() == pytest.approx(expected)
+    assert (moves["cost"] <= budget).all()
+    assert moves["transfers"].max() == max_transfers
+
+
+@pytest.mark.parametrize("max_transfers", [1, 2])
+def test_select_matches_milp(squad_df, max_transfers):
+    exact = UpdateXVSelector(squad_df.copy(), max_transfers=max_transfers, budget=900, exact=True)
+    exact.select()
+    milp = UpdateXVSelector(squad_df.copy(), max_transfers=max_transfers, budget=900)
+    milp.select()
+
+    assert exact.stats.backend == "direct"
+    assert exact.objective_value == pytest.approx(milp.objective_value)
+    new = exact.candidate_df
+    assert new["xv"].sum() == 15 and new.loc[new["captain"] == 1, "xv"].item() == 1
+    assert ((new["xv"] == 1) & (squad_df["xv"] == 0)).sum() <= max_transfers
+
+
+def test_rank_transfers(squad_df):
+    selector = UpdateXVSelector(squad_df.copy(), max_transfers=2, budget=900)
+    moves = selector.rank_transfers(top=20)
+
+    assert len(moves) == 20 and moves["objective"].is_monotonic_decreasing
+    best = moves.iloc[0]
+    selector.select()
+    assert best["objective"] == pytest.approx(selector.objective_value)
+    squad = set(squad_df.index[squad_df["xv"] == 1])
+    for row in moves.itertuples():
+        out = {label for label in (row.out_1, row.out_2) if label is not None and label == label}
+        incoming = {label for label in (row.in_1, row.in_2) if label is not None and label == label}
+        assert out <= squad and not incoming & squad and len(out) == len(incoming) == row.transfers
+
+    keep = selector.rank_transfers(max_transfers=0)
+    assert len(keep) == 1 and keep["gain"].item() == pytest.approx(0)
+    assert (moves["gain"] == moves["objective"] - keep["objective"].item()).all()
+    with pytest.raises(ValueError):
+        selector.rank_transfers(max_transfers=3)
+
+
+@pytest.mark.parametrize("top", [1, 25])
+def test_top_matches_full_ranking(squad_df, top):
+    args = (
+        squad_df["predicted_points"],
+        squad_df["price"],
+        squad_df["position"],
+        squad_df["team"],
+        np.flatnonzero(squad_df["xv"] == 1),
+        900,
+    )
+    full = rank_moves(*args, max_transfers=2)
+    best = rank_moves(*args, max_transfers=2, top=top)
+
+    assert len(best) == top
+    assert best["objective"].to_numpy() == pytest.approx(full["objective"].to_numpy()[:top])
+
+
+def test_pair_limit_falls_back_to_milp(squad_df, monkeypatch):
+    df = squad_df
+    squad = np.flatnonzero(df["xv"] == 1)
+    args = (df["predicted_points"], df["price"], df["position"], df["team"], squad, 900)
+    with pytest.raises(PairLimitReached):
+        rank_moves(*args, max_transfers=2, max_pairs=10)
+
+    monkeypatch.setattr(update_xv_selector, "rank_moves", partial(rank_moves, max_pairs=10))
+    selector = UpdateXVSelector(df.copy(), max_transfers=2, budget=900, exact=True)
+    selector.select()
+    milp = UpdateXVSelector(df.copy(), max_transfers=2, budget=900)
+    milp.select()
+    assert selector.stats.backend == "cbc"
+    assert selector.objective_value == pytest.approx(milp.objective_value)
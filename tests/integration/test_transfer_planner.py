@@ -0,0 +1,106 @@
+import numpy as np
+import pulp
+import pytest
+
+from lionel.selector.fpl.transfer_planner import TransferPlanner
+from lionel.selector.fpl.update_xv_selector import UpdateXVSelector
+from lionel.selector.fpl.xv_selector import XVSelector
+
+
+@pytest.fixture
+def horizon_df(candidates_xv_df):
+    """The candidate pool with a cheap squad in 'xv' and three gameweeks of predictions."""
+    df = candidates_xv_df.copy()
+    df["xv"] = 0
+    for pos, count in XVSelector.POS_CONSTRAINTS.items():
+        df.loc[df[df["position"] == pos].nsmallest(count, "price").index, "xv"] = 1
+    rng = np.random.default_rng(0)
+    for gw in range(1, 4):
+        df[f"points_gw{gw}"] = df["predicted_points"] + rng.normal(0, 1, len(df))
+    return df
+
+
+GAMEWEEKS = ["points_gw1", "points_gw2", "points_gw3"]
+
+
+def test_single_gameweek_matches_update_selector(horizon_df):
+    planner = TransferPlanner(horizon_df.copy(), pred_vars=["points_gw1"], free_transfers=2, max_transfers=2)
+    planner.select()
+
+    selector = UpdateXVSelector(horizon_df.copy(), max_transfers=2, pred_var="points_gw1")
+    selector.select()
+    assert pulp.value(planner.problem.objective) == pytest.approx(selector.objective_value)
+    assert planner.summary.loc["points_gw1", "hits"] == 0
+
+
+def test_plan_is_consistent(horizon_df):
+    planner = TransferPlanner(horizon_df.copy(), pred_vars=GAMEWEEKS, hit_cost=4, budget=1000)
+    planner.select()
+    assert planner.problem.status == pulp.LpStatusOptimal
+
+    df = planner.candidate_df
+    for gw in GAMEWEEKS:
+        squad = planner.squads[gw] == 1
+        assert squad.sum() == 15
+        assert (df.loc[squad, "price"]).sum() <= 1000
+        assert df.loc[squad, "team"].value_counts().max() <= 3
+        assert planner.captains[gw].sum() == 1
+        assert (planner.captains[gw] <= planner.squads[gw]).all()
+
+    # First gameweek is also marked in the UpdateXVSelector columns
+    assert (df["xv"] == planner.squads["points_gw1"]).all()
+    assert len(planner.transfers) == planner.summary["transfers"].sum()
+    # The reported plan value (hits charged by the game's rules) equals the solver's objective
+    assert planner.summary["predicted_points"].sum() == pytest.approx(pulp.value(planner.problem.objective))
+
+
+def test_free_transfers_are_banked(horizon_df):
+    planner = TransferPlanner(horizon_df.copy(), pred_vars=GAMEWEEKS, free_transfers=1, max_free_transfers=2)
+    planner.select()
+    free = planner.summary["free_transfers"].to_numpy()
+    transfers = planner.summary["transfers"].to_numpy()
+    for t in range(1, len(GAMEWEEKS)):
+        assert free[t] == min(free[t - 1] - min(transfers[t - 1], free[t - 1]) + 1, 2)
+
+
+def test_hits_reduce_transfers(horizon_df):
+    cheap = TransferPlanner(horizon_df.copy(), pred_vars=GAMEWEEKS, hit_cost=0)
+    cheap.select()
+    costly = TransferPlanner(horizon_df.copy(), pred_vars=GAMEWEEKS, hit_cost=100)
+    costly.select()
+    assert costly.summary["hits"].sum() == 0
+    assert costly.summary["transfers"].sum() <= cheap.summary["transfers"].sum()
+
+
+def test_missing_prediction_column(horizon_df):
+    with pytest.raises(ValueError):
+        TransferPlanner(horizon_df, pred_vars=["points_gw1", "points_gw9"])
+
+
+@pytest.mark.parametrize("free_transfers, max_free_transfers", [(1, 2), (2, 2), (0, 5)])
+def test_model_follows_transfer_rules(horizon_df, free_transfers, max_free_transfers):
+    planner = TransferPlanner(
+        horizon_df.copy(),
+        pred_vars=GAMEWEEKS,
+        free_transfers=free_transfers,
+        max_free_transfers=max_free_transfers,
+        hit_cost=1,
+    )
+    planner.select()
+    # The model's free transfers and hits are the game's (as recomputed in summary), not banked by hits
+    assert [round(var.value()) for var in planner.free_transfer_vars] == planner.summary["free_transfers"].tolist()
+    assert [round(var.value()) for var in planner.hit_vars] == planner.summary["hits"].tolist()
+
+
+def test_set_max_transfers_applies_to_every_gameweek(horizon_df):
+    planner = TransferPlanner(horizon_df.copy(), pred_vars=GAMEWEEKS, hit_cost=0, max_transfers=3)
+    planner.select()
+    assert planner.summary["transfers"].max() > 1
+
+    planner.set_max_transfers(1)
+    planner.select()
+    assert planner.summary["transfers"].max() <= 1
+
+    planner.set_max_transfers(None)
+    planner.select()
+    assert planner.summary["transfers"].max() > 1